@@ -0,0 +1,128 @@
+"""
+End-to-end Adaptive Core bridge throughput against the local stand-ins
+(no adaptive_core package needed).
+
+  1. threats/s through SentinelAdaptiveCoreBridge: one call per threat vs
+     submit_threats() batches, in-process and over the socket stand-in
+  2. backpressure: BatchingEventEmitter in front of a slow core, with the
+     resulting drop counters
+  3. outage: threats spooled while the core is down, then drained
+
+    python benchmarks/bench_adaptive_core_bridge.py [threats] [latency_ms]
+"""
+
+import sys
+import tempfile
+import time
+
+from sentinel_ai_v2.adaptive_bridge import build_adaptive_event
+from sentinel_ai_v2.adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from sentinel_ai_v2.adaptive_core_stub import (
+    AdaptiveCoreServer,
+    FakeAdaptiveCoreInterface,
+    RemoteAdaptiveCoreInterface,
+    StubThreatPacket,
+)
+from sentinel_ai_v2.adaptive_emitter import BatchingEventEmitter
+from sentinel_ai_v2.event_spool import EventSpool
+
+BATCH = 256
+
+
+def _threat(i: int) -> dict:
+    return {
+        "source_layer": "sentinel_ai_v2",
+        "threat_type": "reorg_pattern",
+        "severity": i % 10,
+        "description": "bench",
+        "block_height": 1_000_000 + i,
+        "metadata": {"score": (i % 100) / 100},
+    }
+
+
+def _throughput(bridge: SentinelAdaptiveCoreBridge, n: int, batched: bool) -> float:
+    t0 = time.perf_counter()
+    if batched:
+        for start in range(0, n, BATCH):
+            bridge.submit_threats(_threat(i) for i in range(start, min(n, start + BATCH)))
+    else:
+        for i in range(n):
+            bridge.submit_simple_threat(**_threat(i))
+    return n / (time.perf_counter() - t0)
+
+
+def bench_throughput(n: int, latency: float) -> None:
+    print(f"-- throughput ({n} threats, core latency {latency * 1000:.1f} ms/call)")
+    core = FakeAdaptiveCoreInterface(latency_seconds=latency, record=False)
+    bridge = SentinelAdaptiveCoreBridge(interface=core, packet_type=StubThreatPacket)
+    print(f"in-process  per-threat  {_throughput(bridge, n, False):10.0f} threats/s")
+    print(f"in-process  batched     {_throughput(bridge, n, True):10.0f} threats/s")
+
+    with AdaptiveCoreServer(core) as server, RemoteAdaptiveCoreInterface(server.address) as remote:
+        bridge = SentinelAdaptiveCoreBridge(interface=remote, packet_type=StubThreatPacket)
+        print(f"socket      per-threat  {_throughput(bridge, n, False):10.0f} threats/s")
+        print(f"socket      batched     {_throughput(bridge, n, True):10.0f} threats/s")
+
+
+def bench_backpressure(n: int, latency: float) -> None:
+    print(f"-- backpressure (emitter max_queue=1000, batch={BATCH})")
+    core = FakeAdaptiveCoreInterface(latency_seconds=max(latency, 0.005), record=False)
+    bridge = SentinelAdaptiveCoreBridge(interface=core, packet_type=StubThreatPacket)
+
+    def sink(events) -> None:
+        bridge.submit_threats(
+            {
+                "source_layer": e.layer,
+                "threat_type": e.anomaly_type,
+                "severity": int(round(e.severity * 10)),
+                "description": e.details or "",
+                "block_height": e.block_height,
+            }
+            for e in events
+        )
+
+    for policy in ("drop_oldest", "block"):
+        emitter = BatchingEventEmitter(sink, max_queue=1000, batch_size=BATCH, overflow=policy)
+        t0 = time.perf_counter()
+        for i in range(n):
+            emitter.emit(build_adaptive_event(anomaly_type="reorg_pattern", severity=0.5, block_height=i))
+        produce = time.perf_counter() - t0
+        emitter.close(timeout=60)
+        total = time.perf_counter() - t0
+        s = emitter.stats()
+        print(
+            f"{policy:12s} produce {n / produce:10.0f} ev/s  delivered {s['sent']:7d} "
+            f"dropped {s['dropped_oldest'] + s['dropped_newest']:7d}  wall {total:6.2f}s"
+        )
+
+
+def bench_outage(n: int) -> None:
+    print("-- outage: spool while down, drain on recovery")
+    core = FakeAdaptiveCoreInterface(record=False)
+    core.down = True
+    with tempfile.TemporaryDirectory() as tmp, EventSpool(tmp) as spool:
+        bridge = SentinelAdaptiveCoreBridge(
+            interface=core, packet_type=StubThreatPacket, spool=spool, retry_interval=3600.0
+        )
+        t0 = time.perf_counter()
+        for i in range(n):
+            bridge.submit_simple_threat(**_threat(i))
+        spooled = time.perf_counter() - t0
+        core.down = False
+        t0 = time.perf_counter()
+        drained = bridge.drain_spool()
+        drain = time.perf_counter() - t0
+        print(f"spool  {n / spooled:10.0f} threats/s ({spool.stats()['fsyncs']} fsyncs)")
+        print(f"drain  {drained / drain:10.0f} threats/s ({core.call_count - 1} core calls)")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+    bench_throughput(n, latency)
+    bench_backpressure(n, latency)
+    bench_outage(n)
+
+
+if __name__ == "__main__":
+    main()
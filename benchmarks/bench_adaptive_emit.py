@@ -0,0 +1,49 @@
+"""
+Per-event cost of emitting an AdaptiveEvent with DEBUG logging disabled
+(the production default): eager serialization vs the guarded default sink.
+
+    python benchmarks/bench_adaptive_emit.py [events]
+"""
+
+import json
+import logging
+import sys
+import time
+
+import sentinel_ai_v2.adaptive_bridge as ab
+
+
+def _eager(event) -> None:
+    # previous behaviour: serialize, then let logging discard the record
+    ab.logger.debug("AdaptiveEvent %s", json.dumps(event.to_dict(), sort_keys=True, default=str))
+
+
+def _bench(fn, event, n: int) -> float:
+    fn(event)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn(event)
+    return (time.perf_counter() - t0) / n * 1e9
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logging.basicConfig(level=logging.INFO)
+
+    event = ab.build_adaptive_event(
+        anomaly_type="mempool_flood",
+        severity=0.9,
+        block_height=123456,
+        details='{"window":"30s"}',
+    )
+    sink = ab.LoggingEventSink()
+
+    print(f"events={n}  DEBUG enabled={ab.logger.isEnabledFor(logging.DEBUG)}")
+    print(f"eager to_dict+dumps     {_bench(_eager, event, n):8.0f} ns/event")
+    print(f"emit_adaptive_event     {_bench(ab.emit_adaptive_event, event, n):8.0f} ns/event")
+    print(f"LoggingEventSink.emit   {_bench(sink.emit, event, n):8.0f} ns/event")
+    print(f"export_to_adaptive_core {_bench(ab.export_to_adaptive_core, event, n):8.0f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
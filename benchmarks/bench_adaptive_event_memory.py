@@ -0,0 +1,61 @@
+"""
+Memory per AdaptiveEvent: the previous regular dataclass (per-instance
+__dict__, datetime.utcnow() timestamp) vs the current __slots__ class.
+
+    python benchmarks/bench_adaptive_event_memory.py [events]
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from sentinel_ai_v2.adaptive_event import AdaptiveEvent
+
+
+@dataclass
+class LegacyAdaptiveEvent:
+    layer: str = "sentinel"
+    anomaly_type: str = "unknown"
+    severity: float = 0.0
+    qri_before: float = 0.0
+    qri_after: float = 0.0
+    block_height: Optional[int] = None
+    txid: Optional[str] = None
+    was_mitigated: bool = False
+    details: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+def _measure(cls, n: int):
+    # layer / anomaly_type are built per event (fresh str objects), as
+    # callers formatting signal names do.
+    layer, kind = "ai", "flood"
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    events = [
+        cls(layer=f"sentinel_{layer}", anomaly_type=f"mempool_{kind}", severity=0.9, block_height=i)
+        for i in range(n)
+    ]
+    elapsed = time.perf_counter() - t0
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return size / n, elapsed / n * 1e9
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"events={n}")
+    for name, cls in (("dataclass (legacy)", LegacyAdaptiveEvent), ("__slots__", AdaptiveEvent)):
+        per_event, ns = _measure(cls, n)
+        print(f"{name:20s} {per_event:7.1f} bytes/event  {ns:7.0f} ns/create")
+
+    evt = AdaptiveEvent(anomaly_type="mempool_flood", severity=0.9, block_height=1, details='{"w":"30s"}')
+    print(f"to_json()  {len(evt.to_json()):4d} bytes   to_bytes() {len(evt.to_bytes()):4d} bytes")
+
+
+if __name__ == "__main__":
+    main()
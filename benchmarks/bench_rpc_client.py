@@ -0,0 +1,41 @@
+"""
+Per-call latency: SimpleRpcClient (new connection per call) vs
+PooledRpcClient (keep-alive session) against a local stub JSON-RPC node.
+
+    python benchmarks/bench_rpc_client.py [calls]
+"""
+
+import sys
+import time
+
+from sentinel_ai_v2.rpc_client import PooledRpcClient, SimpleRpcClient
+from sentinel_ai_v2.testing.rpc_stub import StubRpcNode
+
+
+def _bench(client, calls: int) -> float:
+    client.get_block_count()  # warm up
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        client.get_block_count()
+    return (time.perf_counter() - t0) / calls * 1e6
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with StubRpcNode(height=1) as node:
+        simple_us = _bench(SimpleRpcClient(node.url, "u", "p"), calls)
+        simple_conns = node.connection_count
+
+        with PooledRpcClient(node.url, "u", "p") as pooled:
+            before = node.connection_count
+            pooled_us = _bench(pooled, calls)
+            pooled_conns = node.connection_count - before
+
+    print(f"calls={calls}")
+    print(f"SimpleRpcClient  {simple_us:8.1f} us/call  connections={simple_conns}")
+    print(f"PooledRpcClient  {pooled_us:8.1f} us/call  connections={pooled_conns}")
+
+
+if __name__ == "__main__":
+    main()
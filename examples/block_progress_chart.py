@@ -1,40 +1,49 @@
 """
 Block Progress Chart
 
-Reads block_progress_log.jsonl (created by block_progress_recorder.py)
+Reads block_progress.sbps (created by block_progress_recorder.py)
 and draws a simple chart of block height over time, marking stalled
-periods if any.
+periods if any. Long histories are reduced to about MAX_POINTS samples with
+LTTB downsampling; stalled samples are always kept.
 
 Requires matplotlib:
     pip install matplotlib
 """
 
-import json
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 
 import matplotlib.pyplot as plt  # noqa: E402
 
+from sentinel_ai_v2.downsample import downsample_block_progress
+from sentinel_ai_v2.telemetry_monitor import BlockProgressReader
 
-LOG_FILE = "block_progress_log.jsonl"
 
+STORE_FILE = "block_progress.sbps"
+MAX_POINTS = 2000
 
-def load_log(path: str):
+
+def load_log(path: str, start=None, end=None):
     timestamps = []
     heights = []
     statuses = []
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            entry = json.loads(line)
-            timestamps.append(datetime.fromisoformat(entry["timestamp"]))
-            heights.append(entry["current_height"])
-            statuses.append(entry["status"])
+    if not os.path.exists(path):
+        return timestamps, heights, statuses
+
+    with BlockProgressReader(path) as history:
+        for ts, height, _prev, _stalled, code in downsample_block_progress(
+            history, MAX_POINTS, start, end
+        ):
+            timestamps.append(datetime.fromtimestamp(ts, timezone.utc))
+            heights.append(height)
+            statuses.append("stalled" if code else "ok")
 
     return timestamps, heights, statuses
 
 
 def main() -> None:
-    ts, heights, statuses = load_log(LOG_FILE)
+    ts, heights, statuses = load_log(STORE_FILE)
 
     if not ts:
         print("No log data found. Run block_progress_recorder.py first.")
@@ -1,19 +1,27 @@
 """
 Block Progress Recorder
 
-Periodically calls the BlockProgressMonitor and appends results
-to a JSONL file (one JSON object per line).
+Calls the BlockProgressMonitor on an adaptive schedule and appends
+results to a compact binary store (32 bytes per sample, see
+`telemetry_monitor.BlockProgressWriter`).
+
+An existing JSONL log from older versions of this script can be imported with
+`convert_jsonl_to_store("block_progress_log.jsonl", STORE_FILE)`.
+
+The poll interval follows the observed block rhythm: sparse right after a
+new block, denser as the stall threshold approaches.
 
 This script is OPTIONAL and provided as an example of how
 Sentinel AI v2 can feed dashboards.
 """
 
-import json
 import logging
 import time
 from datetime import datetime
 
 from sentinel_ai_v2.telemetry_monitor import (
+    AdaptivePollScheduler,
+    BlockProgressWriter,
     init_block_progress_monitor,
     check_block_progress,
 )
@@ -26,32 +34,24 @@ RPC_URL = "http://127.0.0.1:14022"
 RPC_USER = "user"
 RPC_PASS = "pass"
 
-LOG_FILE = "block_progress_log.jsonl"
-INTERVAL_SECONDS = 60  # how often to sample
-
-
-def status_to_dict(status) -> dict:
-    return {
-        "timestamp": status.timestamp.isoformat(),
-        "current_height": status.current_height,
-        "previous_height": status.previous_height,
-        "status": status.status,
-        "stalled_for_seconds": status.stalled_for_seconds,
-    }
+STORE_FILE = "block_progress.sbps"
+STALL_THRESHOLD_SECONDS = 600
 
 
 def main() -> None:
     rpc = SimpleRpcClient(RPC_URL, RPC_USER, RPC_PASS)
-    init_block_progress_monitor(rpc, stall_threshold_seconds=600)
-
-    while True:
-        status = check_block_progress()
-        logging.info("Status: %s", status)
-
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(status_to_dict(status)) + "\n")
-
-        time.sleep(INTERVAL_SECONDS)
+    init_block_progress_monitor(rpc, stall_threshold_seconds=STALL_THRESHOLD_SECONDS)
+    scheduler = AdaptivePollScheduler(stall_threshold_seconds=STALL_THRESHOLD_SECONDS)
+
+    # Flush every sample: the recorder is slow-paced and charts read the file live.
+    with BlockProgressWriter(STORE_FILE, buffer_records=1) as store:
+        while True:
+            status = check_block_progress()
+            scheduler.observe(status)
+            logging.info("Status: %s", status)
+            store.append(status)
+
+            time.sleep(scheduler.next_delay())
 
 
 if __name__ == "__main__":
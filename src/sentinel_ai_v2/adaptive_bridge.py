@@ -12,15 +12,53 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Protocol
 
 from .adaptive_event import AdaptiveEvent
+from .anomaly_coalescer import AnomalyCoalescer
 
 logger = logging.getLogger(__name__)
 
 
+class EventSink(Protocol):
+    """
+    Destination for AdaptiveEvents (log, HTTP, queue, file, ...).
+
+    Sinks receive the event object itself and serialize it only if and how
+    they need to, so events that are dropped, batched or filtered never pay
+    for JSON encoding.
+    """
+    def emit(self, event: AdaptiveEvent) -> None:
+        ...
+
+
+def serialize_adaptive_event(event: AdaptiveEvent) -> str:
+    """Canonical JSON line for an event (sorted keys, datetimes as str)."""
+    return event.to_json()
+
+
+class LoggingEventSink:
+    """
+    Logs each event as one JSON line at `level`.
+
+    Serialization is skipped entirely when the logger is not enabled for
+    `level` (the production default for DEBUG).
+    """
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.log = log or logger
+        self.level = level
+
+    def emit(self, event: AdaptiveEvent) -> None:
+        if not self.log.isEnabledFor(self.level):
+            return
+        try:
+            self.log.log(self.level, "AdaptiveEvent %s", serialize_adaptive_event(event))
+        except Exception as e:  # pragma: no cover – defensive
+            self.log.error("Failed to log AdaptiveEvent: %s", e)
+
+
 def build_adaptive_event(
     *,
     anomaly_type: str,
@@ -55,29 +93,46 @@ def build_adaptive_event(
 
 def emit_adaptive_event(event: AdaptiveEvent) -> None:
     """
-    Placeholder sink for AdaptiveEvents.
+    Default sink for AdaptiveEvents.
 
-    For v2 this only logs a structured JSON line.
-    Later, DigiByte-Quantum-Adaptive-Core can replace this with:
-      – HTTP/gRPC send
-      – message queue push
-      – file / DB logger, etc.
+    For v2 this only logs a structured JSON line at DEBUG; the event is not
+    serialized at all when DEBUG is disabled. Other transports (HTTP/gRPC,
+    message queue, file / DB) plug in as an EventSink via set_event_sink().
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
-        payload = asdict(event)
-        # default=str ensures datetime is JSON-serializable
-        logger.debug("AdaptiveEvent %s", json.dumps(payload, sort_keys=True, default=str))
+        logger.debug("AdaptiveEvent %s", serialize_adaptive_event(event))
     except Exception as e:  # pragma: no cover – defensive
         logger.error("Failed to log AdaptiveEvent: %s", e)
 
 
+# Optional transport installed by the application (e.g. LoggingEventSink,
+# adaptive_emitter.BatchingEventEmitter). None = log via emit_adaptive_event().
+_event_sink: Optional[EventSink] = None
+
+
+def set_event_sink(sink: Optional[EventSink]) -> Optional[EventSink]:
+    """
+    Route export_to_adaptive_core() through `sink.emit(event)`.
+
+    Pass None to restore the default logging sink. Returns the previous sink.
+    """
+    global _event_sink
+    previous, _event_sink = _event_sink, sink
+    return previous
+
+
 def export_to_adaptive_core(event: AdaptiveEvent) -> None:
     """
-    Integration alias kept for readability.
+    Single integration point for Adaptive Core transports.
 
-    Today this simply calls emit_adaptive_event().
-    Later this can become the single integration point for Adaptive Core transports.
+    Uses the sink installed with set_event_sink(), otherwise emit_adaptive_event().
     """
+    sink = _event_sink
+    if sink is not None:
+        sink.emit(event)
+        return
     emit_adaptive_event(event)
 
 
@@ -90,6 +145,7 @@ def emit_adaptive_event_from_signal(
     context: Optional[Dict[str, Any]] = None,
     block_height: Optional[int] = None,
     txid: Optional[str] = None,
+    coalescer: Optional[AnomalyCoalescer] = None,
 ) -> None:
     """
     Convenience helper: take any Sentinel signal name and push it into Adaptive Core.
@@ -107,6 +163,8 @@ def emit_adaptive_event_from_signal(
     - severity is a float (0..1 suggested).
     - qri_delta is applied as: qri_after = max(0.0, qri_before + qri_delta)
     - context is stored in the `details` field as JSON (string) for v2 simplicity.
+    - with a `coalescer`, repeated signals are rate-limited per
+      (layer, signal, block bucket) and forwarded as aggregates.
     """
     qri_before = float(severity)
     qri_after = qri_before + float(qri_delta)
@@ -134,4 +192,8 @@ def emit_adaptive_event_from_signal(
         details=details_str,
     )
 
-    export_to_adaptive_core(evt)
+    if coalescer is None:
+        export_to_adaptive_core(evt)
+        return
+    for out in coalescer.offer(evt):
+        export_to_adaptive_core(out)
@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .event_spool import EventSpool
+
+logger = logging.getLogger(__name__)
+
+# Delivery failures that mean "Adaptive Core unreachable" (ConnectionError and
+# TimeoutError included). Anything else is blamed on the records themselves.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (OSError,)
 
 try:
     # These imports will only work when the Adaptive Core package
@@ -15,11 +27,110 @@ except ImportError:  # pragma: no cover - optional integration
     ThreatPacket = None  # type: ignore
 
 
+class _FeedbackEvent:
+    """
+    Tiny lightweight feedback object that matches what the AdaptiveEngine
+    expects (duck-typing).
+    """
+
+    def __init__(self, event_id: str, layer: str, feedback: str) -> None:
+        self.event_id = event_id
+        self.layer = layer
+        self.feedback = feedback
+
+
+class _ThreatRecordPacket:
+    """
+    Attribute-only packet used when an explicit interface is given but
+    neither `packet_type` nor adaptive_core's ThreatPacket is available.
+    """
+
+    def __init__(self, **fields: Any) -> None:
+        self.__dict__.update(fields)
+
+
+def bridge_accepts_events(bridge: Any) -> bool:
+    """
+    True if `bridge` will deliver or spool a submission. Duck-typed bridges
+    without `accepts_events` fall back to `is_available`.
+    """
+    return bool(getattr(bridge, "accepts_events", bridge.is_available))
+
+
+def _threat_record(
+    *,
+    source_layer: str,
+    threat_type: str,
+    severity: int,
+    description: str,
+    node_id: Optional[str] = None,
+    wallet_id: Optional[str] = None,
+    tx_id: Optional[str] = None,
+    block_height: Optional[int] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return {
+        "kind": "threat",
+        "source_layer": source_layer,
+        "threat_type": threat_type,
+        "severity": severity,
+        "description": description,
+        "node_id": node_id,
+        "wallet_id": wallet_id,
+        "tx_id": tx_id,
+        "block_height": block_height,
+        "metadata": metadata,
+    }
+
+
+def _feedback_record(*, layer: str, feedback: str, event_id: str) -> Dict[str, Any]:
+    # Normalise feedback tag to upper-case; the core will accept strings.
+    return {"kind": "feedback", "layer": layer, "feedback": feedback.upper(), "event_id": event_id}
+
+
+def _submit_each(
+    submit: Callable[[Any], Any],
+    items: Sequence[Tuple[Any, Any]],
+    reject: Optional[Callable[[Any, Exception], None]],
+) -> None:
+    """Call `submit(obj)` per (record, obj) pair, handing refusals to `reject`."""
+    for rec, obj in items:
+        try:
+            submit(obj)
+        except _TRANSPORT_ERRORS:
+            raise
+        except Exception as exc:  # noqa: BLE001 – refused by the core
+            if reject is None:
+                raise
+            reject(rec, exc)
+
+
+def _submit_batch(
+    submit: Callable[[List[Any]], Any],
+    items: Sequence[Tuple[Any, Any]],
+    reject: Optional[Callable[[Any, Exception], None]],
+) -> None:
+    """One `submit([obj, ...])` call; if refused, retry `submit([obj])` per item."""
+    try:
+        submit([obj for _, obj in items])
+        return
+    except _TRANSPORT_ERRORS:
+        raise
+    except Exception:  # noqa: BLE001
+        if reject is None:
+            raise
+    _submit_each(lambda obj: submit([obj]), items, reject)
+
+
 class SentinelAdaptiveCoreBridge:
     """
     Optional bridge between Sentinel AI v2 and the DigiByte Quantum
     Adaptive Core.
 
+    `interface` and `packet_type` may be given explicitly; the bridge is then
+    usable without the adaptive_core package (stand-ins for tests and
+    benchmarks live in `adaptive_core_stub`).
+
     Design goals:
       - Do NOT break Sentinel AI v2 if the adaptive_core package
         is not installed.
@@ -30,17 +141,48 @@ class SentinelAdaptiveCoreBridge:
 
     This keeps Sentinel "adaptive-ready" without introducing a hard
     runtime dependency.
+
+    With an EventSpool (`spool=`), threats and feedback that cannot be
+    delivered – package not installed, or the interface raising – are
+    written to disk instead of being dropped, and are replayed in bulk
+    (oldest first) before the next successful submission. Replay attempts
+    while the core is down are spaced by `retry_interval` seconds.
+    Only transport errors (OSError, e.g. ConnectionError / TimeoutError)
+    count as an outage; records the core refuses for any other reason are
+    dropped, logged and counted in `rejected_records` so one bad record
+    cannot block the spool.
     """
 
-    def __init__(self, interface: Optional["AdaptiveCoreInterface"] = None) -> None:
-        # If AdaptiveCoreInterface is not available, this bridge becomes
-        # a no-op and Sentinel can still run normally.
-        if AdaptiveCoreInterface is None:
+    def __init__(
+        self,
+        interface: Optional["AdaptiveCoreInterface"] = None,
+        *,
+        packet_type: Optional[Callable[..., Any]] = None,
+        spool: Optional[EventSpool] = None,
+        retry_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # An explicit interface (e.g. adaptive_core_stub.FakeAdaptiveCoreInterface)
+        # is used as-is. Otherwise, if AdaptiveCoreInterface is not available,
+        # this bridge becomes a no-op and Sentinel can still run normally.
+        if interface is not None:
+            self._available = True
+            self._interface = interface
+        elif AdaptiveCoreInterface is None:
             self._available = False
             self._interface = None
         else:
             self._available = True
-            self._interface = interface or AdaptiveCoreInterface()
+            self._interface = AdaptiveCoreInterface()
+
+        # None = adaptive_core's ThreatPacket, resolved at delivery time
+        self.packet_type = packet_type
+
+        self.spool = spool
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._retry_at = 0.0
+        self.rejected_records = 0
 
     @property
     def is_available(self) -> bool:
@@ -50,6 +192,103 @@ class SentinelAdaptiveCoreBridge:
         """
         return self._available and self._interface is not None
 
+    @property
+    def accepts_events(self) -> bool:
+        """True if submissions are delivered now or spooled for later."""
+        return self.is_available or self.spool is not None
+
+    # ------------------------------------------------------------------ #
+    # Delivery / spooling
+    # ------------------------------------------------------------------ #
+
+    def _deliver(
+        self,
+        records: Sequence[Dict[str, Any]],
+        reject: Optional[Callable[[Any, Exception], None]] = None,
+    ) -> None:
+        """
+        Hand spool-format records to the interface: all threats in one
+        `submit_threat_packets` call when the interface has it (one
+        `submit_threat_packet` per packet otherwise), then all feedback in
+        one `submit_feedback_events` call.
+
+        With `reject`, a record the core refuses (any error other than a
+        transport error) goes to `reject(record, exc)` instead of failing
+        the delivery; a refused batch call is retried record by record to
+        single it out. Transport errors always propagate.
+        """
+        packet_type = self.packet_type or ThreatPacket or _ThreatRecordPacket
+        packets: List[Tuple[Any, Any]] = []
+        feedback: List[Tuple[Any, Any]] = []
+        for rec in records:
+            try:
+                if rec["kind"] == "threat":
+                    fields = {k: v for k, v in rec.items() if k != "kind"}
+                    packets.append((rec, packet_type(**fields)))
+                else:
+                    event = _FeedbackEvent(rec["event_id"], rec["layer"], rec["feedback"])
+                    feedback.append((rec, event))
+            except Exception as exc:  # noqa: BLE001 – malformed record
+                if reject is None:
+                    raise
+                reject(rec, exc)
+        iface: Any = self._interface
+        if packets:
+            submit_many = getattr(iface, "submit_threat_packets", None)
+            if submit_many is not None:
+                _submit_batch(submit_many, packets, reject)
+            else:
+                _submit_each(iface.submit_threat_packet, packets, reject)
+        if feedback:
+            _submit_batch(iface.submit_feedback_events, feedback, reject)
+
+    def _reject(self, record: Any, exc: Exception) -> None:
+        self.rejected_records += 1
+        logger.error("Adaptive Core rejected record %r (%s); dropping it", record, exc)
+
+    def _decode_spooled(self, payloads: List[bytes]) -> List[Dict[str, Any]]:
+        records = []
+        for payload in payloads:
+            try:
+                records.append(json.loads(payload))
+            except ValueError as exc:
+                self._reject(payload, exc)
+        return records
+
+    def _submit(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        if self.spool is None:
+            self._deliver(records)  # no spool: errors propagate as before
+            return
+
+        now = self._clock()
+        if self.is_available and now >= self._retry_at:
+            try:
+                self.drain_spool()
+                self._deliver(records, reject=self._reject)
+                return
+            except _TRANSPORT_ERRORS as exc:
+                logger.warning("Adaptive Core unreachable (%s); spooling events", exc)
+                self._retry_at = now + self.retry_interval
+
+        self.spool.append_many(
+            [json.dumps(r, separators=(",", ":"), default=str).encode("utf-8") for r in records]
+        )
+
+    def drain_spool(self, batch_size: int = 500) -> int:
+        """
+        Replay spooled events into the Adaptive Core in batches.
+        Returns how many were replayed (rejected records included); raises
+        on a transport error (the failed batch stays spooled).
+        """
+        if self.spool is None or not self.is_available:
+            return 0
+        return self.spool.replay(
+            lambda payloads: self._deliver(self._decode_spooled(payloads), reject=self._reject),
+            batch_size=batch_size,
+        )
+
     # ------------------------------------------------------------------ #
     # Threat submission
     # ------------------------------------------------------------------ #
@@ -71,26 +310,39 @@ class SentinelAdaptiveCoreBridge:
         Convenience helper for Sentinel to send a basic threat signal
         into the Adaptive Core.
         """
-        if not self.is_available:
+        if not self.accepts_events:
             # Adaptive Core is not installed / wired in this environment.
             # We silently no-op to avoid breaking Sentinel.
             return
 
-        assert ThreatPacket is not None  # for type checkers
-
-        packet = ThreatPacket(
-            source_layer=source_layer,
-            threat_type=threat_type,
-            severity=severity,
-            description=description,
-            node_id=node_id,
-            wallet_id=wallet_id,
-            tx_id=tx_id,
-            block_height=block_height,
-            metadata=metadata,
+        self._submit(
+            [
+                _threat_record(
+                    source_layer=source_layer,
+                    threat_type=threat_type,
+                    severity=severity,
+                    description=description,
+                    node_id=node_id,
+                    wallet_id=wallet_id,
+                    tx_id=tx_id,
+                    block_height=block_height,
+                    metadata=metadata,
+                )
+            ]
         )
 
-        self._interface.submit_threat_packet(packet)  # type: ignore[arg-type]
+    def submit_threats(self, packets: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Submit many threats in one interface call.
+
+        Each item is a mapping with the `submit_simple_threat` argument
+        names (`source_layer`, `threat_type`, `severity`, `description` and
+        optionally `node_id`, `wallet_id`, `tx_id`, `block_height`,
+        `metadata`).
+        """
+        if not self.accepts_events:
+            return
+        self._submit([_threat_record(**p) for p in packets])
 
     # ------------------------------------------------------------------ #
     # Feedback submission (teaching the Adaptive Core)
@@ -118,26 +370,22 @@ class SentinelAdaptiveCoreBridge:
         only needs these fields and accepts both enums and string tags.
         """
 
-        if not self.is_available:
+        if not self.accepts_events:
             # No Adaptive Core present → do nothing.
             return
 
-        # Define a tiny lightweight feedback object that matches what the
-        # AdaptiveEngine expects (duck-typing).
-        class _FeedbackEvent:
-            def __init__(self, event_id: str, layer: str, feedback: str) -> None:
-                self.event_id = event_id
-                self.layer = layer
-                self.feedback = feedback
-
-        # Normalise feedback tag to upper-case; the core will accept strings.
-        tag = feedback.upper()
-
-        events = [_FeedbackEvent(event_id=event_id, layer=layer, feedback=tag)]
+        # Delivered via submit_feedback_events, which forwards the iterable of
+        # events into the AdaptiveEngine.
+        self._submit([_feedback_record(layer=layer, feedback=feedback, event_id=event_id)])
 
-        # The AdaptiveCoreInterface already exposes submit_feedback_events,
-        # which forwards the iterable of events into the AdaptiveEngine.
-        self._interface.submit_feedback_events(events)  # type: ignore[arg-type]
+    def submit_feedback_labels(self, items: Iterable[Mapping[str, str]]) -> None:
+        """
+        Submit many feedback labels in one `submit_feedback_events` call.
+        Each item is a mapping with `layer`, `feedback` and `event_id`.
+        """
+        if not self.accepts_events:
+            return
+        self._submit([_feedback_record(**item) for item in items])
 
     # ------------------------------------------------------------------ #
     # Read-only views
@@ -152,3 +400,41 @@ class SentinelAdaptiveCoreBridge:
             return "Adaptive Core integration not available in this environment."
 
         return self._interface.get_immune_report_text(min_severity=min_severity)
+
+
+# ---------------------------------------------------------------------- #
+# Process-wide bridge
+# ---------------------------------------------------------------------- #
+
+_default_bridge: Optional[SentinelAdaptiveCoreBridge] = None
+_default_lock = threading.Lock()
+
+
+def get_default_bridge() -> SentinelAdaptiveCoreBridge:
+    """
+    Shared bridge used by the hooks and the heartbeat when no bridge is
+    passed, so the AdaptiveCoreInterface is built once per process instead
+    of once per call.
+    """
+    global _default_bridge
+    bridge = _default_bridge
+    if bridge is None:
+        with _default_lock:
+            if _default_bridge is None:
+                _default_bridge = SentinelAdaptiveCoreBridge()
+            bridge = _default_bridge
+    return bridge
+
+
+def reset_default_bridge(
+    bridge: Optional[SentinelAdaptiveCoreBridge] = None,
+) -> Optional[SentinelAdaptiveCoreBridge]:
+    """
+    Install `bridge` as the shared bridge (None = build a fresh one on next
+    use, e.g. after adaptive_core was installed or reconfigured).
+    Returns the previous shared bridge.
+    """
+    global _default_bridge
+    with _default_lock:
+        previous, _default_bridge = _default_bridge, bridge
+    return previous
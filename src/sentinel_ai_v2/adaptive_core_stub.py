@@ -0,0 +1,380 @@
+"""
+Local Adaptive Core stand-ins.
+
+`SentinelAdaptiveCoreBridge` normally talks to `adaptive_core`, which is an
+optional, separately installed package. These stand-ins let the bridge,
+hooks, heartbeat and emitters be tested and benchmarked without it:
+
+  - FakeAdaptiveCoreInterface   – in-process interface with configurable
+                                  latency, failure injection and recording
+  - AdaptiveCoreServer          – TCP server exposing a fake interface
+                                  (newline-delimited JSON requests)
+  - RemoteAdaptiveCoreInterface – client for AdaptiveCoreServer with the same
+                                  interface methods, so real socket round
+                                  trips can be measured
+
+Usage:
+
+    core = FakeAdaptiveCoreInterface(latency_seconds=0.001)
+    bridge = SentinelAdaptiveCoreBridge(interface=core, packet_type=StubThreatPacket)
+    bridge.submit_simple_threat("sentinel", "reorg", 7, "x")
+    assert core.threat_count == 1
+
+    with AdaptiveCoreServer(core) as server:
+        remote = RemoteAdaptiveCoreInterface(server.address)
+        bridge = SentinelAdaptiveCoreBridge(interface=remote, packet_type=StubThreatPacket)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class CoreUnavailable(ConnectionError):
+    """Injected failure: the (fake) Adaptive Core rejected the call."""
+
+
+class StubThreatPacket:
+    """Attribute bag with ThreatPacket's constructor keywords."""
+
+    def __init__(self, **fields: Any) -> None:
+        self.__dict__.update(fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StubThreatPacket):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"StubThreatPacket({self.__dict__!r})"
+
+
+def _packet_fields(packet: Any) -> Dict[str, Any]:
+    return dict(packet) if isinstance(packet, dict) else dict(vars(packet))
+
+
+def _feedback_fields(event: Any) -> Dict[str, Any]:
+    if isinstance(event, dict):
+        return dict(event)
+    return {"event_id": event.event_id, "layer": event.layer, "feedback": event.feedback}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeAdaptiveCoreInterface:
+    """
+    In-process AdaptiveCoreInterface stand-in.
+
+    Every interface call counts as one round trip: it sleeps
+    `latency_seconds`, then fails with CoreUnavailable when `down` is set or
+    with probability `failure_rate` (seeded by `seed`). Accepted threats and
+    feedback are kept in `threats` / `feedback` when `record=True`.
+
+    `batch_api=False` hides `submit_threat_packets`, so the bridge falls back
+    to one `submit_threat_packet` call per packet (as with older cores).
+
+    Counters: call_count, threat_count, feedback_count, failure_count.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        record: bool = True,
+        batch_api: bool = True,
+        global_threshold: float = 0.5,
+        layer_weights: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self.record = record
+        self.down = False
+        self.global_threshold = global_threshold
+        self.layer_weights: Dict[str, float] = dict(layer_weights or {"sentinel_ai_v2": 1.0})
+        if not batch_api:
+            # The bridge looks the method up with getattr(..., None).
+            self.submit_threat_packets = None  # type: ignore[assignment]
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.threats: List[Any] = []
+        self.feedback: List[Any] = []
+        self.last_threat_received: Optional[str] = None
+        self.last_learning_update: Optional[str] = None
+
+        self.call_count = 0
+        self.threat_count = 0
+        self.feedback_count = 0
+        self.failure_count = 0
+
+    def _round_trip(self) -> None:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        with self._lock:
+            self.call_count += 1
+            if self.down or (self.failure_rate and self._rng.random() < self.failure_rate):
+                self.failure_count += 1
+                raise CoreUnavailable("adaptive core unavailable (injected)")
+
+    # ------------------------------------------------------------------ #
+    # Submission
+    # ------------------------------------------------------------------ #
+
+    def submit_threat_packet(self, packet: Any) -> None:
+        self._accept_threats([packet])
+
+    def submit_threat_packets(self, packets: Iterable[Any]) -> None:  # type: ignore[no-redef]
+        self._accept_threats(packets)
+
+    def _accept_threats(self, packets: Iterable[Any]) -> None:
+        self._round_trip()
+        packets = list(packets)
+        with self._lock:
+            self.threat_count += len(packets)
+            self.last_threat_received = _now_iso()
+            if self.record:
+                self.threats.extend(packets)
+
+    def submit_feedback_events(self, events: Iterable[Any]) -> None:
+        self._round_trip()
+        events = list(events)
+        with self._lock:
+            self.feedback_count += len(events)
+            self.last_learning_update = _now_iso()
+            if self.record:
+                self.feedback.extend(events)
+
+    # ------------------------------------------------------------------ #
+    # Read-only views
+    # ------------------------------------------------------------------ #
+
+    def get_immune_report_text(self, min_severity: int = 0) -> str:
+        self._round_trip()
+        with self._lock:
+            severe = sum(
+                1 for p in self.threats if (_packet_fields(p).get("severity") or 0) >= min_severity
+            )
+            return (
+                f"Fake Adaptive Core: {self.threat_count} threats, {self.feedback_count} feedback "
+                f"events ({severe} recorded with severity >= {min_severity})"
+            )
+
+    def get_adaptive_state(self) -> SimpleNamespace:
+        self._round_trip()
+        return SimpleNamespace(
+            global_threshold=self.global_threshold, layer_weights=dict(self.layer_weights)
+        )
+
+    def get_last_update_metadata(self) -> Dict[str, Any]:
+        self._round_trip()
+        return {
+            "last_threat_received": self.last_threat_received,
+            "last_learning_update": self.last_learning_update,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.call_count,
+                "threats": self.threat_count,
+                "feedback": self.feedback_count,
+                "failures": self.failure_count,
+            }
+
+
+# ---------------------------------------------------------------------- #
+# Socket stand-in
+# ---------------------------------------------------------------------- #
+
+
+class AdaptiveCoreServer:
+    """
+    Threaded TCP server in front of a FakeAdaptiveCoreInterface.
+
+    Protocol: one JSON object per line, `{"method": ..., "params": {...}}`,
+    answered with `{"result": ..., "error": null}` or
+    `{"result": null, "error": {"type": ..., "message": ...}}`. Connections
+    are persistent; latency and failures come from `core`.
+
+    Counters: connection_count, request_count.
+    """
+
+    def __init__(
+        self,
+        core: Optional[FakeAdaptiveCoreInterface] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.core = core or FakeAdaptiveCoreInterface()
+        self._lock = threading.Lock()
+        self.connection_count = 0
+        self.request_count = 0
+        self._server = socketserver.ThreadingTCPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def start(self) -> "AdaptiveCoreServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="adaptive-core-stub", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "AdaptiveCoreServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def dispatch(self, method: str, params: Dict[str, Any]) -> Any:
+        core = self.core
+        if method == "submit_threat_packets":
+            return core._accept_threats([StubThreatPacket(**p) for p in params["packets"]])
+        if method == "submit_feedback_events":
+            return core.submit_feedback_events([SimpleNamespace(**e) for e in params["events"]])
+        if method == "get_immune_report_text":
+            return core.get_immune_report_text(min_severity=int(params.get("min_severity", 0)))
+        if method == "get_adaptive_state":
+            return vars(core.get_adaptive_state())
+        if method == "get_last_update_metadata":
+            return core.get_last_update_metadata()
+        raise KeyError(f"unknown method {method!r}")
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def setup(self) -> None:
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with server._lock:
+                    server.connection_count += 1
+
+            def handle(self) -> None:
+                for line in self.rfile:
+                    with server._lock:
+                        server.request_count += 1
+                    try:
+                        req = json.loads(line)
+                        reply = {
+                            "result": server.dispatch(req["method"], req.get("params") or {}),
+                            "error": None,
+                        }
+                    except Exception as exc:  # noqa: BLE001 – reported to the client
+                        reply = {"result": None, "error": {"type": type(exc).__name__, "message": str(exc)}}
+                    self.wfile.write(json.dumps(reply, default=str).encode("utf-8") + b"\n")
+
+        return _Handler
+
+
+class RemoteAdaptiveCoreInterface:
+    """
+    AdaptiveCoreInterface over one persistent AdaptiveCoreServer connection.
+
+    Calls are serialized on the connection. Injected core failures raise
+    CoreUnavailable; other server-side errors raise RuntimeError; transport
+    errors raise OSError and the next call reconnects.
+    """
+
+    def __init__(self, address: Tuple[str, int], *, timeout: float = 5.0) -> None:
+        self.address = address
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._rfile: Any = None
+
+    def _connect(self) -> None:
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+
+    def _call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        body = json.dumps({"method": method, "params": params or {}}, default=str).encode("utf-8") + b"\n"
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                assert self._sock is not None
+                self._sock.sendall(body)
+                line = self._rfile.readline()
+                if not line:
+                    raise ConnectionError("adaptive core stub closed the connection")
+            except OSError:
+                self._close()
+                raise
+        reply = json.loads(line)
+        error = reply.get("error")
+        if error:
+            if error.get("type") == CoreUnavailable.__name__:
+                raise CoreUnavailable(error.get("message"))
+            raise RuntimeError(error.get("message"))
+        return reply.get("result")
+
+    def submit_threat_packet(self, packet: Any) -> None:
+        self.submit_threat_packets([packet])
+
+    def submit_threat_packets(self, packets: Iterable[Any]) -> None:
+        self._call("submit_threat_packets", {"packets": [_packet_fields(p) for p in packets]})
+
+    def submit_feedback_events(self, events: Iterable[Any]) -> None:
+        self._call("submit_feedback_events", {"events": [_feedback_fields(e) for e in events]})
+
+    def get_immune_report_text(self, min_severity: int = 0) -> str:
+        return self._call("get_immune_report_text", {"min_severity": min_severity})
+
+    def get_adaptive_state(self) -> SimpleNamespace:
+        return SimpleNamespace(**self._call("get_adaptive_state"))
+
+    def get_last_update_metadata(self) -> Dict[str, Any]:
+        return self._call("get_last_update_metadata")
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._rfile.close()
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._rfile = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def __enter__(self) -> "RemoteAdaptiveCoreInterface":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
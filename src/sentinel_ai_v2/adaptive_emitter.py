@@ -0,0 +1,230 @@
+"""
+Background, batching AdaptiveEvent emitter.
+
+Detection code hands events to `BatchingEventEmitter.emit()`, which only
+appends to a bounded in-memory queue. A daemon thread drains the queue and
+passes lists of events to a batch sink (HTTP, message queue, file, ...), so
+sink I/O latency never lands on the detection path.
+
+Usage:
+
+    emitter = BatchingEventEmitter(send_batch, batch_size=256, flush_interval=1.0)
+    set_event_sink(emitter)          # route export_to_adaptive_core() through it
+    ...
+    emitter.close()                  # flushes what is still queued
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from .adaptive_event import AdaptiveEvent
+
+logger = logging.getLogger(__name__)
+
+BatchSink = Callable[[Sequence[AdaptiveEvent]], None]
+
+# Overflow policies when the queue is full
+DROP_OLDEST = "drop_oldest"    # evict the oldest queued event, keep the new one
+DROP_NEWEST = "drop_newest"    # reject the new event
+BLOCK = "block"                # wait for room (up to `block_timeout`), then reject
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+def _log_batch(events: Sequence[AdaptiveEvent]) -> None:
+    from . import adaptive_bridge
+
+    for event in events:
+        adaptive_bridge.emit_adaptive_event(event)
+
+
+class BatchingEventEmitter:
+    """
+    Bounded queue + background flusher for AdaptiveEvents.
+
+    A batch is handed to `sink` when `batch_size` events are queued or when
+    the oldest queued event has waited `flush_interval` seconds, whichever
+    comes first. Sink exceptions are logged and counted; the batch is dropped
+    and the flusher keeps running.
+
+    Counters (see `stats()`): submitted, sent, batches, dropped_oldest,
+    dropped_newest, dropped_failed, blocked, sink_errors.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[BatchSink] = None,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        overflow: str = DROP_OLDEST,
+        block_timeout: Optional[float] = None,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if max_queue <= 0 or batch_size <= 0:
+            raise ValueError("max_queue and batch_size must be > 0")
+
+        self.sink: BatchSink = sink or _log_batch
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+
+        self._queue: Deque[AdaptiveEvent] = deque()
+        self._cond = threading.Condition()
+        self._first_at: Optional[float] = None  # monotonic time the oldest queued event arrived
+        self._inflight = 0
+        self._flush_requested = False
+        self._closed = False
+
+        self.submitted = 0
+        self.sent = 0
+        self.batches = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self.dropped_failed = 0
+        self.blocked = 0
+        self.sink_errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="adaptive-event-emitter", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    # Producer side
+    # ------------------------------------------------------------------ #
+
+    def emit(self, event: AdaptiveEvent) -> bool:
+        """Queue one event. Returns False if it was rejected."""
+        with self._cond:
+            if self._closed:
+                self.dropped_newest += 1
+                return False
+
+            if len(self._queue) >= self.max_queue:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped_newest += 1
+                    return False
+                if self.overflow == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped_oldest += 1
+                else:
+                    self.blocked += 1
+                    has_room = self._cond.wait_for(
+                        lambda: self._closed or len(self._queue) < self.max_queue,
+                        timeout=self.block_timeout,
+                    )
+                    if not has_room or self._closed:
+                        self.dropped_newest += 1
+                        return False
+
+            if not self._queue:
+                self._first_at = time.monotonic()
+            self._queue.append(event)
+            self.submitted += 1
+            if len(self._queue) >= self.batch_size or len(self._queue) == 1:
+                self._cond.notify_all()
+            return True
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    # ------------------------------------------------------------------ #
+    # Flusher thread
+    # ------------------------------------------------------------------ #
+
+    def _next_batch(self) -> Optional[List[AdaptiveEvent]]:
+        """Wait for a size/time/flush trigger; None means shut down."""
+        with self._cond:
+            while True:
+                if self._queue:
+                    if self._closed or self._flush_requested or len(self._queue) >= self.batch_size:
+                        break
+                    assert self._first_at is not None
+                    remaining = self._first_at + self.flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                else:
+                    self._flush_requested = False
+                    if self._closed:
+                        return None
+                    self._cond.wait()
+
+            n = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(n)]
+            self._first_at = time.monotonic() if self._queue else None
+            self._inflight = n
+            self._cond.notify_all()  # room for blocked producers
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            ok = True
+            try:
+                self.sink(batch)
+            except Exception:  # noqa: BLE001 – a sink failure must not kill the flusher
+                ok = False
+                logger.exception("AdaptiveEvent sink failed; dropping %d events", len(batch))
+            with self._cond:
+                self.batches += 1
+                if ok:
+                    self.sent += len(batch)
+                else:
+                    self.sink_errors += 1
+                    self.dropped_failed += len(batch)
+                self._inflight = 0
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued now; True once the queue is drained."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._queue and self._inflight == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Stop accepting events, flush the queue and stop the flusher.
+        Returns True if everything queued was handed to the sink in time.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return not self._thread.is_alive() and not self._queue
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "submitted": self.submitted,
+                "sent": self.sent,
+                "batches": self.batches,
+                "dropped_oldest": self.dropped_oldest,
+                "dropped_newest": self.dropped_newest,
+                "dropped_failed": self.dropped_failed,
+                "blocked": self.blocked,
+                "sink_errors": self.sink_errors,
+            }
+
+    def __enter__(self) -> "BatchingEventEmitter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
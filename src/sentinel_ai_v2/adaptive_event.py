@@ -1,9 +1,47 @@
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+
+# Fixed binary layout: header, then UTF-8 bytes of layer, anomaly_type,
+# txid, details (lengths in the header; absent optionals have length 0 and
+# a cleared flag bit).
+#   created_at_ns i64 | severity f64 | qri_before f64 | qri_after f64 |
+#   block_height i64 | flags u8 | len(layer) u16 | len(anomaly_type) u16 |
+#   len(txid) u16 | len(details) u32
+_HEADER = struct.Struct("<qdddqBHHHI")
+_F_MITIGATED = 1
+_F_BLOCK_HEIGHT = 2
+_F_TXID = 4
+_F_DETAILS = 8
+
+# Same output as json.dumps(..., sort_keys=True, default=str) on the old dataclass.
+_JSON = json.JSONEncoder(sort_keys=True, default=str)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Epoch nanoseconds -> naive UTC datetime (microsecond resolution)."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _to_ns(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return ((value - _EPOCH) // _US) * 1000
+
+
+def _intern(value: Any) -> Any:
+    """Intern plain strings; anything else (str-based Enums, None, ...) is kept as is."""
+    return sys.intern(value) if type(value) is str else value
 
 
-@dataclass
 class AdaptiveEvent:
     """
     Standard anomaly event format that Sentinel AI v2 will send
@@ -11,20 +49,162 @@ class AdaptiveEvent:
 
     This does NOT change Sentinel's behaviour yet.
     It only defines a clean, consistent structure for anomalies.
+
+    Events are created at high rate during attack windows, so the class uses
+    `__slots__` (no per-instance dict), stores the creation time as integer
+    epoch nanoseconds (`created_at_ns`) and interns `layer` / `anomaly_type`.
+    `created_at` is still available as a naive UTC datetime.
     """
 
-    layer: str = "sentinel"
-    anomaly_type: str = "unknown"
+    __slots__ = (
+        "layer",
+        "anomaly_type",
+        "severity",
+        "qri_before",
+        "qri_after",
+        "block_height",
+        "txid",
+        "was_mitigated",
+        "details",
+        "created_at_ns",
+    )
+    # Fields compared by __eq__; subclasses adding slots extend this.
+    _FIELDS: tuple = __slots__
+
+    def __init__(
+        self,
+        layer: str = "sentinel",
+        anomaly_type: str = "unknown",
+        severity: float = 0.0,
+        qri_before: float = 0.0,
+        qri_after: float = 0.0,
+        block_height: Optional[int] = None,
+        txid: Optional[str] = None,
+        was_mitigated: bool = False,
+        details: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        *,
+        created_at_ns: Optional[int] = None,
+    ) -> None:
+        self.layer = _intern(layer)
+        self.anomaly_type = _intern(anomaly_type)
+        self.severity = severity
+        self.qri_before = qri_before
+        self.qri_after = qri_after
+        self.block_height = block_height
+        self.txid = txid
+        self.was_mitigated = was_mitigated
+        self.details = details
+        # IMPORTANT: a fresh timestamp per event (not import-time).
+        if created_at_ns is None:
+            created_at_ns = time.time_ns() if created_at is None else _to_ns(created_at)
+        self.created_at_ns = created_at_ns
+
+    @property
+    def created_at(self) -> datetime:
+        return ns_to_datetime(self.created_at_ns)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self.created_at_ns = _to_ns(value)
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the previous dataclass
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveEvent(layer={self.layer!r}, anomaly_type={self.anomaly_type!r}, "
+            f"severity={self.severity!r}, qri_before={self.qri_before!r}, "
+            f"qri_after={self.qri_after!r}, block_height={self.block_height!r}, "
+            f"txid={self.txid!r}, was_mitigated={self.was_mitigated!r}, "
+            f"details={self.details!r}, created_at={self.created_at!r})"
+        )
+
+    # ------------------------------------------------------------------ #
+    # Serialization
+    # ------------------------------------------------------------------ #
 
-    severity: float = 0.0
-    qri_before: float = 0.0
-    qri_after: float = 0.0
+    def to_dict(self) -> Dict[str, Any]:
+        """Field dict with the same keys as the former dataclasses.asdict()."""
+        return {
+            "anomaly_type": self.anomaly_type,
+            "block_height": self.block_height,
+            "created_at": self.created_at,
+            "details": self.details,
+            "layer": self.layer,
+            "qri_after": self.qri_after,
+            "qri_before": self.qri_before,
+            "severity": self.severity,
+            "txid": self.txid,
+            "was_mitigated": self.was_mitigated,
+        }
 
-    block_height: Optional[int] = None
-    txid: Optional[str] = None
+    def to_json(self) -> str:
+        """Sorted-key JSON line; `created_at` rendered as str(datetime)."""
+        return _JSON.encode(self.to_dict())
 
-    was_mitigated: bool = False
-    details: Optional[str] = None
+    def to_bytes(self) -> bytes:
+        """Compact fixed-layout binary encoding (see _HEADER)."""
+        layer = self.layer.encode("utf-8")
+        kind = self.anomaly_type.encode("utf-8")
+        txid = self.txid.encode("utf-8") if self.txid is not None else b""
+        details = self.details.encode("utf-8") if self.details is not None else b""
+        flags = (
+            (_F_MITIGATED if self.was_mitigated else 0)
+            | (_F_BLOCK_HEIGHT if self.block_height is not None else 0)
+            | (_F_TXID if self.txid is not None else 0)
+            | (_F_DETAILS if self.details is not None else 0)
+        )
+        return (
+            _HEADER.pack(
+                self.created_at_ns,
+                float(self.severity),
+                float(self.qri_before),
+                float(self.qri_after),
+                self.block_height if self.block_height is not None else 0,
+                flags,
+                len(layer),
+                len(kind),
+                len(txid),
+                len(details),
+            )
+            + layer
+            + kind
+            + txid
+            + details
+        )
 
-    # IMPORTANT: default_factory ensures a fresh timestamp per event (not import-time).
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AdaptiveEvent":
+        ns, severity, qri_before, qri_after, height, flags, n_layer, n_kind, n_txid, n_details = (
+            _HEADER.unpack_from(data)
+        )
+        pos = _HEADER.size
+        if len(data) != pos + n_layer + n_kind + n_txid + n_details:
+            raise ValueError("truncated or oversized AdaptiveEvent record")
+        layer = data[pos:pos + n_layer].decode("utf-8")
+        pos += n_layer
+        kind = data[pos:pos + n_kind].decode("utf-8")
+        pos += n_kind
+        txid = data[pos:pos + n_txid].decode("utf-8")
+        pos += n_txid
+        details = data[pos:pos + n_details].decode("utf-8")
+        return cls(
+            layer=layer,
+            anomaly_type=kind,
+            severity=severity,
+            qri_before=qri_before,
+            qri_after=qri_after,
+            block_height=height if flags & _F_BLOCK_HEIGHT else None,
+            txid=txid if flags & _F_TXID else None,
+            was_mitigated=bool(flags & _F_MITIGATED),
+            details=details if flags & _F_DETAILS else None,
+            created_at_ns=ns,
+        )
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from . import adaptive_bridge
+from .adaptive_core_bridge import SentinelAdaptiveCoreBridge, bridge_accepts_events, get_default_bridge
+from .adaptive_event import AdaptiveEvent
+from .anomaly_coalescer import AnomalyCoalescer, CoalesceKey, CoalescedAdaptiveEvent
+
+_REORG_LAYER = "sentinel_ai_v2"
+_REORG_TYPE = "reorg_pattern"
 
 
 def report_reorg_anomaly_to_adaptive(
@@ -12,6 +18,7 @@ def report_reorg_anomaly_to_adaptive(
     score: float,
     details: Optional[dict[str, Any]] = None,
     bridge: Optional[SentinelAdaptiveCoreBridge] = None,
+    coalescer: Optional[AnomalyCoalescer] = None,
 ) -> None:
     """
     Helper used by Sentinel AI v2 when it detects a suspicious reorg pattern.
@@ -33,16 +40,91 @@ def report_reorg_anomaly_to_adaptive(
 
         bridge:
             Optional existing SentinelAdaptiveCoreBridge instance.
-            If None, a new bridge will be created internally.
+            If None, the shared bridge from get_default_bridge() is used.
+
+        coalescer:
+            Optional AnomalyCoalescer. Repeated reorg signals for the same
+            block bucket are then rate-limited and sent as one packet whose
+            metadata carries `coalesced_count`, `first_seen`, `last_seen`
+            and the max score. Aggregates still pending at the end of a
+            burst are sent by `flush_reorg_coalescer()`.
     """
-    # If no bridge passed, create a default one (will be no-op if Adaptive Core
+    # If no bridge passed, use the shared one (a no-op if Adaptive Core
     # isn't available in this environment).
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_default_bridge()
+
+    if not bridge_accepts_events(bridge):
+        # Adaptive Core not present (and no spool) → do nothing, don't break Sentinel.
+        return
 
-    if not bridge.is_available:
-        # Adaptive Core not present → do nothing, don't break Sentinel.
+    if coalescer is None:
+        _submit_reorg(bridge, block_height, score, details)
         return
 
+    signal = AdaptiveEvent(
+        layer=_REORG_LAYER, anomaly_type=_REORG_TYPE, severity=score, block_height=block_height
+    )
+    _forward_coalesced(bridge, coalescer, coalescer.offer(signal), coalescer.key_for(signal), details)
+
+
+def flush_reorg_coalescer(
+    bridge: Optional[SentinelAdaptiveCoreBridge],
+    coalescer: AnomalyCoalescer,
+    *,
+    force: bool = False,
+) -> int:
+    """
+    Send reorg aggregates still held by `coalescer` (see
+    `AnomalyCoalescer.flush`; `force=True` releases all of them, e.g. on
+    shutdown). Call periodically when reporting with a coalescer.
+
+    Returns the number of reorg packets submitted.
+    """
+    bridge = bridge or get_default_bridge()
+    released = coalescer.flush(force=force)
+    if not bridge_accepts_events(bridge):
+        return 0
+    return _forward_coalesced(bridge, coalescer, released)
+
+
+def _forward_coalesced(
+    bridge: SentinelAdaptiveCoreBridge,
+    coalescer: AnomalyCoalescer,
+    events: Iterable[AdaptiveEvent],
+    current_key: Optional[CoalesceKey] = None,
+    details: Optional[dict[str, Any]] = None,
+) -> int:
+    """
+    Submit coalescer output as reorg packets. `details` belong to the
+    current call and are attached only to events of `current_key`.
+
+    A coalescer shared with other detectors can also release their
+    aggregates here (LRU eviction, flush); those are not reorgs and go to
+    `export_to_adaptive_core()`, as `emit_adaptive_event_from_signal` would
+    have sent them.
+    """
+    sent = 0
+    for out in events:
+        if out.layer != _REORG_LAYER or out.anomaly_type != _REORG_TYPE:
+            adaptive_bridge.export_to_adaptive_core(out)
+            continue
+        key = coalescer.key_for(out)
+        extra: dict[str, Any] = dict(details or {}) if key == current_key else {}
+        if isinstance(out, CoalescedAdaptiveEvent):
+            extra["coalesced_count"] = out.count
+            extra["first_seen"] = out.first_seen.isoformat()
+            extra["last_seen"] = out.created_at.isoformat()
+        _submit_reorg(bridge, out.block_height, out.severity, extra)  # type: ignore[arg-type]
+        sent += 1
+    return sent
+
+
+def _submit_reorg(
+    bridge: SentinelAdaptiveCoreBridge,
+    block_height: int,
+    score: float,
+    details: Optional[dict[str, Any]],
+) -> None:
     # Map score [0.0, 1.0] → severity [0, 10]
     raw_severity = int(round(score * 10))
     severity = max(0, min(10, raw_severity))
@@ -52,8 +134,8 @@ def report_reorg_anomaly_to_adaptive(
         metadata.update(details)
 
     bridge.submit_simple_threat(
-        source_layer="sentinel_ai_v2",
-        threat_type="reorg_pattern",
+        source_layer=_REORG_LAYER,
+        threat_type=_REORG_TYPE,
         severity=severity,
         description="Suspicious reorg pattern detected by Sentinel AI v2.",
         block_height=block_height,
@@ -0,0 +1,221 @@
+"""
+Rate-limited coalescing of repeated anomaly events.
+
+A sustained condition (e.g. mempool flooding) fires the same detection many
+times a second. `AnomalyCoalescer` groups events by
+(layer, anomaly_type, block_height // height_bucket) and lets each key pass
+at most `rate` events per second (token bucket, `burst` deep). Events over
+the limit are folded into one aggregate that is released with the next
+available token (or by `flush()`), carrying the count, max severity and
+first/last timestamps.
+
+Usage:
+    coalescer = AnomalyCoalescer(rate=1.0, burst=5)
+    for evt in coalescer.offer(event):
+        export_to_adaptive_core(evt)
+    ...
+    for evt in coalescer.flush():      # periodically / on shutdown
+        export_to_adaptive_core(evt)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .adaptive_event import AdaptiveEvent, ns_to_datetime
+
+CoalesceKey = Tuple[str, str, Optional[int]]
+
+
+class CoalescedAdaptiveEvent(AdaptiveEvent):
+    """
+    AdaptiveEvent standing for `count` coalesced detections.
+
+    `severity` is the maximum severity seen, `created_at` the last
+    detection and `first_seen_ns` the first; other fields come from the
+    most recent detection. `to_dict()` / `to_json()` add `count`,
+    `first_seen` and `last_seen`.
+    """
+
+    __slots__ = ("count", "first_seen_ns")
+    _FIELDS = AdaptiveEvent._FIELDS + __slots__
+
+    def __init__(self, *args: Any, count: int = 1, first_seen_ns: int = 0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.count = count
+        self.first_seen_ns = first_seen_ns or self.created_at_ns
+
+    @property
+    def first_seen(self) -> datetime:
+        return ns_to_datetime(self.first_seen_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = super().to_dict()
+        d["count"] = self.count
+        d["first_seen"] = self.first_seen
+        d["last_seen"] = self.created_at
+        return d
+
+
+class _KeyState:
+    __slots__ = ("tokens", "refilled_at", "count", "max_severity", "first_ns", "last")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.tokens = tokens
+        self.refilled_at = now
+        self.count = 0
+        self.max_severity = 0.0
+        self.first_ns = 0
+        self.last: Optional[AdaptiveEvent] = None
+
+    def add(self, event: AdaptiveEvent) -> None:
+        if self.count == 0:
+            self.first_ns = event.created_at_ns
+            self.max_severity = event.severity
+        else:
+            self.max_severity = max(self.max_severity, event.severity)
+        self.count += 1
+        self.last = event
+
+    def take(self) -> CoalescedAdaptiveEvent:
+        last = self.last
+        assert last is not None
+        out = CoalescedAdaptiveEvent(
+            layer=last.layer,
+            anomaly_type=last.anomaly_type,
+            severity=self.max_severity,
+            qri_before=last.qri_before,
+            qri_after=last.qri_after,
+            block_height=last.block_height,
+            txid=last.txid,
+            was_mitigated=last.was_mitigated,
+            details=last.details,
+            created_at_ns=last.created_at_ns,
+            count=self.count,
+            first_seen_ns=self.first_ns,
+        )
+        self.count = 0
+        self.last = None
+        return out
+
+
+class AnomalyCoalescer:
+    """
+    Per-key token bucket + aggregation with a bounded key table.
+
+    - `rate` tokens/second per key, bucket depth `burst`
+    - at most `max_keys` keys are tracked (LRU); an evicted key's pending
+      aggregate is returned immediately so nothing is lost silently
+    - thread-safe
+
+    Counters: passed, coalesced (events folded into aggregates),
+    aggregates (aggregate events released), evicted_keys.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 5,
+        *,
+        height_bucket: int = 1,
+        max_keys: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1 or height_bucket < 1 or max_keys < 1:
+            raise ValueError("rate > 0, burst >= 1, height_bucket >= 1 and max_keys >= 1 required")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.height_bucket = height_bucket
+        self.max_keys = max_keys
+        self._clock = clock
+
+        self._keys: "OrderedDict[Hashable, _KeyState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.passed = 0
+        self.coalesced = 0
+        self.aggregates = 0
+        self.evicted_keys = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def key_for(self, event: AdaptiveEvent) -> CoalesceKey:
+        height = event.block_height
+        bucket = None if height is None else height // self.height_bucket
+        return (event.layer, event.anomaly_type, bucket)
+
+    def _refill(self, state: _KeyState, now: float) -> None:
+        state.tokens = min(self.burst, state.tokens + (now - state.refilled_at) * self.rate)
+        state.refilled_at = now
+
+    def offer(self, event: AdaptiveEvent) -> List[AdaptiveEvent]:
+        """
+        Submit one detection; returns the events to forward now (possibly
+        none, the event itself, or an aggregate ending with it).
+        """
+        now = self._clock()
+        out: List[AdaptiveEvent] = []
+        key = self.key_for(event)
+
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                state = _KeyState(self.burst, now)
+                self._keys[key] = state
+                while len(self._keys) > self.max_keys:
+                    _, evicted = self._keys.popitem(last=False)
+                    self.evicted_keys += 1
+                    if evicted.count:
+                        out.append(evicted.take())
+                        self.aggregates += 1
+            else:
+                self._keys.move_to_end(key)
+                self._refill(state, now)
+
+            if state.tokens >= 1.0:
+                state.tokens -= 1.0
+                if state.count:
+                    state.add(event)
+                    out.append(state.take())
+                    self.aggregates += 1
+                else:
+                    out.append(event)
+                    self.passed += 1
+            else:
+                state.add(event)
+                self.coalesced += 1
+        return out
+
+    def flush(self, force: bool = False) -> List[AdaptiveEvent]:
+        """
+        Release pending aggregates whose key has a token again (all of them
+        with `force=True`, e.g. on shutdown). Keys with nothing pending and a
+        full bucket are forgotten.
+        """
+        now = self._clock()
+        out: List[AdaptiveEvent] = []
+        with self._lock:
+            for key in list(self._keys):
+                state = self._keys[key]
+                self._refill(state, now)
+                if state.count and (force or state.tokens >= 1.0):
+                    state.tokens = max(0.0, state.tokens - 1.0)
+                    out.append(state.take())
+                    self.aggregates += 1
+                elif not state.count and state.tokens >= self.burst:
+                    del self._keys[key]
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._keys),
+            "passed": self.passed,
+            "coalesced": self.coalesced,
+            "aggregates": self.aggregates,
+            "evicted_keys": self.evicted_keys,
+        }
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 from .config import CircuitBreakerThresholds, SentinelConfig
-from .model_loader import LoadedModel, load_and_verify_model
+from .inference_cache import InferenceCache
+from .model_loader import (
+    LoadedModel,
+    ModelEnsemble,
+    ModelVerificationError,
+    load_model_ensemble,
+)
+from .model_manager import ModelManager
 from .v3 import SentinelV3
 
 
@@ -14,7 +22,15 @@ from .v3 import SentinelV3
 
 # Default v3 evaluator for Adaptive Core integration.
 # Deterministic: fixed thresholds defaults, no optional model.
-_DEFAULT_V3 = SentinelV3(thresholds=CircuitBreakerThresholds(), model=None)
+# Built on first use so importing this module stays cheap.
+_DEFAULT_V3: SentinelV3 | None = None
+
+
+def _default_v3() -> SentinelV3:
+    global _DEFAULT_V3
+    if _DEFAULT_V3 is None:
+        _DEFAULT_V3 = SentinelV3(thresholds=CircuitBreakerThresholds(), model=None)
+    return _DEFAULT_V3
 
 
 def evaluate_v3(request: Dict[str, Any]) -> Dict[str, Any]:
@@ -28,7 +44,7 @@ def evaluate_v3(request: Dict[str, Any]) -> Dict[str, Any]:
     - Output: Shield Contract v3 response dict
     - Fail-closed by design
     """
-    return _DEFAULT_V3.evaluate(request)
+    return _default_v3().evaluate(request)
 
 
 # -----------------------------
@@ -57,28 +73,118 @@ class SentinelClient:
         self._thresholds: CircuitBreakerThresholds = config.circuit_breakers
 
         # Model is optional – if file or hash not provided, we simply skip loading.
-        self._model: LoadedModel | None = None
+        # A missing or mismatching model file leaves the manager without a model
+        # (compatibility behavior: continue using non-ML signals only).
+        #
+        # Construction is deferred: the model is read and hashed on the first
+        # evaluation or on an explicit warmup(), not here.
+        self._model_manager: ModelManager | None = None
         if config.model_path:
-            try:
-                self._model = load_and_verify_model(
-                    model_path=config.model_path,
-                    expected_hash=config.model_hash,
-                )
-            except Exception:
-                # Compatibility behavior: continue using non-ML signals only.
-                self._model = None
-
-        # v3 evaluator (internal)
-        self._v3 = SentinelV3(thresholds=self._thresholds, model=self._model)
+            self._model_manager = ModelManager(
+                config.model_path,
+                expected_hash=config.model_hash,
+                load_initial=False,
+            )
 
-    def evaluate_snapshot(self, raw_telemetry: Dict[str, Any]) -> SentinelResult:
+        self._ensemble: ModelEnsemble | None = None
+        self._model: LoadedModel | ModelEnsemble | None = None
+        self._warm = False
+        self._warmup_lock = threading.Lock()
+
+        # Optional inference memo shared by every evaluator this client builds
+        self._inference_cache: InferenceCache | None = None
+        if config.inference_cache_size > 0:
+            self._inference_cache = InferenceCache(
+                max_entries=config.inference_cache_size,
+                quantum=config.inference_cache_quantum,
+            )
+
+        # v3 evaluator (internal); rebound once the model is loaded
+        self._v3 = self._build_v3(None)
+
+    def _build_v3(self, model: LoadedModel | ModelEnsemble | None) -> SentinelV3:
+        return SentinelV3(
+            thresholds=self._thresholds,
+            model=model,
+            inference_cache=self._inference_cache,
+        )
+
+    @property
+    def inference_cache(self) -> InferenceCache | None:
+        """Inference memo (None unless `inference_cache_size` > 0)."""
+        return self._inference_cache
+
+    def warmup(self) -> None:
         """
-        Evaluate a single telemetry snapshot and return a compact public result.
+        Load and verify the model now (instead of on the first evaluation)
+        and start the hot-reload poller if configured. Idempotent.
 
-        NOTE: v2 public API preserved.
-        Internally routes through Shield Contract v3 evaluator (adapter).
+        Thread-safe: concurrent first evaluations wait for the one warmup in
+        progress, so none of them runs without the configured model.
+        """
+        if self._warm:
+            return
+        with self._warmup_lock:
+            if self._warm:
+                return
+            if self._config.model_ensemble:
+                try:
+                    self._ensemble = load_model_ensemble(
+                        self._config.model_ensemble,
+                        exit_score=self._config.ensemble_exit_score,
+                    )
+                except (ModelVerificationError, OSError):
+                    # Compatibility behavior: fall back to the single model / no model.
+                    self._ensemble = None
+            if self._model_manager is not None:
+                self._model_manager.ensure_loaded()
+                if self._config.model_reload_interval_seconds:
+                    self._model_manager.start(self._config.model_reload_interval_seconds)
+            # Only published once the model (if any) is in place.
+            self._warm = True
+
+    @property
+    def model_manager(self) -> ModelManager | None:
+        """Hot-reload manager for `config.model_path` (None if no model configured)."""
+        return self._model_manager
+
+    def _evaluator(self) -> SentinelV3:
+        """
+        Return the v3 evaluator bound to the currently active model.
+
+        After a hot reload a new (frozen) SentinelV3 is built and published with
+        a single attribute assignment; requests already holding the previous
+        evaluator finish on the previous model.
         """
-        request_v3 = {
+        if not self._warm:
+            self.warmup()
+
+        v3 = self._v3
+        if self._ensemble is not None:
+            if v3.model is not self._ensemble:
+                v3 = self._build_v3(self._ensemble)
+                self._model = self._ensemble
+                self._v3 = v3
+        elif self._model_manager is not None:
+            model = self._model_manager.current()
+            if model is not v3.model:
+                v3 = self._build_v3(model)
+                self._model = model
+                self._v3 = v3
+        return v3
+
+    def model_identity(self) -> str | None:
+        """
+        Hash of the model (or ensemble) evaluations currently run on; None
+        without a model. Changes when a hot reload swaps the model, so
+        callers caching results (e.g. SnapshotDeduplicator) can key on it.
+        """
+        model = self._evaluator().model
+        return None if model is None else model.hash
+
+    @staticmethod
+    def _v2_request(raw_telemetry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
             "contract_version": 3,
             "component": "sentinel",
             "request_id": "v2-evaluate_snapshot",
@@ -86,8 +192,8 @@ class SentinelClient:
             "constraints": {"fail_closed": True},
         }
 
-        response_v3 = self._v3.evaluate(request_v3)
-
+    @staticmethod
+    def _v2_result(response_v3: Dict[str, Any]) -> SentinelResult:
         # Fail-closed: if v3 errors, return a safe v2-shaped failure
         if response_v3.get("decision") == "ERROR":
             return SentinelResult(
@@ -107,3 +213,24 @@ class SentinelClient:
             risk_score=v2_risk_score,
             details=list(v2_details),
         )
+
+    def evaluate_snapshot(self, raw_telemetry: Dict[str, Any]) -> SentinelResult:
+        """
+        Evaluate a single telemetry snapshot and return a compact public result.
+
+        NOTE: v2 public API preserved.
+        Internally routes through Shield Contract v3 evaluator (adapter).
+        """
+        return self._v2_result(self._evaluator().evaluate(self._v2_request(raw_telemetry)))
+
+    def evaluate_snapshots(self, snapshots: Iterable[Dict[str, Any]]) -> List[SentinelResult]:
+        """
+        Evaluate a group of snapshots; results are in input order and equal
+        to calling `evaluate_snapshot` on each.
+
+        The evaluator (and so the model) is resolved once for the whole
+        group, so a hot reload never splits a batch across two models and
+        the per-call warmup / reload checks are paid once.
+        """
+        evaluate = self._evaluator().evaluate
+        return [self._v2_result(evaluate(self._v2_request(raw))) for raw in snapshots]
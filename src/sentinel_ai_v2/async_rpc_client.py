@@ -0,0 +1,221 @@
+"""
+asyncio JSON-RPC client for polling many DigiByte nodes concurrently.
+
+Built on stdlib asyncio streams (no extra dependency). Each client keeps a
+small pool of keep-alive HTTP/1.1 connections to its node; `poll_block_counts`
+fans out over a fleet with bounded concurrency, per-node timeouts and an
+optional overall deadline so one poll round fits a fixed wall-clock interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+_Conn = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncRpcClient:
+    """
+    Async counterpart of SimpleRpcClient.
+
+    - `max_connections` bounds concurrent requests (and open sockets) per node
+    - `timeout` is applied per call (connect + request + response)
+    - idle connections are reused; a connection that errors or times out is
+      closed, never returned to the pool
+    """
+
+    def __init__(
+        self,
+        url: str,
+        user: str,
+        password: str,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 2,
+    ) -> None:
+        parts = urlsplit(url)
+        self.url = url
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path = parts.path or "/"
+        self._ssl = parts.scheme == "https"
+        self.timeout = timeout
+
+        token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+        self._header_tail = (
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Authorization: Basic {token}\r\n"
+            "Content-Type: application/json\r\n"
+            "Connection: keep-alive\r\n"
+        ).encode("latin-1")
+        self._request_line = f"POST {self.path} HTTP/1.1\r\n".encode("latin-1")
+
+        self._idle: List[_Conn] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self.connections_opened = 0
+
+    # ------------------------------------------------------------------ #
+    # Connection pool
+    # ------------------------------------------------------------------ #
+
+    async def _acquire(self) -> _Conn:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        self.connections_opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self._ssl or None)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:  # pragma: no cover – peer already gone
+                pass
+
+    async def __aenter__(self) -> "AsyncRpcClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------ #
+    # HTTP
+    # ------------------------------------------------------------------ #
+
+    async def _roundtrip(self, conn: _Conn, body: bytes) -> Tuple[int, bytes, bool]:
+        reader, writer = conn
+        writer.write(
+            self._request_line
+            + self._header_tail
+            + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by node")
+        status = int(status_line.split()[1])
+
+        length = 0
+        keep_alive = True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value.strip())
+            elif name == "connection" and value.strip().lower() == "close":
+                keep_alive = False
+
+        data = await reader.readexactly(length)
+        return status, data, keep_alive
+
+    async def _request(self, body: bytes) -> Any:
+        async with self._slots:
+            conn = await self._acquire()
+            try:
+                status, data, keep_alive = await self._roundtrip(conn, body)
+            except BaseException:
+                # Includes CancelledError from wait_for(): connection state unknown.
+                conn[1].close()
+                raise
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                conn[1].close()
+
+        if status >= 400 and not data:
+            raise RuntimeError(f"HTTP {status}")
+        return json.loads(data)
+
+    # ------------------------------------------------------------------ #
+    # JSON-RPC
+    # ------------------------------------------------------------------ #
+
+    async def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        body = json.dumps(
+            {"jsonrpc": "1.0", "id": "sentinel", "method": method, "params": params or []},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        data = await asyncio.wait_for(self._request(body), self.timeout)
+        if data.get("error"):
+            raise RuntimeError(data["error"])
+        return data["result"]
+
+    async def get_block_count(self) -> int:
+        return int(await self.call("getblockcount"))
+
+
+@dataclass
+class NodePollResult:
+    """Outcome of polling one node in a fleet round."""
+
+    node: str
+    height: Optional[int]
+    error: Optional[str]
+    latency_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def poll_block_counts(
+    clients: Mapping[str, AsyncRpcClient],
+    *,
+    concurrency: int = 64,
+    deadline_seconds: Optional[float] = None,
+) -> Dict[str, NodePollResult]:
+    """
+    Fetch `getblockcount` from every node with at most `concurrency` requests
+    in flight.
+
+    Per-node timeouts come from each client. With `deadline_seconds`, nodes
+    that have not answered when the deadline passes are cancelled and
+    reported with error "deadline" so the round always ends on time.
+    """
+    gate = asyncio.Semaphore(concurrency)
+
+    async def _one(name: str, client: AsyncRpcClient) -> NodePollResult:
+        async with gate:
+            t0 = time.perf_counter()
+            try:
+                height = await client.get_block_count()
+                err = None
+            except asyncio.TimeoutError:
+                height, err = None, "timeout"
+            except (OSError, RuntimeError, ValueError) as exc:
+                height, err = None, f"{type(exc).__name__}: {exc}"
+            return NodePollResult(name, height, err, (time.perf_counter() - t0) * 1000.0)
+
+    tasks = {asyncio.ensure_future(_one(n, c)): n for n, c in clients.items()}
+    if not tasks:
+        return {}
+
+    done, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: Dict[str, NodePollResult] = {}
+    for task, name in tasks.items():
+        if task in done:
+            results[name] = task.result()
+        else:
+            results[name] = NodePollResult(name, None, "deadline", (deadline_seconds or 0.0) * 1000.0)
+    return results
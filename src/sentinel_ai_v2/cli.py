@@ -5,7 +5,9 @@ import json
 import sys
 from typing import Any, Dict
 
-from .wrapper.sentinel_wrapper import SentinelWrapper
+# Resolved on first use by _cmd_snapshot so light commands (e.g. `version`)
+# do not import the evaluation stack.
+SentinelWrapper: Any = None
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -69,8 +71,17 @@ def _load_snapshot(path: str) -> Dict[str, Any]:
     return data
 
 
+def _wrapper_cls() -> Any:
+    global SentinelWrapper
+    if SentinelWrapper is None:
+        from .wrapper.sentinel_wrapper import SentinelWrapper as _SentinelWrapper
+
+        SentinelWrapper = _SentinelWrapper
+    return SentinelWrapper
+
+
 def _cmd_snapshot(args: argparse.Namespace) -> int:
-    wrapper = SentinelWrapper()
+    wrapper = _wrapper_cls()()
     snapshot = _load_snapshot(args.file)
     result = wrapper.evaluate(snapshot)
 
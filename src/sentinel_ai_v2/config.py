@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 @dataclass
@@ -21,6 +21,19 @@ class SentinelConfig:
     model_path: str = "models/sentinel_v2.onnx"
     model_hash: str | None = None
     model_signature_path: str | None = None
+    # Poll interval for hot-reloading `model_path`; None disables reloading.
+    model_reload_interval_seconds: float | None = None
+
+    # Optional ordered ensemble of (model_path, model_hash); takes precedence
+    # over `model_path` when non-empty.
+    model_ensemble: List[Tuple[str, str | None]] = field(default_factory=list)
+    # Running-max score at which ensemble evaluation stops early.
+    ensemble_exit_score: float = 1.0
+
+    # Bounded LRU memo in front of model inference; 0 disables it.
+    inference_cache_size: int = 0
+    # Optional quantization step for cache keys (None = exact feature values).
+    inference_cache_quantum: float | None = None
 
     circuit_breakers: CircuitBreakerThresholds = field(
         default_factory=CircuitBreakerThresholds
@@ -0,0 +1,146 @@
+"""
+Largest-Triangle-Three-Buckets (LTTB) downsampling for chart series.
+
+`lttb_stream` is single-pass: it needs the item count up front (a stored
+series always knows it) and holds only two buckets in memory, so millions of
+samples can be reduced straight from a memory-mapped store.
+
+Points matching `keep` (e.g. stalled block-progress samples) are never lost
+entirely: in every bucket the first and last such point are emitted next to
+the LTTB pick, so output stays bounded by 3 * threshold.
+"""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+_first = itemgetter(0)
+_second = itemgetter(1)
+
+
+def lttb_stream(
+    items: Iterable[T],
+    total: int,
+    threshold: int,
+    *,
+    x: Callable[[T], float] = _first,
+    y: Callable[[T], float] = _second,
+    keep: Optional[Callable[[T], bool]] = None,
+) -> Iterator[T]:
+    """
+    Yield at most `threshold` items of `items` (plus `keep` markers) chosen
+    by LTTB, in input order. `total` must equal the number of items.
+    """
+    if threshold < 3:
+        raise ValueError("threshold must be >= 3")
+
+    it = iter(items)
+    if total <= threshold:
+        yield from it
+        return
+
+    every = (total - 2) / (threshold - 2)
+    n_buckets = threshold - 2
+    pos = 0
+
+    def _take(bucket: int) -> List[Tuple[int, float, float, T]]:
+        nonlocal pos
+        end = total - 1 if bucket == n_buckets - 1 else int((bucket + 1) * every) + 1
+        out = []
+        while pos < end:
+            try:
+                item = next(it)
+            except StopIteration:
+                raise ValueError("items ended before total was reached") from None
+            out.append((pos, float(x(item)), float(y(item)), item))
+            pos += 1
+        return out
+
+    def _next_item() -> T:
+        nonlocal pos
+        try:
+            item = next(it)
+        except StopIteration:
+            raise ValueError("items ended before total was reached") from None
+        pos += 1
+        return item
+
+    first = _next_item()
+    yield first
+    a_x, a_y = float(x(first)), float(y(first))
+
+    current = _take(0)
+    last: Any = None
+    for bucket in range(n_buckets):
+        if bucket + 1 < n_buckets:
+            following = _take(bucket + 1)
+            c_x = sum(p[1] for p in following) / len(following)
+            c_y = sum(p[2] for p in following) / len(following)
+        else:
+            following = []
+            last = _next_item()
+            c_x, c_y = float(x(last)), float(y(last))
+
+        best = current[0]
+        best_area = -1.0
+        for p in current:
+            # Twice the triangle area; the constant factor does not change the argmax.
+            area = abs((a_x - c_x) * (p[2] - a_y) - (a_x - p[1]) * (c_y - a_y))
+            if area > best_area:
+                best, best_area = p, area
+
+        picks = {best[0]: best}
+        if keep is not None:
+            marked = [p for p in current if keep(p[3])]
+            if marked:
+                picks[marked[0][0]] = marked[0]
+                picks[marked[-1][0]] = marked[-1]
+        for idx in sorted(picks):
+            yield picks[idx][3]
+
+        a_x, a_y = best[1], best[2]
+        current = following
+
+    yield last
+
+
+def lttb(
+    items: Sequence[T],
+    threshold: int,
+    *,
+    x: Callable[[T], float] = _first,
+    y: Callable[[T], float] = _second,
+    keep: Optional[Callable[[T], bool]] = None,
+) -> List[T]:
+    """List form of `lttb_stream` for in-memory sequences."""
+    return list(lttb_stream(items, len(items), threshold, x=x, y=y, keep=keep))
+
+
+def downsample_block_progress(
+    reader: Any,
+    threshold: int,
+    start: Union[float, Any, None] = None,
+    end: Union[float, Any, None] = None,
+) -> List[Tuple[float, int, int, int, int]]:
+    """
+    Downsample a BlockProgressReader time window to roughly `threshold`
+    raw records (timestamp, height, ...), keeping stalled samples visible.
+
+    Usage:
+        with BlockProgressReader("block_progress.sbps") as history:
+            points = downsample_block_progress(history, 2000)
+    """
+    lo, hi = reader.span(start, end)
+    return list(
+        lttb_stream(
+            reader.range(start, end),
+            hi - lo,
+            threshold,
+            x=_first,
+            y=_second,
+            keep=lambda r: r[4] != 0,  # status code: 0 = ok, otherwise stalled
+        )
+    )
@@ -11,28 +11,27 @@ def aggregate_risk(features: Dict[str, Any]) -> float:
     Returns a final risk score between 0.0 and 1.0.
     """
 
-    # 1. Run all threat models
-    model_scores = []
-    for model in THREAT_MODELS:
-        score = model.evaluate(features)
-        model_scores.append(score)
-
-    # 2. Base risk from models
-    combined = max(model_scores)
-
-    # 3. AI model contribution (optional)
+    # 1. AI model contribution (optional) seeds the running max
+    combined = 0.0
     ai_signal = features.get("model_score")
     if ai_signal is not None:
-        combined = max(combined, ai_signal)
+        combined = ai_signal
+
+    # 2. Base risk from threat models; a max cannot go down, so once it hits
+    #    the 1.0 ceiling the remaining models cannot change the outcome.
+    for model in THREAT_MODELS:
+        if combined >= 1.0:
+            break
+        combined = max(combined, model.evaluate(features))
 
-    # 4. Hard anomaly boost for catastrophic markers
+    # 3. Hard anomaly boost for catastrophic markers
     if features.get("reorg_depth", 0) >= 5:
         combined = 1.0
 
     if features.get("entropy_drop", 0) > 0.75:
         combined = 1.0
 
-    # 5. Final normalization
+    # 4. Final normalization
     return min(combined, 1.0)
 
 
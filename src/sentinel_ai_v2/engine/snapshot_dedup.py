@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from ..api import SentinelResult
+
+Snapshot = Dict[str, Any]
+
+REEMIT = "reemit"      # hand the previous result to the handler again
+SUPPRESS = "suppress"  # do not call the handler for unchanged snapshots
+DEDUP_MODES = (REEMIT, SUPPRESS)
+
+
+def _single_source(snapshot: Snapshot) -> Hashable:
+    return None
+
+
+class SnapshotDeduplicator:
+    """
+    Skip evaluation of telemetry snapshots identical to the previous one
+    from the same source.
+
+    A snapshot's fingerprint is a 128-bit BLAKE2b digest of its canonical
+    JSON bytes (sorted keys, compact separators, UTF-8 – the same encoding
+    as the v3 context hash), minus top-level `ignore_keys` such as a
+    collection timestamp. `key(snapshot)` names the source (default: one
+    source for the whole stream). For each source the last fingerprint and
+    result are kept (LRU, at most `max_sources`).
+
+    When a snapshot matches its source's last fingerprint, evaluation is
+    skipped and the previous result is re-emitted (`mode="reemit"`) or
+    dropped (`mode="suppress"`, the caller sees None). Evaluation is forced
+    again once the cached result is older than `max_age_seconds`, or after
+    `invalidate()`.
+
+    Cached results belong to the model that produced them: each entry keeps
+    `model_identity()` as of its evaluation and is a miss once the identity
+    changes (e.g. after a hot reload). `watch_stream` / `watch_stream_async`
+    pass `SentinelClient.model_identity` automatically.
+
+    Counters (see `stats()`): snapshots, evaluated, skipped (reemitted +
+    suppressed), unhashable, evaluate_seconds and saved_seconds (skipped x
+    mean evaluation time).
+
+    Usage:
+        dedup = SnapshotDeduplicator(key=lambda s: s.get("node"), ignore_keys=("ts",))
+        watch_stream(source, client, handler, dedup=dedup)
+        dedup.stats()["skipped"]
+    """
+
+    def __init__(
+        self,
+        mode: str = REEMIT,
+        *,
+        key: Optional[Callable[[Snapshot], Hashable]] = None,
+        ignore_keys: Iterable[str] = (),
+        max_sources: int = 4096,
+        max_age_seconds: Optional[float] = None,
+        model_identity: Optional[Callable[[], Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"mode must be one of {DEDUP_MODES}")
+        if max_sources < 1:
+            raise ValueError("max_sources must be >= 1")
+        self.mode = mode
+        self.key = key or _single_source
+        self.ignore_keys = frozenset(ignore_keys)
+        self.max_sources = max_sources
+        self.max_age_seconds = max_age_seconds
+        self.model_identity = model_identity
+        self._clock = clock
+
+        # source -> (fingerprint, result, evaluated_at, model identity)
+        self._last: "OrderedDict[Hashable, Tuple[bytes, SentinelResult, float, Hashable]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.snapshots = 0
+        self.evaluated = 0
+        self.reemitted = 0
+        self.suppressed = 0
+        self.unhashable = 0
+        self.evaluate_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._last)
+
+    def fingerprint(self, snapshot: Snapshot) -> Optional[bytes]:
+        """Digest of the canonical snapshot bytes; None if not JSON-encodable."""
+        if self.ignore_keys:
+            snapshot = {k: v for k, v in snapshot.items() if k not in self.ignore_keys}
+        try:
+            raw = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def invalidate(self) -> None:
+        """Forget all fingerprints; the next snapshot of every source is evaluated."""
+        with self._lock:
+            self._last.clear()
+
+    # ------------------------------------------------------------------ #
+    # Evaluation
+    # ------------------------------------------------------------------ #
+
+    def _model(self, model_identity: Optional[Callable[[], Hashable]]) -> Hashable:
+        identity = model_identity or self.model_identity
+        return None if identity is None else identity()
+
+    def _cached(
+        self, source: Hashable, fp: Optional[bytes], now: float, model: Hashable
+    ) -> Optional[SentinelResult]:
+        # caller holds the lock
+        entry = self._last.get(source)
+        if fp is None or entry is None or entry[0] != fp or entry[3] != model:
+            return None
+        if self.max_age_seconds is not None and now - entry[2] >= self.max_age_seconds:
+            return None
+        self._last.move_to_end(source)
+        return entry[1]
+
+    def _hit(self, result: SentinelResult) -> Optional[SentinelResult]:
+        # caller holds the lock
+        if self.mode == REEMIT:
+            self.reemitted += 1
+            return result
+        self.suppressed += 1
+        return None
+
+    def _store(
+        self, source: Hashable, fp: Optional[bytes], result: SentinelResult, now: float, model: Hashable
+    ) -> None:
+        # caller holds the lock
+        if fp is None:
+            self._last.pop(source, None)
+            return
+        self._last[source] = (fp, result, now, model)
+        self._last.move_to_end(source)
+        while len(self._last) > self.max_sources:
+            self._last.popitem(last=False)
+
+    def evaluate(
+        self,
+        snapshot: Snapshot,
+        evaluate: Callable[[Snapshot], SentinelResult],
+        *,
+        model_identity: Optional[Callable[[], Hashable]] = None,
+    ) -> Optional[SentinelResult]:
+        """
+        Return `evaluate(snapshot)`, or – for an unchanged snapshot – the
+        previous result (reemit) / None (suppress) without evaluating.
+        `model_identity` overrides the constructor's for this call.
+        """
+        source = self.key(snapshot)
+        fp = self.fingerprint(snapshot)
+        now = self._clock()
+        # Read before evaluating: a reload racing the evaluation can only
+        # cause an extra miss later, never a stale hit.
+        model = self._model(model_identity)
+        with self._lock:
+            self.snapshots += 1
+            if fp is None:
+                self.unhashable += 1
+            cached = self._cached(source, fp, now, model)
+            if cached is not None:
+                return self._hit(cached)
+
+        t0 = time.perf_counter()
+        result = evaluate(snapshot)
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self.evaluated += 1
+            self.evaluate_seconds += elapsed
+            self._store(source, fp, result, now, model)
+        return result
+
+    def evaluate_batch(
+        self,
+        snapshots: Sequence[Snapshot],
+        evaluate_many: Callable[[List[Snapshot]], List[SentinelResult]],
+        *,
+        model_identity: Optional[Callable[[], Hashable]] = None,
+    ) -> List[Optional[SentinelResult]]:
+        """
+        Batch form of `evaluate`: only changed snapshots are passed to
+        `evaluate_many` (in one call). A snapshot is compared with the one
+        before it from the same source, including earlier ones in the batch.
+        """
+        n = len(snapshots)
+        out: List[Optional[SentinelResult]] = [None] * n
+        hits: List[int] = []
+        alias: Dict[int, int] = {}  # duplicate index -> index of the evaluated original
+        todo: List[int] = []
+        pending: Dict[Hashable, Tuple[Optional[bytes], int]] = {}  # source -> last miss in batch
+        sources: List[Hashable] = []
+        prints: List[Optional[bytes]] = []
+        now = self._clock()
+        model = self._model(model_identity)
+
+        for snapshot in snapshots:
+            sources.append(self.key(snapshot))
+            prints.append(self.fingerprint(snapshot))
+
+        with self._lock:
+            for i in range(n):
+                source, fp = sources[i], prints[i]
+                self.snapshots += 1
+                if fp is None:
+                    self.unhashable += 1
+                before = pending.get(source)
+                if before is not None:
+                    if fp is not None and before[0] == fp:
+                        alias[i] = before[1]
+                        hits.append(i)
+                        continue
+                else:
+                    cached = self._cached(source, fp, now, model)
+                    if cached is not None:
+                        out[i] = cached
+                        hits.append(i)
+                        continue
+                pending[source] = (fp, i)
+                todo.append(i)
+
+        results: List[SentinelResult] = []
+        elapsed = 0.0
+        if todo:
+            t0 = time.perf_counter()
+            results = evaluate_many([snapshots[i] for i in todo])
+            elapsed = time.perf_counter() - t0
+        for i, result in zip(todo, results):
+            out[i] = result
+        for i, j in alias.items():
+            out[i] = out[j]
+
+        with self._lock:
+            self.evaluated += len(todo)
+            self.evaluate_seconds += elapsed
+            for source, (fp, j) in pending.items():
+                self._store(source, fp, out[j], now, model)  # type: ignore[arg-type]
+            for i in hits:
+                out[i] = self._hit(out[i])  # type: ignore[arg-type]
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            skipped = self.reemitted + self.suppressed
+            mean = self.evaluate_seconds / self.evaluated if self.evaluated else 0.0
+            return {
+                "sources": len(self._last),
+                "snapshots": self.snapshots,
+                "evaluated": self.evaluated,
+                "skipped": skipped,
+                "reemitted": self.reemitted,
+                "suppressed": self.suppressed,
+                "unhashable": self.unhashable,
+                "skip_ratio": skipped / self.snapshots if self.snapshots else 0.0,
+                "evaluate_seconds": self.evaluate_seconds,
+                "saved_seconds": skipped * mean,
+            }
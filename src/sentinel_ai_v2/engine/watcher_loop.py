@@ -1,13 +1,43 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, Optional
+import asyncio
+import functools
+import inspect
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..api import SentinelClient, SentinelResult
 from ..config import load_config
+from .snapshot_dedup import SnapshotDeduplicator
 
 
 TelemetrySource = Iterable[Dict[str, Any]]
 ResultHandler = Callable[[SentinelResult], None]
+BatchResultHandler = Callable[[List[SentinelResult]], None]
+AsyncTelemetrySource = AsyncIterable[Dict[str, Any]]
+AsyncResultHandler = Callable[[SentinelResult], Union[Awaitable[None], None]]
+
+# How often blocked pipeline stages re-check for shutdown (seconds).
+_POLL_SECONDS = 0.05
+_DONE = object()
 
 
 def build_default_client() -> SentinelClient:
@@ -32,23 +62,641 @@ def default_print_handler(result: SentinelResult) -> None:
     )
 
 
+# ---------------------------------------------------------------------- #
+# Stage metrics
+# ---------------------------------------------------------------------- #
+
+
+@dataclass
+class StageStats:
+    """
+    Time accounting for one stage of `watch_stream`.
+
+    - busy_seconds     doing the stage's own work (summed over workers)
+    - idle_seconds     waiting for input from the previous stage
+    - blocked_seconds  waiting for room in the next stage (backpressure)
+    - utilization      busy_seconds / (wall_seconds * workers)
+    """
+    name: str
+    workers: int = 1
+    items: int = 0
+    busy_seconds: float = 0.0
+    idle_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    utilization: float = 0.0
+
+    def _merge(self, items: int, busy: float, idle: float, blocked: float) -> None:
+        self.items += items
+        self.busy_seconds += busy
+        self.idle_seconds += idle
+        self.blocked_seconds += blocked
+
+
+@dataclass
+class WatchStats:
+    """What one `watch_stream` run did, per stage."""
+    mode: str  # "sequential", "pipelined" or "async"
+    wall_seconds: float = 0.0
+    source: StageStats = field(default_factory=lambda: StageStats("source"))
+    evaluate: StageStats = field(default_factory=lambda: StageStats("evaluate"))
+    handle: StageStats = field(default_factory=lambda: StageStats("handle"))
+    # Largest number of results held back to restore source order.
+    max_reorder_buffer: int = 0
+    # Micro-batching only; stage `items` then count batches, not snapshots.
+    batches: int = 0
+    batched_snapshots: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.batched_snapshots / self.batches if self.batches else 0.0
+
+    def _finish(self, started: float) -> None:
+        self.wall_seconds = time.perf_counter() - started
+        for stage in (self.source, self.evaluate, self.handle):
+            if self.wall_seconds > 0:
+                stage.utilization = stage.busy_seconds / (self.wall_seconds * stage.workers)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------- #
+# Pipeline plumbing
+# ---------------------------------------------------------------------- #
+
+
+class _Stopped(Exception):
+    """Raised inside pipeline stages once another stage has failed."""
+
+
+def _put(q: "queue.Queue[Any]", item: Any, stop: threading.Event) -> float:
+    """Put with shutdown checks; returns seconds spent waiting."""
+    t0 = time.perf_counter()
+    while True:
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return time.perf_counter() - t0
+        except queue.Full:
+            if stop.is_set():
+                raise _Stopped
+
+
+def _get(q: "queue.Queue[Any]", stop: threading.Event) -> Tuple[Any, float]:
+    """Get with shutdown checks; returns (item, seconds spent waiting)."""
+    t0 = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _Stopped
+        try:
+            item = q.get(timeout=_POLL_SECONDS)
+            return item, time.perf_counter() - t0
+        except queue.Empty:
+            pass
+
+
+def _acquire(sem: threading.Semaphore, stop: threading.Event) -> float:
+    t0 = time.perf_counter()
+    while not sem.acquire(timeout=_POLL_SECONDS):
+        if stop.is_set():
+            raise _Stopped
+    return time.perf_counter() - t0
+
+
+class _SourceFailed:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def _micro_batches(
+    source: TelemetrySource, size: int, timeout_seconds: float
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Group `source` into lists of up to `size` snapshots, closing a group
+    early once `timeout_seconds` have passed since its first snapshot.
+
+    The source is read on a helper thread so a group can be closed while the
+    source is blocked waiting for its next item.
+    """
+    q: "queue.Queue[Any]" = queue.Queue(size * 2)
+    stop = threading.Event()
+
+    def feed() -> None:
+        try:
+            for snapshot in source:
+                _put(q, snapshot, stop)
+            _put(q, _DONE, stop)
+        except _Stopped:
+            pass
+        except BaseException as exc:  # noqa: BLE001 – re-raised by the consumer
+            try:
+                _put(q, _SourceFailed(exc), stop)
+            except _Stopped:
+                pass
+
+    threading.Thread(target=feed, name="sentinel-watch-batcher", daemon=True).start()
+    batch: List[Dict[str, Any]] = []
+    deadline = 0.0
+    try:
+        while True:
+            try:
+                if batch:
+                    item = q.get(timeout=max(0.0, deadline - time.monotonic()))
+                else:
+                    item = q.get()
+            except queue.Empty:
+                yield batch
+                batch = []
+                continue
+            if item is _DONE or isinstance(item, _SourceFailed):
+                if batch:
+                    yield batch
+                if item is _DONE:
+                    return
+                raise item.exc
+            if not batch:
+                deadline = time.monotonic() + timeout_seconds
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    finally:
+        stop.set()
+
+
+def _run_pipeline(
+    source: Iterable[Any],
+    evaluate: Callable[[Any], Any],
+    handler: Callable[[Any], None],
+    *,
+    workers: int,
+    queue_size: int,
+    preserve_order: bool,
+    stats: WatchStats,
+) -> None:
+    """
+    source thread -> bounded queue -> `workers` evaluation threads ->
+    bounded queue -> handler (calling thread). Items are single snapshots
+    or, with micro-batching, lists of them.
+
+    An in-flight window of `2 * queue_size + workers` items, released as
+    results are handled, bounds the reorder buffer and carries a slow
+    handler's backpressure all the way back to the source. The first
+    exception raised by any stage stops the pipeline and is re-raised here.
+    """
+    q_in: "queue.Queue[Any]" = queue.Queue(queue_size)
+    q_out: "queue.Queue[Any]" = queue.Queue(queue_size)
+    window = threading.Semaphore(2 * queue_size + workers)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    lock = threading.Lock()
+
+    def fail(exc: BaseException) -> None:
+        with lock:
+            errors.append(exc)
+        stop.set()
+
+    def source_stage() -> None:
+        busy = blocked = 0.0
+        seq = 0
+        try:
+            it = iter(source)
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    snapshot = next(it)
+                except StopIteration:
+                    break
+                busy += time.perf_counter() - t0
+                blocked += _acquire(window, stop)
+                blocked += _put(q_in, (seq, snapshot), stop)
+                seq += 1
+            for _ in range(workers):
+                _put(q_in, _DONE, stop)
+        except _Stopped:
+            pass
+        except BaseException as exc:  # noqa: BLE001 – re-raised by the caller
+            fail(exc)
+        finally:
+            with lock:
+                stats.source._merge(seq, busy, 0.0, blocked)
+
+    def evaluate_stage() -> None:
+        items = 0
+        busy = idle = blocked = 0.0
+        try:
+            while True:
+                item, waited = _get(q_in, stop)
+                idle += waited
+                if item is _DONE:
+                    break
+                seq, snapshot = item
+                t0 = time.perf_counter()
+                result = evaluate(snapshot)
+                busy += time.perf_counter() - t0
+                items += 1
+                blocked += _put(q_out, (seq, result), stop)
+            _put(q_out, _DONE, stop)
+        except _Stopped:
+            pass
+        except BaseException as exc:  # noqa: BLE001 – re-raised by the caller
+            fail(exc)
+        finally:
+            with lock:
+                stats.evaluate._merge(items, busy, idle, blocked)
+
+    threads = [threading.Thread(target=source_stage, name="sentinel-watch-source", daemon=True)]
+    threads += [
+        threading.Thread(target=evaluate_stage, name=f"sentinel-watch-eval-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+
+    handled = 0
+    busy = idle = 0.0
+    pending: Dict[int, Any] = {}
+    next_seq = 0
+
+    def handle(result: Any) -> None:
+        nonlocal handled, busy
+        t0 = time.perf_counter()
+        handler(result)
+        busy += time.perf_counter() - t0
+        handled += 1
+        window.release()
+
+    try:
+        finished = 0
+        while finished < workers:
+            item, waited = _get(q_out, stop)
+            idle += waited
+            if item is _DONE:
+                finished += 1
+                continue
+            seq, result = item
+            if not preserve_order:
+                handle(result)
+                continue
+            pending[seq] = result
+            if len(pending) > stats.max_reorder_buffer:
+                stats.max_reorder_buffer = len(pending)
+            while next_seq in pending:
+                handle(pending.pop(next_seq))
+                next_seq += 1
+    except _Stopped:
+        pass
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+        stats.handle._merge(handled, busy, idle, 0.0)
+    if errors:
+        raise errors[0]
+
+
+# ---------------------------------------------------------------------- #
+# Entry point
+# ---------------------------------------------------------------------- #
+
+
+def _skipping_none(handler: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap `handler` so results suppressed by deduplication (None) are dropped."""
+
+    def deliver(result: Any) -> Any:
+        if result is not None:
+            return handler(result)
+        return None
+
+    return deliver
+
+
+def _batch_evaluator(client: SentinelClient) -> Callable[[List[Dict[str, Any]]], List[SentinelResult]]:
+    evaluate_many = getattr(client, "evaluate_snapshots", None)
+    if evaluate_many is not None:
+        return evaluate_many
+    return lambda batch: [client.evaluate_snapshot(s) for s in batch]
+
+
 def watch_stream(
     source: TelemetrySource,
     client: Optional[SentinelClient] = None,
     handler: Optional[ResultHandler] = None,
-) -> None:
+    *,
+    workers: int = 0,
+    queue_size: int = 64,
+    preserve_order: bool = True,
+    batch_size: int = 0,
+    batch_timeout_ms: float = 20.0,
+    batch_handler: Optional[BatchResultHandler] = None,
+    dedup: Optional[SnapshotDeduplicator] = None,
+) -> WatchStats:
     """
     Consume a stream of telemetry snapshots and feed them through Sentinel AI v2.
 
     - `source`  – iterable of dict telemetry snapshots
     - `client`  – optional pre-configured SentinelClient
     - `handler` – optional callback to process each SentinelResult
+
+    Pipelined mode (`workers >= 1`): the source, `workers` evaluation threads
+    and the handler run concurrently, connected by queues of `queue_size`
+    items, so a slow source or handler no longer idles evaluation. A full
+    queue blocks the stage feeding it (backpressure). With
+    `preserve_order=True` results reach the handler in source order;
+    otherwise in completion order. Exceptions from any stage stop the
+    stream and are raised here.
+
+    Evaluation is CPU-bound Python, so extra workers mostly help when the
+    evaluator releases the GIL (model inference) or stages block on I/O.
+
+    Micro-batching (`batch_size >= 1`, either mode): snapshots are grouped
+    until `batch_size` have arrived or `batch_timeout_ms` has passed since
+    the first one, then evaluated with `client.evaluate_snapshots`. Results
+    go to `batch_handler` as one list if given, else to `handler` one by
+    one. Each snapshot waits at most `batch_timeout_ms` for its group.
+
+    Change detection (`dedup=SnapshotDeduplicator(...)`): snapshots equal to
+    the previous one from the same source skip evaluation; the previous
+    result is re-emitted or the snapshot is suppressed, per the
+    deduplicator's mode. Cached results are keyed on the client's
+    `model_identity()`, so a model hot reload forces re-evaluation.
+    Savings are reported by `dedup.stats()`.
+
+    Returns per-stage WatchStats (items, busy/idle/blocked time, utilization).
     """
+    if workers < 0 or queue_size < 1 or batch_size < 0:
+        raise ValueError("workers and batch_size must be >= 0 and queue_size >= 1")
+    if batch_handler is not None and not batch_size:
+        raise ValueError("batch_handler requires batch_size >= 1")
     if client is None:
         client = build_default_client()
     if handler is None:
         handler = default_print_handler
 
-    for snapshot in source:
-        result = client.evaluate_snapshot(snapshot)
-        handler(result)
+    started = time.perf_counter()
+    stats = WatchStats(mode="pipelined" if workers else "sequential")
+
+    units: Iterable[Any] = source
+    evaluate: Callable[[Any], Any] = client.evaluate_snapshot
+    deliver: Callable[[Any], None] = _skipping_none(handler)
+    if batch_size:
+        units = _micro_batches(source, batch_size, batch_timeout_ms / 1000.0)
+        evaluate = _batch_evaluator(client)
+
+        def deliver(results: List[Optional[SentinelResult]]) -> None:
+            stats.batches += 1
+            stats.batched_snapshots += len(results)
+            kept = [r for r in results if r is not None]
+            if batch_handler is not None:
+                if kept:
+                    batch_handler(kept)
+            else:
+                for result in kept:
+                    handler(result)
+
+    if dedup is not None:
+        identity = dedup.model_identity or getattr(client, "model_identity", None)
+        if batch_size:
+            evaluate = functools.partial(
+                dedup.evaluate_batch, evaluate_many=evaluate, model_identity=identity
+            )
+        else:
+            evaluate = functools.partial(dedup.evaluate, evaluate=evaluate, model_identity=identity)
+
+    if workers == 0:
+        src_busy = eval_busy = handle_busy = 0.0
+        n = 0
+        it = iter(units)
+        try:
+            while True:
+                t0 = time.perf_counter()
+                try:
+                    unit = next(it)
+                except StopIteration:
+                    break
+                t1 = time.perf_counter()
+                result = evaluate(unit)
+                t2 = time.perf_counter()
+                deliver(result)
+                t3 = time.perf_counter()
+                src_busy += t1 - t0
+                eval_busy += t2 - t1
+                handle_busy += t3 - t2
+                n += 1
+        finally:
+            stats.source._merge(n, src_busy, 0.0, 0.0)
+            stats.evaluate._merge(n, eval_busy, 0.0, 0.0)
+            stats.handle._merge(n, handle_busy, 0.0, 0.0)
+            stats._finish(started)
+        return stats
+
+    # Load the model once up front rather than racing warmup() in the workers.
+    warmup = getattr(client, "warmup", None)
+    if warmup is not None:
+        warmup()
+
+    stats.evaluate.workers = workers
+    try:
+        _run_pipeline(
+            units,
+            evaluate,
+            deliver,
+            workers=workers,
+            queue_size=queue_size,
+            preserve_order=preserve_order,
+            stats=stats,
+        )
+    finally:
+        stats._finish(started)
+    return stats
+
+
+# ---------------------------------------------------------------------- #
+# asyncio entry point
+# ---------------------------------------------------------------------- #
+
+
+async def _anext_or_stop(it: AsyncIterator[Any], stop: Optional[asyncio.Event]) -> Any:
+    """Next item of `it`, or _DONE when it is exhausted or `stop` is set first."""
+    if stop is None:
+        try:
+            return await it.__anext__()
+        except StopAsyncIteration:
+            return _DONE
+    if stop.is_set():
+        return _DONE
+    nxt = asyncio.ensure_future(it.__anext__())
+    stopper = asyncio.ensure_future(stop.wait())
+    try:
+        done, _ = await asyncio.wait({nxt, stopper}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        stopper.cancel()
+    if nxt not in done:
+        nxt.cancel()
+        await asyncio.gather(nxt, return_exceptions=True)
+        return _DONE
+    try:
+        return nxt.result()
+    except StopAsyncIteration:
+        return _DONE
+
+
+async def watch_stream_async(
+    source: AsyncTelemetrySource,
+    client: Optional[SentinelClient] = None,
+    handler: Optional[AsyncResultHandler] = None,
+    *,
+    max_in_flight: int = 8,
+    executor: Optional[Executor] = None,
+    preserve_order: bool = True,
+    stop: Optional[asyncio.Event] = None,
+    drain_timeout: Optional[float] = 10.0,
+    dedup: Optional[SnapshotDeduplicator] = None,
+) -> WatchStats:
+    """
+    asyncio counterpart of `watch_stream` for async collectors.
+
+    - `source`  – async iterable of dict telemetry snapshots
+    - `handler` – async (or plain) callable receiving each SentinelResult
+
+    The client's `warmup()` and every evaluation run in `executor` (the
+    loop's default executor if None), with at most `max_in_flight`
+    snapshots evaluated or awaiting their handler; once the limit is
+    reached the source is not read further (backpressure). Results reach the handler in source order unless
+    `preserve_order=False`.
+
+    Shutdown:
+      - source exhausted, or `stop` set: reading stops, in-flight results
+        are drained to the handler, stats are returned
+      - task cancelled: reading stops, in-flight results are drained for up
+        to `drain_timeout` seconds, then CancelledError propagates
+      - a failing handler or evaluation cancels the remaining work and the
+        exception propagates; a failing source is raised after the
+        snapshots read before it were handled
+
+    `dedup` works as in `watch_stream`.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+    if client is None:
+        client = build_default_client()
+    if handler is None:
+        handler = default_print_handler
+
+    loop = asyncio.get_running_loop()
+    warmup = getattr(client, "warmup", None)
+    if warmup is not None:
+        # Loading and hashing the model can take a while; keep the loop free.
+        await loop.run_in_executor(executor, warmup)
+
+    evaluate_snapshot: Callable[[Dict[str, Any]], Optional[SentinelResult]] = client.evaluate_snapshot
+    if dedup is not None:
+        evaluate_snapshot = functools.partial(
+            dedup.evaluate,
+            evaluate=client.evaluate_snapshot,
+            model_identity=dedup.model_identity or getattr(client, "model_identity", None),
+        )
+    slots = asyncio.Semaphore(max_in_flight)
+    results: "asyncio.Queue[Any]" = asyncio.Queue()
+    outstanding: Set["asyncio.Future[Any]"] = set()
+    stats = WatchStats(mode="async")
+    stats.evaluate.workers = max_in_flight
+    started = time.perf_counter()
+    submitted = 0
+
+    def timed_evaluate(snapshot: Dict[str, Any]) -> Tuple[Optional[SentinelResult], float]:
+        t0 = time.perf_counter()
+        result = evaluate_snapshot(snapshot)
+        return result, time.perf_counter() - t0
+
+    async def produce() -> None:
+        nonlocal submitted
+        it = source.__aiter__()
+        busy = blocked = 0.0
+        exhausted = False
+        try:
+            while True:
+                t0 = time.perf_counter()
+                snapshot = await _anext_or_stop(it, stop)
+                if snapshot is _DONE:
+                    exhausted = stop is None or not stop.is_set()
+                    break
+                t1 = time.perf_counter()
+                await slots.acquire()
+                t2 = time.perf_counter()
+                busy += t1 - t0
+                blocked += t2 - t1
+                fut = loop.run_in_executor(executor, timed_evaluate, snapshot)
+                outstanding.add(fut)
+                fut.add_done_callback(outstanding.discard)
+                submitted += 1
+                if preserve_order:
+                    results.put_nowait(fut)
+                else:
+                    fut.add_done_callback(results.put_nowait)
+        finally:
+            stats.source._merge(submitted, busy, 0.0, blocked)
+            results.put_nowait(_DONE)
+            aclose = getattr(it, "aclose", None)
+            if not exhausted and aclose is not None:
+                try:
+                    await aclose()
+                except Exception:  # noqa: BLE001 – best effort on early stop
+                    pass
+
+    async def consume() -> None:
+        handled = 0
+        eval_busy = handle_busy = idle = 0.0
+        total: Optional[int] = None
+        try:
+            while total is None or handled < total:
+                t0 = time.perf_counter()
+                item = await results.get()
+                if item is _DONE:
+                    total = submitted
+                    continue
+                result, elapsed = await item
+                t1 = time.perf_counter()
+                if result is not None:
+                    out = handler(result)
+                    if inspect.isawaitable(out):
+                        await out
+                handle_busy += time.perf_counter() - t1
+                idle += t1 - t0
+                eval_busy += elapsed
+                handled += 1
+                slots.release()
+        finally:
+            stats.evaluate._merge(handled, eval_busy, 0.0, 0.0)
+            stats.handle._merge(handled, handle_busy, idle, 0.0)
+
+    producer = asyncio.ensure_future(produce())
+    consumer = asyncio.ensure_future(consume())
+
+    async def abort() -> None:
+        for task in (producer, consumer):
+            task.cancel()
+        for fut in list(outstanding):
+            fut.cancel()
+        await asyncio.gather(producer, consumer, return_exceptions=True)
+
+    try:
+        await asyncio.wait({producer, consumer}, return_when=asyncio.FIRST_EXCEPTION)
+        if consumer.done() and consumer.exception() is not None:
+            await abort()
+            raise consumer.exception()  # type: ignore[misc]
+        # Producer finished (normally or not): drain what it submitted.
+        await consumer
+        if producer.exception() is not None:
+            raise producer.exception()  # type: ignore[misc]
+    except asyncio.CancelledError:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        if not consumer.done():
+            await asyncio.wait({consumer}, timeout=drain_timeout)
+        await abort()
+        raise
+    finally:
+        stats._finish(started)
+    return stats
@@ -0,0 +1,354 @@
+"""
+Durable, append-only disk spool for events that cannot be delivered yet.
+
+Layout of the spool directory:
+
+    00000000000000000001.seg   segment files, appended in order
+    00000000000000000002.seg
+    cursor                      "<segment> <offset>" of the next record to replay
+
+Each record is framed as `<u32 length><u32 crc32><payload>`. A torn or
+corrupt record at the tail of the newest segment (crash mid-write) is cut off
+on open; a corrupt record inside an older segment ends that segment.
+
+Guarantees:
+  - appends are fsync'd in batches (`fsync_every` records or `fsync_interval`
+    seconds, whichever comes first) and on `flush()` / `close()`; a timer
+    syncs the tail of a burst once `fsync_interval` has passed, even if no
+    further append arrives
+  - the cursor is replaced atomically and only after the handler accepted a
+    batch, so replay is at-least-once across crashes; concurrent `replay()`
+    calls are serialized per batch and never hand out the same batch twice
+  - total size is bounded by `max_bytes`: when exceeded, whole oldest
+    segments are dropped (and counted)
+
+Usage:
+    spool = EventSpool("/var/lib/sentinel/spool")
+    spool.append(b"...")
+    spool.replay(send_batch)      # send_batch(list_of_payloads); raise to retry later
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
+
+_FRAME = struct.Struct("<II")
+_CURSOR = "cursor"
+_SUFFIX = ".seg"
+
+Position = Tuple[int, int]  # (segment number, byte offset)
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover – e.g. Windows cannot open directories
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+class EventSpool:
+    """Segment-rotated append-only record spool with a crash-safe replay cursor."""
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_bytes: int = 4 * 1024 * 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        fsync_every: int = 64,
+        fsync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if segment_bytes <= _FRAME.size or max_bytes < segment_bytes:
+            raise ValueError("need max_bytes >= segment_bytes > frame header size")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._clock = clock
+        self._lock = threading.RLock()
+        # Held across read_batch -> handler -> commit so concurrent replays
+        # cannot both deliver the batch at the cursor.
+        self._replay_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        self.appended = 0
+        self.replayed = 0
+        self.fsyncs = 0
+        self.corrupt_records = 0
+        self.dropped_segments = 0
+        self.dropped_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._sizes: Dict[int, int] = {}
+        for name in os.listdir(directory):
+            if name.endswith(_SUFFIX) and name[: -len(_SUFFIX)].isdigit():
+                seg = int(name[: -len(_SUFFIX)])
+                self._sizes[seg] = os.path.getsize(self._path(seg))
+
+        self._cursor = self._load_cursor()
+        first = min(self._sizes) if self._sizes else self._cursor[0]
+        if self._cursor[0] < first:
+            self._cursor = (first, 0)
+
+        self._seg = max(self._sizes) if self._sizes else self._cursor[0]
+        self._recover_tail(self._seg)
+        self._fh: BinaryIO = open(self._path(self._seg), "ab")
+        self._sizes[self._seg] = self._fh.tell()
+        self._unsynced = 0
+        self._last_sync = self._clock()
+
+    # ------------------------------------------------------------------ #
+    # Files
+    # ------------------------------------------------------------------ #
+
+    def _path(self, seg: int) -> str:
+        return os.path.join(self.directory, f"{seg:020d}{_SUFFIX}")
+
+    def _load_cursor(self) -> Position:
+        try:
+            with open(os.path.join(self.directory, _CURSOR), "r", encoding="ascii") as f:
+                seg, off = f.read().split()
+            return int(seg), int(off)
+        except (OSError, ValueError):
+            return (min(self._sizes) if self._sizes else 1, 0)
+
+    def _clamp(self, pos: Position) -> Position:
+        # A position inside a segment that `_enforce_limit` already dropped
+        # means "from the oldest surviving segment".
+        if self._sizes:
+            first = min(self._sizes)
+            if pos[0] < first:
+                return (first, 0)
+        return pos
+
+    def _store_cursor(self, pos: Position) -> None:
+        tmp = os.path.join(self.directory, _CURSOR + ".tmp")
+        with open(tmp, "w", encoding="ascii") as f:
+            f.write(f"{pos[0]} {pos[1]}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.directory, _CURSOR))
+        _fsync_dir(self.directory)
+        self._cursor = pos
+
+    def _recover_tail(self, seg: int) -> None:
+        """Cut a torn/corrupt trailing record off the newest segment."""
+        path = self._path(seg)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            good = 0
+            for _payload, end in self._scan(f, 0):
+                good = end
+        if good != self._sizes.get(seg, 0):
+            with open(path, "r+b") as f:
+                f.truncate(good)
+                f.flush()
+                os.fsync(f.fileno())
+            self.corrupt_records += 1
+            self._sizes[seg] = good
+
+    @staticmethod
+    def _scan(f: BinaryIO, offset: int):
+        """Yield (payload, end_offset) for valid records from `offset`."""
+        f.seek(offset)
+        while True:
+            header = f.read(_FRAME.size)
+            if len(header) < _FRAME.size:
+                return
+            length, crc = _FRAME.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            offset += _FRAME.size + length
+            yield payload, offset
+
+    # ------------------------------------------------------------------ #
+    # Writing
+    # ------------------------------------------------------------------ #
+
+    def append(self, payload: bytes) -> None:
+        self.append_many((payload,))
+
+    def append_many(self, payloads: Sequence[bytes]) -> None:
+        with self._lock:
+            for payload in payloads:
+                frame = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+                if self._sizes[self._seg] and self._sizes[self._seg] + len(frame) > self.segment_bytes:
+                    self._rotate()
+                self._fh.write(frame)
+                self._sizes[self._seg] += len(frame)
+                self._unsynced += 1
+                self.appended += 1
+            if self._unsynced >= self.fsync_every or self._clock() - self._last_sync >= self.fsync_interval:
+                self._sync()
+            elif self._unsynced and self._timer is None:
+                self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        # caller holds the lock
+        delay = max(0.0, self._last_sync + self.fsync_interval - self._clock())
+
+        def fire() -> None:
+            self._timed_sync(timer)
+
+        timer = threading.Timer(delay, fire)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _timed_sync(self, timer: threading.Timer) -> None:
+        with self._lock:
+            if self._timer is timer and not self._fh.closed:
+                self._sync()
+
+    def _sync(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._fh.flush()
+        if self._unsynced:
+            os.fsync(self._fh.fileno())
+            self.fsyncs += 1
+        self._unsynced = 0
+        self._last_sync = self._clock()
+
+    def _rotate(self) -> None:
+        self._sync()
+        self._fh.close()
+        self._seg += 1
+        self._fh = open(self._path(self._seg), "ab")
+        self._sizes[self._seg] = 0
+        _fsync_dir(self.directory)
+        self._enforce_limit()
+
+    def _enforce_limit(self) -> None:
+        # Reserve a full segment for the new active file so the bound holds
+        # until the next rotation.
+        while (
+            len(self._sizes) > 1
+            and sum(self._sizes.values()) - self._sizes[self._seg] + self.segment_bytes > self.max_bytes
+        ):
+            oldest = min(self._sizes)
+            self.dropped_bytes += self._sizes.pop(oldest)
+            self.dropped_segments += 1
+            os.remove(self._path(oldest))
+            if self._cursor[0] <= oldest:
+                self._store_cursor((min(self._sizes), 0))
+
+    def flush(self) -> None:
+        """Write and fsync everything appended so far."""
+        with self._lock:
+            self._sync()
+
+    # ------------------------------------------------------------------ #
+    # Replay
+    # ------------------------------------------------------------------ #
+
+    def read_batch(self, max_records: int = 500) -> Tuple[List[bytes], Position]:
+        """
+        Return up to `max_records` payloads from the cursor and the position
+        just past them. Nothing is consumed until `commit(position)`.
+        """
+        with self._lock:
+            self._fh.flush()
+            seg, off = self._cursor = self._clamp(self._cursor)
+            out: List[bytes] = []
+            while len(out) < max_records and seg in self._sizes:
+                end = off
+                with open(self._path(seg), "rb") as f:
+                    for payload, end in self._scan(f, off):
+                        out.append(payload)
+                        if len(out) >= max_records:
+                            break
+                if len(out) >= max_records:
+                    off = end
+                    break
+                if seg == self._seg:
+                    off = end
+                    break
+                if end < self._sizes[seg]:
+                    self.corrupt_records += 1  # rest of this older segment is unreadable
+                seg, off = seg + 1, 0
+            return out, (seg, off)
+
+    def commit(self, pos: Position) -> None:
+        """
+        Advance the replay cursor to `pos` and delete fully consumed segments.
+
+        If `pos` points into a segment dropped meanwhile for the size limit,
+        the cursor moves to the start of the oldest remaining segment.
+        """
+        with self._lock:
+            pos = self._clamp(pos)
+            self._store_cursor(pos)
+            for seg in [s for s in self._sizes if s < pos[0]]:
+                del self._sizes[seg]
+                os.remove(self._path(seg))
+
+    def replay(self, handler: Callable[[List[bytes]], Any], batch_size: int = 500) -> int:
+        """
+        Feed pending records to `handler` in batches, committing after each
+        accepted batch. If `handler` raises, the current batch stays pending
+        and the exception propagates. Returns the number of records replayed.
+
+        Each read/handle/commit cycle holds a replay lock, so concurrent
+        callers take turns batch by batch (appends are not blocked).
+        """
+        done = 0
+        while True:
+            with self._replay_lock:
+                records, pos = self.read_batch(batch_size)
+                if not records:
+                    if pos != self._cursor:
+                        self.commit(pos)  # skip past consumed / corrupt segments
+                    return done
+                handler(records)
+                self.commit(pos)
+                self.replayed += len(records)
+            done += len(records)
+
+    def pending_bytes(self) -> int:
+        with self._lock:
+            seg, off = self._clamp(self._cursor)
+            return sum(size for s, size in self._sizes.items() if s >= seg) - off
+
+    def has_pending(self) -> bool:
+        return self.pending_bytes() > 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "segments": len(self._sizes),
+            "pending_bytes": self.pending_bytes(),
+            "appended": self.appended,
+            "replayed": self.replayed,
+            "fsyncs": self.fsyncs,
+            "corrupt_records": self.corrupt_records,
+            "dropped_segments": self.dropped_segments,
+            "dropped_bytes": self.dropped_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._sync()
+                self._fh.close()
+
+    def __enter__(self) -> "EventSpool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from .adaptive_core_bridge import SentinelAdaptiveCoreBridge, bridge_accepts_events, get_default_bridge
 
 
 def send_feedback_to_adaptive(
@@ -31,10 +31,10 @@ def send_feedback_to_adaptive(
             feedback="TRUE_POSITIVE",
         )
     """
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_default_bridge()
 
-    if not bridge.is_available:
-        # No adaptive core installed; safe no-op.
+    if not bridge_accepts_events(bridge):
+        # No adaptive core installed and no spool; safe no-op.
         return
 
     tag = feedback.upper()
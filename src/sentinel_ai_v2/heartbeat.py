@@ -2,31 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
 
-from .adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from .adaptive_core_bridge import SentinelAdaptiveCoreBridge, get_default_bridge
 
+logger = logging.getLogger(__name__)
 
-def shield_heartbeat(
+_UNAVAILABLE_TEXT = "Shield heartbeat: Adaptive Core not available."
+
+
+def heartbeat_data(
     *,
     min_severity: int = 0,
     bridge: Optional[SentinelAdaptiveCoreBridge] = None,
-) -> str:
+) -> Dict[str, Any]:
     """
-    Returns a combined health + intelligence heartbeat for the shield.
+    Structured heartbeat: one round of Adaptive Core calls, no formatting.
 
-    When Adaptive Core is available:
-      - returns immune report text
-      - includes adaptive state (weights + threshold)
-      - includes last update timestamps
-
-    When not available:
-      - returns a simple status message
+    {"available": bool, "immune_report": str | None,
+     "last_updates": {"last_threat_received": ..., "last_learning_update": ...},
+     "adaptive_state": {"global_threshold": float, "layer_weights": {layer: float}}}
     """
-    bridge = bridge or SentinelAdaptiveCoreBridge()
+    bridge = bridge or get_default_bridge()
 
     if not bridge.is_available:
-        return "Shield heartbeat: Adaptive Core not available."
+        return {"available": False, "immune_report": None, "last_updates": {}, "adaptive_state": {}}
 
     # Pull immune report text
     report_text = bridge.get_immune_report_text(min_severity=min_severity)
@@ -37,23 +41,241 @@ def shield_heartbeat(
     # Pull last update metadata
     last_meta = bridge._interface.get_last_update_metadata()  # type: ignore
 
+    return {
+        "available": True,
+        "immune_report": report_text,
+        "last_updates": {
+            "last_threat_received": last_meta.get("last_threat_received"),
+            "last_learning_update": last_meta.get("last_learning_update"),
+        },
+        "adaptive_state": {
+            "global_threshold": state.global_threshold,
+            "layer_weights": dict(state.layer_weights),
+        },
+    }
+
+
+def format_heartbeat(data: Dict[str, Any]) -> str:
+    """Render `heartbeat_data()` output as the heartbeat text."""
+    if not data["available"]:
+        return _UNAVAILABLE_TEXT
+
+    last = data["last_updates"]
+    state = data["adaptive_state"]
+
     lines: list[str] = []
     lines.append("=== DigiByte Quantum Shield — Heartbeat ===")
     lines.append("")
 
     lines.append(">> Immune Report:")
-    lines.append(report_text)
+    lines.append(data["immune_report"])
     lines.append("")
 
     lines.append(">> Last Updates:")
-    lines.append(f"  Last threat received: {last_meta.get('last_threat_received')}")
-    lines.append(f"  Last learning update: {last_meta.get('last_learning_update')}")
+    lines.append(f"  Last threat received: {last.get('last_threat_received')}")
+    lines.append(f"  Last learning update: {last.get('last_learning_update')}")
     lines.append("")
 
     lines.append(">> Adaptive State:")
-    lines.append(f"  Global Threshold: {state.global_threshold:.3f}")
+    lines.append(f"  Global Threshold: {state['global_threshold']:.3f}")
     lines.append("  Layer Weights:")
-    for layer, weight in state.layer_weights.items():
+    for layer, weight in state["layer_weights"].items():
         lines.append(f"    - {layer}: {weight:.3f}")
 
     return "\n".join(lines)
+
+
+def shield_heartbeat(
+    *,
+    min_severity: int = 0,
+    bridge: Optional[SentinelAdaptiveCoreBridge] = None,
+) -> str:
+    """
+    Returns a combined health + intelligence heartbeat for the shield.
+
+    When Adaptive Core is available:
+      - returns immune report text
+      - includes adaptive state (weights + threshold)
+      - includes last update timestamps
+
+    When not available:
+      - returns a simple status message
+
+    This always queries the Adaptive Core; health probes should use
+    `HeartbeatCache` / `cached_shield_heartbeat()` instead.
+    """
+    return format_heartbeat(heartbeat_data(min_severity=min_severity, bridge=bridge))
+
+
+# ---------------------------------------------------------------------- #
+# Cached heartbeat
+# ---------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True)
+class HeartbeatReport:
+    """Heartbeat text plus its structured form, as of `generated_at` (cache clock)."""
+
+    text: str
+    data: Dict[str, Any]
+    generated_at: float
+    stale: bool = False
+
+
+class _Slot:
+    __slots__ = ("report", "refreshing", "error")
+
+    def __init__(self) -> None:
+        self.report: Optional[HeartbeatReport] = None
+        self.refreshing = False
+        self.error: Optional[BaseException] = None
+
+
+class HeartbeatCache:
+    """
+    TTL cache in front of the heartbeat, one entry per `min_severity`.
+
+    - younger than `ttl`: served from cache
+    - older, but within `ttl + stale_ttl`: served as-is (`stale=True`) while
+      one background thread refreshes it (stale-while-revalidate); a failed
+      background refresh is logged and the old report keeps being served
+      until it expires
+    - missing or expired: refreshed synchronously
+
+    Refreshes are single-flight: concurrent callers for the same entry wait
+    for the refresh already running instead of starting their own.
+
+    Counters (see `stats()`): hits, stale_hits, misses, refreshes, refresh_errors.
+
+    Usage:
+        cache = HeartbeatCache(ttl=5.0)
+        report = cache.get()
+        report.text, report.data
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        *,
+        stale_ttl: float = 60.0,
+        bridge: Optional[SentinelAdaptiveCoreBridge] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0 or stale_ttl < 0:
+            raise ValueError("ttl must be > 0 and stale_ttl >= 0")
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.bridge = bridge
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._slots: Dict[int, _Slot] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def _build(self, min_severity: int) -> HeartbeatReport:
+        data = heartbeat_data(min_severity=min_severity, bridge=self.bridge)
+        return HeartbeatReport(format_heartbeat(data), data, self._clock())
+
+    def _refresh(self, min_severity: int, slot: _Slot) -> None:
+        """Run one refresh for `slot` (caller has set `slot.refreshing`)."""
+        report: Optional[HeartbeatReport] = None
+        error: Optional[BaseException] = None
+        try:
+            report = self._build(min_severity)
+        except Exception as exc:  # noqa: BLE001 – reported to waiters / logged
+            error = exc
+        with self._cond:
+            self.refreshes += 1
+            if report is not None:
+                slot.report = report
+            else:
+                self.refresh_errors += 1
+            slot.error = error
+            slot.refreshing = False
+            self._cond.notify_all()
+
+    def _background_refresh(self, min_severity: int, slot: _Slot) -> None:
+        self._refresh(min_severity, slot)
+        if slot.error is not None:
+            logger.warning("Heartbeat refresh failed; serving stale report: %s", slot.error)
+
+    def get(self, min_severity: int = 0) -> HeartbeatReport:
+        """Return the heartbeat for `min_severity`, refreshing as described above."""
+        with self._cond:
+            slot = self._slots.get(min_severity)
+            if slot is None:
+                slot = self._slots[min_severity] = _Slot()
+
+            report = slot.report
+            if report is not None:
+                age = self._clock() - report.generated_at
+                if age < self.ttl:
+                    self.hits += 1
+                    return report
+                if age < self.ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    if not slot.refreshing:
+                        slot.refreshing = True
+                        threading.Thread(
+                            target=self._background_refresh,
+                            args=(min_severity, slot),
+                            name="sentinel-heartbeat-refresh",
+                            daemon=True,
+                        ).start()
+                    return HeartbeatReport(report.text, report.data, report.generated_at, stale=True)
+
+            self.misses += 1
+            if slot.refreshing:
+                # Another caller is already refreshing: wait for its result.
+                self._cond.wait_for(lambda: not slot.refreshing)
+                if slot.report is not None and slot.report is not report:
+                    return slot.report
+                if slot.error is not None:
+                    raise slot.error
+            slot.refreshing = True
+
+        self._refresh(min_severity, slot)
+        if slot.error is not None:
+            raise slot.error
+        assert slot.report is not None
+        return slot.report
+
+    def invalidate(self) -> None:
+        """Drop all cached reports (the next `get()` refreshes synchronously)."""
+        with self._cond:
+            for slot in self._slots.values():
+                slot.report = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "entries": sum(1 for s in self._slots.values() if s.report is not None),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+            }
+
+
+_default_cache: Optional[HeartbeatCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def cached_shield_heartbeat(*, min_severity: int = 0) -> HeartbeatReport:
+    """
+    Heartbeat from a process-wide `HeartbeatCache` (5 s TTL, shared bridge).
+    Intended for health-probe endpoints.
+    """
+    global _default_cache
+    cache = _default_cache
+    if cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = HeartbeatCache()
+            cache = _default_cache
+    return cache.get(min_severity)
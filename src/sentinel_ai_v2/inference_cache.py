@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .model_loader import FEATURE_ORDER, build_feature_array
+
+
+class InferenceCache:
+    """
+    Bounded LRU memo in front of model inference.
+
+    Keys are (model fingerprint, feature tuple). The feature tuple is either
+    the exact FEATURE_ORDER values or, with `quantum` set, each value rounded
+    to the nearest multiple of `quantum` (coarser key => more hits, at the
+    cost of treating nearby vectors as identical).
+
+    With `quantum` set the model also runs on the quantized features (see
+    `model_input()`), so every input in a bucket scores the same whether or
+    not the bucket was already cached.
+
+    Keying on the model hash means a hot-reloaded model never reuses scores
+    produced by its predecessor.
+    """
+
+    def __init__(self, max_entries: int = 4096, quantum: Optional[float] = None) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if quantum is not None and quantum <= 0:
+            raise ValueError("quantum must be > 0")
+
+        self.max_entries = max_entries
+        self.quantum = quantum
+
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters snapshot for metrics / dashboards."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def model_input(self, features: Dict[str, Any]) -> Dict[str, Any]:
+        """Features the model should see: unchanged, or snapped to the `quantum` grid."""
+        if self.quantum is None:
+            return features
+        q = self.quantum
+        snapped = dict(features)
+        for name, value in zip(FEATURE_ORDER, build_feature_array(features)):
+            snapped[name] = round(value / q) * q
+        return snapped
+
+    def make_key(self, model: Any, features: Dict[str, Any]) -> Tuple[Hashable, ...]:
+        fingerprint = getattr(model, "hash", None) or id(model)
+        values = build_feature_array(features)
+        if self.quantum is not None:
+            q = self.quantum
+            return (fingerprint, tuple(round(v / q) for v in values))
+        return (fingerprint, values)
+
+    def get_or_compute(
+        self,
+        model: Any,
+        features: Dict[str, Any],
+        compute: Callable[[Dict[str, Any]], float],
+    ) -> float:
+        """
+        Return the cached score for (model, features) or call
+        `compute(self.model_input(features))` and remember its result.
+
+        `compute` runs outside the lock; two concurrent misses on the same
+        key may both compute, which is harmless for a pure function.
+        """
+        key = self.make_key(model, features)
+
+        with self._lock:
+            score = self._entries.get(key)
+            if score is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return score
+            self.misses += 1
+
+        score = float(compute(self.model_input(features)))
+
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return score
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Fixed column order of the shared feature array handed to every model.
+FEATURE_ORDER: Tuple[str, ...] = (
+    "entropy_score",
+    "mempool_score",
+    "reorg_score",
+    "entropy_drop",
+    "mempool_anomaly",
+    "reorg_depth",
+)
 
 
 @dataclass
@@ -64,3 +76,107 @@ def run_model_inference(model: LoadedModel, features: Any) -> float:
     """
     _ = (model, features)
     return 0.5
+
+
+def build_feature_array(features: Dict[str, Any]) -> Tuple[float, ...]:
+    """
+    Flatten the feature dict into a tuple ordered by FEATURE_ORDER.
+
+    Built once per evaluation and shared (read-only) by all ensemble members.
+    """
+    return tuple(float(features.get(name, 0.0) or 0.0) for name in FEATURE_ORDER)
+
+
+@dataclass
+class EnsembleResult:
+    """Outcome of one ensemble evaluation."""
+
+    score: float
+    scores: list[float]
+    timings_ms: list[float]
+    early_exit: bool = False
+
+    @property
+    def evaluated(self) -> int:
+        return len(self.scores)
+
+
+@dataclass
+class ModelEnsemble:
+    """
+    Ordered ensemble of verified models combined by max().
+
+    Because nothing can lower a running max, evaluation stops as soon as it
+    reaches `exit_score` (default 1.0, the ceiling of the aggregated risk).
+    Put the cheapest / most decisive models first.
+
+    `hash` is a fingerprint over the ordered member hashes, so it can be
+    used wherever a single LoadedModel hash is (e.g. context_hash).
+    """
+
+    models: Tuple[LoadedModel, ...]
+    exit_score: float = 1.0
+
+    # Cumulative per-member timing, indexed like `models`; updated under
+    # `_stats_lock` since one ensemble serves every evaluation thread.
+    total_ms: list[float] = field(init=False, repr=False, compare=False)
+    calls: list[int] = field(init=False, repr=False, compare=False)
+    _stats_lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+
+    def __post_init__(self) -> None:
+        self.models = tuple(self.models)
+        if not self.models:
+            raise ModelVerificationError("Model ensemble must contain at least one model")
+        self.total_ms = [0.0] * len(self.models)
+        self.calls = [0] * len(self.models)
+        h = hashlib.sha256()
+        for m in self.models:
+            h.update(m.hash.encode("ascii"))
+            h.update(b"|")
+        self._fingerprint = h.hexdigest()
+
+    @property
+    def hash(self) -> str:
+        return self._fingerprint
+
+    def evaluate(self, features: Dict[str, Any]) -> EnsembleResult:
+        array = build_feature_array(features)
+
+        scores: list[float] = []
+        timings: list[float] = []
+        best = 0.0
+        early_exit = False
+
+        for i, model in enumerate(self.models):
+            t0 = time.perf_counter()
+            score = float(run_model_inference(model, array))
+            dt = (time.perf_counter() - t0) * 1000.0
+
+            scores.append(score)
+            timings.append(dt)
+            with self._stats_lock:
+                self.total_ms[i] += dt
+                self.calls[i] += 1
+
+            if score > best:
+                best = score
+            if best >= self.exit_score:
+                early_exit = i < len(self.models) - 1
+                break
+
+        return EnsembleResult(score=best, scores=scores, timings_ms=timings, early_exit=early_exit)
+
+
+def load_model_ensemble(
+    specs: Sequence[Tuple[str, Optional[str]]],
+    exit_score: float = 1.0,
+) -> ModelEnsemble:
+    """
+    Load and verify every (model_path, expected_hash) pair, preserving order.
+
+    Any single failure rejects the whole ensemble.
+    """
+    models = tuple(load_and_verify_model(path, expected_hash=h) for path, h in specs)
+    return ModelEnsemble(models=models, exit_score=exit_score)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .model_loader import LoadedModel, ModelVerificationError, load_and_verify_model
+
+logger = logging.getLogger(__name__)
+
+
+class ModelManager:
+    """
+    Owns the currently active LoadedModel and hot-reloads it from disk.
+
+    The manager polls the model file's mtime/size. When either changes, the
+    new file is hashed and verified against `expected_hash` *outside* the
+    lock, and only a fully verified model is swapped in. The swap is a single
+    reference assignment, so callers that already hold the previous model
+    (in-flight requests) finish on it undisturbed.
+
+    A failed verification keeps the previous model active and records the
+    error in `last_error`.
+
+    With `load_initial=False` nothing touches the disk until
+    `ensure_loaded()` (or `poll()`) is called.
+
+    Usage:
+        manager = ModelManager("models/sentinel_v2.onnx", expected_hash=h)
+        manager.start(poll_interval_seconds=5.0)
+        model = manager.current()
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        expected_hash: Optional[str] = None,
+        *,
+        load_initial: bool = True,
+    ) -> None:
+        self.model_path = Path(model_path)
+        self._expected_hash = expected_hash
+
+        self._model: Optional[LoadedModel] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self._polled = False
+
+        if load_initial:
+            self.poll()
+
+    # ------------------------------------------------------------------ #
+    # Read side
+    # ------------------------------------------------------------------ #
+
+    def current(self) -> Optional[LoadedModel]:
+        """Return the active model (None if nothing verified yet)."""
+        return self._model
+
+    def ensure_loaded(self) -> Optional[LoadedModel]:
+        """
+        Load (and hash) the model on first use if the constructor deferred it.
+
+        Concurrent first callers wait for the one load in progress; subsequent
+        calls are a cheap flag check.
+        """
+        if not self._polled:
+            with self._load_lock:
+                if not self._polled:
+                    self.poll()
+        return self._model
+
+    @property
+    def expected_hash(self) -> Optional[str]:
+        return self._expected_hash
+
+    def set_expected_hash(self, expected_hash: Optional[str]) -> None:
+        """
+        Update the hash that the *next* model file must match.
+
+        Operators publish the new hash first, then replace the file; the
+        poller picks it up on its next pass.
+        """
+        with self._lock:
+            self._expected_hash = expected_hash
+            # Force re-verification of the file currently on disk.
+            self._stamp = None
+
+    # ------------------------------------------------------------------ #
+    # Reload
+    # ------------------------------------------------------------------ #
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.model_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def poll(self) -> bool:
+        """
+        Check the model file once and swap in a new model if it changed.
+
+        Returns True if a new model was activated.
+        """
+        try:
+            return self._poll()
+        finally:
+            self._polled = True
+
+    def _poll(self) -> bool:
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+
+        expected = self._expected_hash
+        try:
+            model = load_and_verify_model(str(self.model_path), expected_hash=expected)
+        except (ModelVerificationError, OSError) as exc:
+            # Keep serving the previous model; remember the stamp so we do not
+            # re-hash the same rejected file on every poll – unless the
+            # expected hash changed meanwhile, in which case retry next poll.
+            with self._lock:
+                if expected == self._expected_hash:
+                    self._stamp = stamp
+                self.last_error = str(exc)
+            logger.warning("Model reload rejected: %s", exc)
+            return False
+
+        with self._lock:
+            if expected != self._expected_hash:
+                # Expected hash changed while we were hashing; retry next poll.
+                return False
+            self._model = model
+            self._stamp = stamp
+            self.reload_count += 1
+            self.last_error = None
+
+        logger.info("Model reloaded from %s (hash=%s)", self.model_path, model.hash)
+        return True
+
+    def start(self, poll_interval_seconds: float = 5.0) -> None:
+        """Start a daemon thread that calls `poll()` every interval."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def _loop() -> None:
+            while not self._stop.wait(poll_interval_seconds):
+                try:
+                    self.poll()
+                except Exception as exc:  # pragma: no cover – defensive
+                    logger.error("Model reload poll failed: %s", exc)
+
+        self._thread = threading.Thread(target=_loop, name="sentinel-model-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background poller (if running)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -1,4 +1,70 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+
+RpcCall = Tuple[str, Optional[List[Any]]]
+
+# Calls typically issued together on every telemetry poll.
+NODE_INFO_CALLS: Tuple[RpcCall, ...] = (
+    ("getblockcount", None),
+    ("getmempoolinfo", None),
+    ("getchaintips", None),
+    ("getpeerinfo", None),
+    ("getnetworkhashps", None),
+)
+
+
+# Extra HTTP read time allowed on top of a long-poll RPC's own timeout.
+LONG_POLL_GRACE_SECONDS = 5.0
+
+# HTTP statuses meaning "this endpoint does not take JSON-RPC arrays". Anything
+# else (401, 403, 429, 502, 503, ...) is treated as transient and re-raised.
+_BATCH_REJECTED_STATUSES = frozenset({400, 404, 405, 413, 415, 422, 500, 501})
+
+
+def _decode_reply(resp: requests.Response) -> Any:
+    """
+    Decode a JSON-RPC HTTP reply.
+
+    Bitcoin/DigiByte Core answer a failed single call with HTTP 500 (404 for
+    method-not-found) and the JSON-RPC error in the body; such replies are
+    returned like a 200 so the error reaches the caller as an RPC error.
+    Any other HTTP error (including transient ones like 429/503 that happen to
+    carry a JSON body) raises `requests.HTTPError`; a non-JSON 2xx body
+    raises ValueError.
+    """
+    if resp.status_code >= 400:
+        if resp.status_code not in _BATCH_REJECTED_STATUSES:
+            resp.raise_for_status()
+        try:
+            data = resp.json()
+        except ValueError:
+            data = None
+        if isinstance(data, list) or (isinstance(data, dict) and data.get("error")):
+            return data
+        resp.raise_for_status()
+    return resp.json()
+
+
+@dataclass
+class RpcCallResult:
+    """Outcome of one call inside a batch; errors are reported per call."""
+
+    method: str
+    result: Any = None
+    error: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+    def unwrap(self) -> Any:
+        if self.error:
+            raise RuntimeError(self.error)
+        return self.result
 
 
 class SimpleRpcClient:
@@ -10,23 +76,197 @@ class SimpleRpcClient:
     def __init__(self, url: str, user: str, password: str) -> None:
         self.url = url
         self.auth = (user, password)
+        # None = not probed yet; False = node rejected a batch, use sequential calls.
+        self.batch_supported: Optional[bool] = None
 
-    def _rpc(self, method: str, params=None):
-        payload = {
+    def _payload(self, method: str, params=None, rid: Any = "sentinel") -> Dict[str, Any]:
+        return {
             "jsonrpc": "1.0",
-            "id": "sentinel",
+            "id": rid,
             "method": method,
             "params": params or [],
         }
-        resp = requests.post(self.url, json=payload, auth=self.auth, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+
+    @staticmethod
+    def _unwrap(data: Dict[str, Any]):
         if data.get("error"):
             raise RuntimeError(data["error"])
         return data["result"]
 
+    def _post_json(self, payload: Any, timeout: float = 10) -> Any:
+        resp = requests.post(self.url, json=payload, auth=self.auth, timeout=timeout)
+        return _decode_reply(resp)
+
+    def _post_batch(self, calls: Sequence[RpcCall]) -> Any:
+        return self._post_json([self._payload(m, p, rid=i) for i, (m, p) in enumerate(calls)])
+
+    def _rpc(self, method: str, params=None, timeout: Optional[float] = None):
+        payload = self._payload(method, params)
+        if timeout is None:
+            return self._unwrap(self._post_json(payload))
+        return self._unwrap(self._post_json(payload, timeout=timeout))
+
+    def batch(self, calls: Sequence[RpcCall]) -> List[RpcCallResult]:
+        """
+        Send several calls as one JSON-RPC array (one HTTP round trip).
+
+        Replies are matched back to calls by id, so result order always
+        follows `calls`. A failing call only marks its own RpcCallResult.
+
+        Nodes or proxies that reject batches (a non-array or non-JSON reply,
+        or an HTTP status such as 400/404/405/500) are remembered via
+        `batch_supported = False`, and this and all later batches fall back
+        to sequential calls. Transient HTTP errors (401, 429, 502, 503, ...)
+        are raised and do not change `batch_supported`.
+        """
+        if not calls:
+            return []
+
+        if self.batch_supported is not False:
+            try:
+                replies = self._post_batch(calls)
+            except requests.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if status not in _BATCH_REJECTED_STATUSES:
+                    raise
+                replies = None
+            except ValueError:  # not JSON (e.g. an HTML error page from a proxy)
+                replies = None
+            if isinstance(replies, list):
+                self.batch_supported = True
+                return self._demux(calls, replies)
+            self.batch_supported = False
+
+        return [self._call_one(m, p) for m, p in calls]
+
+    @staticmethod
+    def _demux(calls: Sequence[RpcCall], replies: List[Any]) -> List[RpcCallResult]:
+        by_id = {r.get("id"): r for r in replies if isinstance(r, dict)}
+        out: List[RpcCallResult] = []
+        for i, (method, _) in enumerate(calls):
+            r = by_id.get(i)
+            if r is None:
+                out.append(RpcCallResult(method, error={"code": -32603, "message": "missing reply"}))
+            else:
+                out.append(RpcCallResult(method, result=r.get("result"), error=r.get("error")))
+        return out
+
+    def _call_one(self, method: str, params: Optional[List[Any]]) -> RpcCallResult:
+        try:
+            return RpcCallResult(method, result=self._rpc(method, params))
+        except RuntimeError as exc:
+            return RpcCallResult(method, error=exc.args[0] if exc.args else str(exc))
+
     def get_block_count(self) -> int:
         """
         Returns the current chain height from the DigiByte node.
         """
         return int(self._rpc("getblockcount"))
+
+    def wait_for_block_height(self, height: int, timeout_seconds: float) -> int:
+        """
+        Long-poll `waitforblockheight`: returns the tip height once it reaches
+        `height`, or the current tip when `timeout_seconds` elapses.
+
+        The HTTP read timeout is extended past the RPC timeout so the request
+        is not cut off while the node is legitimately waiting.
+        """
+        # The node treats 0 as "wait forever"; never send it.
+        timeout_ms = max(1, int(timeout_seconds * 1000))
+        res = self._rpc(
+            "waitforblockheight",
+            [int(height), timeout_ms],
+            timeout=timeout_seconds + LONG_POLL_GRACE_SECONDS,
+        )
+        return int(res["height"])
+
+    def get_node_info(self, calls: Sequence[RpcCall] = NODE_INFO_CALLS) -> Dict[str, RpcCallResult]:
+        """
+        Fetch the usual per-poll node telemetry in a single batch.
+
+        Returns {method: RpcCallResult}.
+        """
+        return {r.method: r for r in self.batch(calls)}
+
+
+class PooledRpcClient(SimpleRpcClient):
+    """
+    Keep-alive JSON-RPC client for polling many nodes.
+
+    Differences from SimpleRpcClient:
+      - one persistent `requests.Session` per client, so TCP connections and
+        auth headers are reused instead of being rebuilt on every call
+      - a bounded per-host connection pool (`pool_maxsize`)
+      - separate connect / read timeouts
+      - the JSON envelope for each method is serialized once and reused;
+        only `params` is encoded per call
+
+    Usage:
+        with PooledRpcClient(url, user, password) as rpc:
+            height = rpc.get_block_count()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        user: str,
+        password: str,
+        *,
+        pool_maxsize: int = 4,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        super().__init__(url, user, password)
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        self._session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.auth = self.auth
+        self._session.headers.update(
+            {"Content-Type": "application/json", "Connection": "keep-alive"}
+        )
+
+        # method -> serialized envelope prefix (everything before the params)
+        self._templates: Dict[str, bytes] = {}
+
+    def _template(self, method: str) -> bytes:
+        prefix = self._templates.get(method)
+        if prefix is None:
+            envelope = json.dumps({"jsonrpc": "1.0", "method": method}, separators=(",", ":"))
+            # '{"jsonrpc":"1.0","method":"x"}' -> '{"jsonrpc":"1.0","method":"x","params":'
+            prefix = (envelope[:-1] + ',"params":').encode("utf-8")
+            self._templates[method] = prefix
+        return prefix
+
+    def _encode(self, method: str, params: Optional[List[Any]] = None, rid: Any = "sentinel") -> bytes:
+        tail = json.dumps(params, separators=(",", ":")).encode("utf-8") if params else b"[]"
+        return self._template(method) + tail + b',"id":' + json.dumps(rid).encode("utf-8") + b"}"
+
+    def _post_json(self, payload: Any, timeout: Optional[float] = None) -> Any:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return self._post(body, read_timeout=timeout)
+
+    def _post_batch(self, calls: Sequence[RpcCall]) -> Any:
+        body = b"[" + b",".join(self._encode(m, p, rid=i) for i, (m, p) in enumerate(calls)) + b"]"
+        return self._post(body)
+
+    def _post(self, body: bytes, read_timeout: Optional[float] = None):
+        timeout = self.timeout if read_timeout is None else (self.timeout[0], read_timeout)
+        resp = self._session.post(self.url, data=body, timeout=timeout)
+        return _decode_reply(resp)
+
+    def _rpc(self, method: str, params=None, timeout: Optional[float] = None):
+        return self._unwrap(self._post(self._encode(method, params), read_timeout=timeout))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "PooledRpcClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
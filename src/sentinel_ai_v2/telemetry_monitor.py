@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import heapq
+import json
 import logging
-from dataclasses import dataclass, asdict
+import math
+import mmap
+import os
+import random
+import struct
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime, timezone
-from typing import Optional, Protocol
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Protocol, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +29,34 @@ class RpcClient(Protocol):
         ...
 
 
+class LongPollRpcClient(RpcClient, Protocol):
+    """
+    Optional extension: blocking new-block notification.
+
+    Maps to the node's `waitforblockheight` RPC, which returns as soon as the
+    tip reaches `height` or when `timeout_seconds` elapses, whichever is first.
+    """
+    def wait_for_block_height(self, height: int, timeout_seconds: float) -> int:
+        ...
+
+
+# JSON-RPC "Method not found" – node does not offer long-poll RPCs.
+_RPC_METHOD_NOT_FOUND = -32601
+
+
+def _is_method_not_found(exc: BaseException) -> bool:
+    """
+    True for an RPC error with code -32601, or for an HTTP 404 without a
+    JSON-RPC body (e.g. `requests.HTTPError` from a client or proxy that
+    does not decode the node's error reply).
+    """
+    err = exc.args[0] if exc.args else None
+    if isinstance(err, dict) and err.get("code") == _RPC_METHOD_NOT_FOUND:
+        return True
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) == 404
+
+
 @dataclass
 class BlockProgressStatus:
     """
@@ -28,23 +67,155 @@ class BlockProgressStatus:
     previous_height: Optional[int]
     status: str  # "ok" or "stalled"
     stalled_for_seconds: int
+    # Posterior probability that the chain has stopped, given no new block
+    # for `stalled_for_seconds` (see BlockIntervalStats.stall_probability).
+    stall_probability: float = 0.0
+    likely_stalled: bool = False
+
+
+class BlockIntervalStats:
+    """
+    Rolling statistics of inter-block times with O(1) updates.
+
+    - EWMA mean and variance of the interval (`ewma_alpha`)
+    - a small log2-bucketed histogram (1s .. 1024s + overflow) whose counts
+      are halved once they exceed `histogram_window`, so it tracks recent
+      behaviour
+
+    `stall_probability(elapsed)` is the Bayesian posterior that the chain
+    has stopped given no block for `elapsed` seconds:
+
+        P(stall | gap > t) = p / (p + (1 - p) * S(t))
+
+    with prior `stall_prior` = p and S(t) the healthy survival function:
+    the larger of an exponential tail (block arrivals are Poisson; the scale
+    is max(mean, std) so over-dispersed chains are not over-alarmed) and the
+    empirical histogram tail, so gaps that have happened before do not raise
+    the alarm. With DigiByte's 15s target and the default prior, the
+    posterior reaches 0.99 after ~3 minutes without a block.
+    """
+
+    HISTOGRAM_EDGES: Tuple[float, ...] = tuple(float(2 ** i) for i in range(11))  # 1 .. 1024s
+
+    def __init__(
+        self,
+        expected_block_interval: float = 15.0,
+        ewma_alpha: float = 0.1,
+        stall_prior: float = 0.001,
+        histogram_window: int = 1024,
+    ) -> None:
+        if not 0.0 < stall_prior < 1.0:
+            raise ValueError("stall_prior must be in (0, 1)")
+        self.ewma_alpha = float(ewma_alpha)
+        self.stall_prior = float(stall_prior)
+        self.histogram_window = int(histogram_window)
+
+        self.mean = float(expected_block_interval)
+        # Prior variance of an exponential distribution with that mean.
+        self.variance = self.mean * self.mean
+        self.histogram: List[float] = [0.0] * (len(self.HISTOGRAM_EDGES) + 1)
+        self._histogram_total = 0.0
+        self.count = 0
+        self.longest = 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self.variance, 0.0))
+
+    def observe(self, interval: float, blocks: int = 1) -> None:
+        """Record `blocks` inter-block intervals averaging `interval` seconds."""
+        if interval < 0 or blocks <= 0:
+            return
+        diff = interval - self.mean
+        incr = self.ewma_alpha * diff
+        self.mean += incr
+        self.variance = (1.0 - self.ewma_alpha) * (self.variance + diff * incr)
+
+        self.histogram[self._bucket(interval)] += blocks
+        self._histogram_total += blocks
+        self.count += blocks
+        self.longest = max(self.longest, interval)
+        if self._histogram_total > self.histogram_window:
+            self.histogram = [c / 2.0 for c in self.histogram]
+            self._histogram_total /= 2.0
+
+    def _bucket(self, interval: float) -> int:
+        for i, edge in enumerate(self.HISTOGRAM_EDGES):
+            if interval < edge:
+                return i
+        return len(self.HISTOGRAM_EDGES)
+
+    def survival(self, elapsed: float) -> float:
+        """P(healthy gap > elapsed)."""
+        scale = max(self.mean, self.std, 1e-9)
+        tail = math.exp(-max(elapsed, 0.0) / scale)
+        if self._histogram_total > 0:
+            tail = max(tail, self._empirical_tail(elapsed))
+        return tail
+
+    def _empirical_tail(self, elapsed: float) -> float:
+        edges = self.HISTOGRAM_EDGES
+        b = self._bucket(elapsed)
+        above = sum(self.histogram[b + 1:])
+        if b < len(edges):
+            lo = edges[b - 1] if b > 0 else 0.0
+            hi = edges[b]
+            # assume uniform spread inside the bucket
+            above += self.histogram[b] * (hi - elapsed) / (hi - lo)
+        elif self.longest > edges[-1]:
+            # overflow bucket: spread up to the longest gap ever observed
+            above += self.histogram[b] * max(0.0, self.longest - elapsed) / (self.longest - edges[-1])
+        return above / self._histogram_total
+
+    def stall_probability(self, elapsed: float) -> float:
+        p = self.stall_prior
+        return p / (p + (1.0 - p) * self.survival(elapsed))
+
 
 
 class BlockProgressMonitor:
     """
     Simple in-memory monitor that tracks whether the chain appears stalled.
 
+    Two modes:
+      - `check_block_progress()` – one `getblockcount` per call (polling)
+      - `wait_for_block_progress()` – event-driven: blocks on the node's
+        `waitforblockheight(last + 1)` until a new block or until the stall
+        deadline, so a stall is reported the moment the threshold passes.
+        While stalled, each call waits one `fallback_poll_seconds` interval.
+        Clients/nodes without long-poll support fall back transparently to
+        polling `getblockcount` every `fallback_poll_seconds`.
+
     Usage:
         monitor = BlockProgressMonitor(rpc_client, stall_threshold_seconds=600)
         status = monitor.check_block_progress()
     """
 
-    def __init__(self, rpc_client: RpcClient, stall_threshold_seconds: int = 600) -> None:
+    def __init__(
+        self,
+        rpc_client: RpcClient,
+        stall_threshold_seconds: int = 600,
+        fallback_poll_seconds: float = 15.0,
+        sleep: Callable[[float], None] = time.sleep,
+        interval_stats: Optional[BlockIntervalStats] = None,
+        likely_stalled_probability: float = 0.99,
+    ) -> None:
         self.rpc_client = rpc_client
         self.stall_threshold_seconds = stall_threshold_seconds
+        self.fallback_poll_seconds = fallback_poll_seconds
+        self._sleep = sleep
+        self.interval_stats = interval_stats or BlockIntervalStats()
+        self.likely_stalled_probability = likely_stalled_probability
 
         self._last_height: Optional[int] = None
+        # Time the current height was first seen (i.e. of the last change).
         self._last_seen_at: Optional[datetime] = None
+        # True once _last_seen_at marks an observed height change rather
+        # than monitor start-up (only then is the next gap a real interval).
+        self._seen_change = False
+
+        # None = not tried yet; False = fall back to polling
+        self.long_poll_supported: Optional[bool] = None
 
     def check_block_progress(self) -> BlockProgressStatus:
         """
@@ -55,22 +226,88 @@ class BlockProgressMonitor:
               - status = "ok" or "stalled"
               - stalled_for_seconds >= threshold if stalled
         """
+        return self._record(self.rpc_client.get_block_count())
+
+    def wait_for_block_progress(self, timeout_seconds: Optional[float] = None) -> BlockProgressStatus:
+        """
+        Block until the chain advances past the last seen height, or until
+        the stall deadline (or `timeout_seconds`, if sooner) passes.
+
+        Once the stall deadline is behind us each call waits up to
+        `fallback_poll_seconds` for the next block, so a caller looping on
+        this during a stall issues one long-poll (or a couple of polls) per
+        interval rather than back-to-back RPCs.
+
+        The first call has nothing to wait for and simply records the tip.
+        """
+        if self._last_height is None or self._last_seen_at is None:
+            return self.check_block_progress()
+
+        elapsed = (datetime.now(timezone.utc) - self._last_seen_at).total_seconds()
+        wait = self.stall_threshold_seconds - elapsed
+        if wait <= 0:
+            wait = self.fallback_poll_seconds
+        if timeout_seconds is not None:
+            wait = min(wait, timeout_seconds)
+        if wait <= 0:
+            return self.check_block_progress()
+
+        target = self._last_height + 1
+        if self.long_poll_supported is not False:
+            height = self._long_poll(target, wait)
+            if height is not None:
+                return self._record(height)
+
+        # Polling fallback with the same "return on new block or deadline" contract.
+        deadline = time.monotonic() + wait
+        while True:
+            height = self.rpc_client.get_block_count()
+            remaining = deadline - time.monotonic()
+            if height >= target or remaining <= 0:
+                return self._record(height)
+            self._sleep(min(self.fallback_poll_seconds, remaining))
+
+    def _long_poll(self, target: int, wait: float) -> Optional[int]:
+        waiter = getattr(self.rpc_client, "wait_for_block_height", None)
+        if waiter is None:
+            self.long_poll_supported = False
+            return None
+        try:
+            height = int(waiter(target, wait))
+        except (RuntimeError, OSError) as exc:
+            if not _is_method_not_found(exc):
+                raise
+            logger.info("Node has no waitforblockheight; falling back to polling")
+            self.long_poll_supported = False
+            return None
+        self.long_poll_supported = True
+        return height
+
+    def _record(self, current_height: int) -> BlockProgressStatus:
         now = datetime.now(timezone.utc)
-        current_height = self.rpc_client.get_block_count()
 
         prev_height = self._last_height
         stalled_for_seconds = 0
         status = "ok"
+        stall_probability = 0.0
 
         if self._last_height is not None and self._last_seen_at is not None:
+            gap = (now - self._last_seen_at).total_seconds()
             if current_height == self._last_height:
-                stalled_for_seconds = int((now - self._last_seen_at).total_seconds())
+                stalled_for_seconds = int(gap)
+                stall_probability = self.interval_stats.stall_probability(gap)
                 if stalled_for_seconds >= self.stall_threshold_seconds:
                     status = "stalled"
+            elif current_height > self._last_height:
+                if self._seen_change:
+                    blocks = current_height - self._last_height
+                    self.interval_stats.observe(gap / blocks, blocks)
+                self._seen_change = True
 
-        # update internal state
+        # update internal state; the "seen at" clock only restarts on a new height
+        if current_height != self._last_height or self._last_seen_at is None:
+            self._last_seen_at = now
         self._last_height = current_height
-        self._last_seen_at = now
 
         result = BlockProgressStatus(
             timestamp=now,
@@ -78,14 +315,592 @@ class BlockProgressMonitor:
             previous_height=prev_height,
             status=status,
             stalled_for_seconds=stalled_for_seconds,
+            stall_probability=stall_probability,
+            likely_stalled=stall_probability >= self.likely_stalled_probability,
         )
 
-        log_level = logging.WARNING if status == "stalled" else logging.INFO
+        log_level = logging.WARNING if status == "stalled" or result.likely_stalled else logging.INFO
         logger.log(log_level, "Block progress status: %s", asdict(result))
 
         return result
 
 
+@dataclass
+class FleetPollResult:
+    """
+    What changed during one fleet poll.
+
+    Fleet-wide views (max height, lagging, stalled) are read from the
+    FleetBlockProgressMonitor itself; this only carries the deltas.
+    """
+    timestamp: float
+    changed: List[str] = field(default_factory=list)
+    newly_stalled: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class FleetBlockProgressMonitor:
+    """
+    Tracks block progress for many nodes from one concurrent poll loop.
+
+    Per-node state lives in flat arrays indexed by node position:
+      - heights    (array 'q', -1 = never seen)
+      - last_seen  (array 'd', epoch seconds of the last height change)
+
+    Stall detection uses a min-heap of (deadline, index, seen_at) pushed only
+    when a height changes, so after the fetch a poll costs
+    O(changed nodes * log n) plus expired deadlines; unchanged nodes are not
+    visited and only changes are logged.
+
+    Usage:
+        fleet = FleetBlockProgressMonitor({"a": rpc_a, "b": rpc_b})
+        result = fleet.poll()
+        fleet.max_height(), fleet.lagging_nodes(), fleet.stalled_nodes()
+
+    Async pollers can skip `poll()` and feed `poll_block_counts()` output
+    (or plain heights) into `update()`:
+
+        results = await poll_block_counts(async_clients, deadline_seconds=5)
+        fleet.update(results)
+    """
+
+    def __init__(
+        self,
+        rpc_clients: Mapping[str, RpcClient],
+        stall_threshold_seconds: int = 600,
+        lag_threshold_blocks: int = 2,
+        max_workers: int = 32,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.node_ids: List[str] = list(rpc_clients)
+        self._clients: List[RpcClient] = [rpc_clients[n] for n in self.node_ids]
+        self._index: Dict[str, int] = {n: i for i, n in enumerate(self.node_ids)}
+
+        self.stall_threshold_seconds = stall_threshold_seconds
+        self.lag_threshold_blocks = lag_threshold_blocks
+        self._clock = clock
+
+        n = len(self.node_ids)
+        self.heights = array("q", [-1]) * n
+        self.last_seen = array("d", [0.0]) * n
+
+        self._deadlines: List[Tuple[float, int, float]] = []
+        self._stalled: Set[int] = set()
+        self._errors: Dict[int, str] = {}
+        self._max_height = -1
+
+        self._max_workers = max(1, min(max_workers, n or 1))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------ #
+    # Polling
+    # ------------------------------------------------------------------ #
+
+    def _fetch(self, idx: int) -> Union[int, Exception]:
+        try:
+            return int(self._clients[idx].get_block_count())
+        except Exception as exc:  # noqa: BLE001 – reported per node
+            return exc
+
+    def poll(self) -> FleetPollResult:
+        """Fetch every node's height concurrently and apply the results."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="sentinel-fleet"
+            )
+        fetched = self._executor.map(self._fetch, range(len(self._clients)))
+        return self.update(dict(zip(self.node_ids, fetched)))
+
+    def update(
+        self,
+        results: Mapping[str, Any],
+        now: Optional[float] = None,
+    ) -> FleetPollResult:
+        """
+        Apply {node_id: height | None | exception | NodePollResult} observed
+        at `now`.
+
+        None/exceptions (and NodePollResults carrying an error) mark a node
+        as errored without touching its height.
+        """
+        now = self._clock() if now is None else now
+        out = FleetPollResult(timestamp=now)
+        heights = self.heights
+        recompute_max = False
+
+        for node, value in results.items():
+            idx = self._index[node]
+            if not (value is None or isinstance(value, (int, Exception))):
+                # async_rpc_client.NodePollResult (duck-typed: no asyncio import here)
+                value = value.error if value.error is not None else value.height
+            if value is None or isinstance(value, (Exception, str)):
+                if isinstance(value, Exception):
+                    msg = f"{type(value).__name__}: {value}"
+                else:
+                    msg = value or "no data"
+                self._errors[idx] = msg
+                out.errors[node] = msg
+                continue
+            self._errors.pop(idx, None)
+
+            old = heights[idx]
+            if value == old:
+                continue
+
+            heights[idx] = value
+            self.last_seen[idx] = now
+            self._stalled.discard(idx)
+            heapq.heappush(self._deadlines, (now + self.stall_threshold_seconds, idx, now))
+            out.changed.append(node)
+
+            if value > self._max_height:
+                self._max_height = value
+            elif old == self._max_height:
+                recompute_max = True  # max holder went backwards (reorg)
+
+        if recompute_max:
+            self._max_height = max(heights) if len(heights) else -1
+
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, idx, seen_at = heapq.heappop(deadlines)
+            # Stale entry if the node advanced after this deadline was pushed.
+            if self.last_seen[idx] == seen_at and idx not in self._stalled:
+                self._stalled.add(idx)
+                out.newly_stalled.append(self.node_ids[idx])
+
+        if out.changed:
+            logger.debug("Fleet heights changed: %s", out.changed)
+        if out.newly_stalled:
+            logger.warning("Fleet nodes stalled: %s", out.newly_stalled)
+
+        return out
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------ #
+    # Fleet views
+    # ------------------------------------------------------------------ #
+
+    def height_of(self, node: str) -> Optional[int]:
+        h = self.heights[self._index[node]]
+        return None if h < 0 else h
+
+    def max_height(self) -> Optional[int]:
+        return None if self._max_height < 0 else self._max_height
+
+    def lagging_nodes(self) -> List[str]:
+        """Nodes more than `lag_threshold_blocks` behind the fleet max."""
+        if self._max_height < 0:
+            return []
+        floor = self._max_height - self.lag_threshold_blocks
+        return [self.node_ids[i] for i, h in enumerate(self.heights) if 0 <= h < floor]
+
+    def stalled_nodes(self) -> Set[str]:
+        return {self.node_ids[i] for i in self._stalled}
+
+    def errored_nodes(self) -> Dict[str, str]:
+        return {self.node_ids[i]: msg for i, msg in self._errors.items()}
+
+
+class PollRateLimiter:
+    """
+    Global cap on polls per second, shared by every scheduler in a fleet.
+
+    Implemented as GCRA (virtual scheduling): `reserve(at)` returns the
+    earliest time >= `at` at which a poll is allowed and books that slot.
+    O(1), no background thread, safe to share across threads.
+    """
+
+    def __init__(self, max_polls_per_second: float, burst: int = 1) -> None:
+        if max_polls_per_second <= 0:
+            raise ValueError("max_polls_per_second must be > 0")
+        self._period = 1.0 / max_polls_per_second
+        self._tolerance = max(0, burst - 1) * self._period
+        self._tat = float("-inf")  # theoretical arrival time
+        self._lock = threading.Lock()
+
+    def reserve(self, at: float) -> float:
+        with self._lock:
+            allowed = max(at, self._tat - self._tolerance)
+            self._tat = max(self._tat, allowed) + self._period
+            return allowed
+
+
+class AdaptivePollScheduler:
+    """
+    Chooses the delay before the next block-progress check.
+
+    - Tracks observed inter-block intervals in a BlockIntervalStats
+      (`stats`; EWMA mean exposed as `mean_interval`).
+    - Right after a new block a gap is expected, so the delay is
+      `max_interval`.
+    - As the gap grows, the delay decays with the chance that a healthy
+      chain still shows no block (exp(-elapsed / mean_interval)) down to
+      about one mean interval.
+    - Near `stall_threshold_seconds` the delay is at most a quarter of the
+      remaining time, so a stall is seen within ~25% of the threshold.
+    - Multiplicative jitter (+/- `jitter`) de-synchronises fleets.
+    - An optional shared PollRateLimiter caps total polls across the fleet.
+
+    Usage:
+        scheduler = AdaptivePollScheduler(stall_threshold_seconds=600)
+        while True:
+            status = monitor.check_block_progress()
+            scheduler.observe(status)
+            time.sleep(scheduler.next_delay())
+    """
+
+    def __init__(
+        self,
+        stall_threshold_seconds: float = 600,
+        expected_block_interval: float = 15.0,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        jitter: float = 0.1,
+        ewma_alpha: float = 0.1,
+        rate_limiter: Optional[PollRateLimiter] = None,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.stall_threshold_seconds = float(stall_threshold_seconds)
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.jitter = float(jitter)
+        self.rate_limiter = rate_limiter
+        self._rng = rng or random.Random()
+        self._clock = clock
+
+        self.stats = BlockIntervalStats(expected_block_interval, ewma_alpha=ewma_alpha)
+        self._last_height: Optional[int] = None
+        self._last_block_at: Optional[float] = None
+
+    @property
+    def mean_interval(self) -> float:
+        return self.stats.mean
+
+    def observe(self, status: BlockProgressStatus) -> None:
+        """Feed one BlockProgressStatus (height + timestamp)."""
+        self.observe_height(status.current_height, status.timestamp.timestamp())
+
+    def observe_height(self, height: int, at: float) -> None:
+        if self._last_height is None or self._last_block_at is None:
+            self._last_height, self._last_block_at = height, at
+            return
+        advanced = height - self._last_height
+        if advanced <= 0:
+            return
+        self.stats.observe((at - self._last_block_at) / advanced, advanced)
+        self._last_height, self._last_block_at = height, at
+
+    def base_delay(self, now: Optional[float] = None) -> float:
+        """Delay before jitter / rate limiting."""
+        now = self._clock() if now is None else now
+        if self._last_block_at is None:
+            return self.min_interval
+
+        elapsed = max(0.0, now - self._last_block_at)
+        survival = math.exp(-elapsed / max(self.mean_interval, 1e-9))
+        delay = max(self.mean_interval, self.max_interval * survival)
+
+        remaining = self.stall_threshold_seconds - elapsed
+        delay = min(delay, max(remaining, 0.0) / 4.0)
+        return min(self.max_interval, max(self.min_interval, delay))
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        now = self._clock() if now is None else now
+        delay = self.base_delay(now)
+        if self.jitter:
+            delay *= 1.0 + self._rng.uniform(-self.jitter, self.jitter)
+        delay = max(self.min_interval, delay)
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(now + delay) - now
+        return delay
+
+
+# --------------------------------------------------------------------------- #
+# Binary block-progress history
+# --------------------------------------------------------------------------- #
+
+# File layout: 16-byte header, then fixed-width little-endian records.
+#   header: magic, format version, record size, padding
+#   record: timestamp (epoch s, f64), current height (i64),
+#           previous height (i64, -1 = none), stalled seconds (u32),
+#           status code (u8), padding
+_STORE_MAGIC = b"SBPS"
+_STORE_VERSION = 1
+_STORE_HEADER = struct.Struct("<4sHH8x")
+_STORE_RECORD = struct.Struct("<dqqIB3x")
+
+_OUT_OF_ORDER_POLICIES = ("clamp", "skip", "raise")
+
+_STATUS_CODES: Dict[str, int] = {"ok": 0, "stalled": 1}
+_STATUS_NAMES: Tuple[str, ...] = ("ok", "stalled")
+
+# (timestamp, current_height, previous_height, stalled_for_seconds, status_code)
+BlockProgressRecord = Tuple[float, int, int, int, int]
+
+
+def _pack_status(status: BlockProgressStatus) -> bytes:
+    return _STORE_RECORD.pack(
+        status.timestamp.timestamp(),
+        status.current_height,
+        -1 if status.previous_height is None else status.previous_height,
+        max(0, int(status.stalled_for_seconds)),
+        _STATUS_CODES.get(status.status, 0),
+    )
+
+
+def record_to_status(record: BlockProgressRecord) -> BlockProgressStatus:
+    ts, height, prev, stalled, code = record
+    return BlockProgressStatus(
+        timestamp=datetime.fromtimestamp(ts, timezone.utc),
+        current_height=height,
+        previous_height=None if prev < 0 else prev,
+        status=_STATUS_NAMES[code] if code < len(_STATUS_NAMES) else "ok",
+        stalled_for_seconds=stalled,
+    )
+
+
+def _check_store_header(header: bytes, path: str) -> None:
+    magic, version, size = _STORE_HEADER.unpack(header)
+    if magic != _STORE_MAGIC or version != _STORE_VERSION or size != _STORE_RECORD.size:
+        raise ValueError(f"{path}: not a block-progress store (v{_STORE_VERSION})")
+
+
+class BlockProgressWriter:
+    """
+    Append-only writer for the binary block-progress store.
+
+    Records are 32 bytes and buffered in memory; they hit the file every
+    `buffer_records` appends, on `flush()` and on `close()`. The file stays
+    open between samples. A torn trailing record left by a crash is
+    truncated on open.
+
+    Stored timestamps are non-decreasing (the reader binary-searches on
+    them). A record older than the last one – e.g. after the wall clock
+    stepped back – is handled per `out_of_order`:
+      - "clamp"  store it with the last timestamp (default; keeps the sample)
+      - "skip"   drop it
+      - "raise"  raise ValueError
+    Clamped and skipped records are counted in `out_of_order_count`.
+
+    Usage:
+        with BlockProgressWriter("block_progress.sbps") as store:
+            store.append(monitor.check_block_progress())
+    """
+
+    def __init__(self, path: str, buffer_records: int = 64, out_of_order: str = "clamp") -> None:
+        if out_of_order not in _OUT_OF_ORDER_POLICIES:
+            raise ValueError(f"out_of_order must be one of {_OUT_OF_ORDER_POLICIES}")
+        self.path = path
+        self.buffer_records = max(1, buffer_records)
+        self.out_of_order = out_of_order
+        self.out_of_order_count = 0
+        self._buf = bytearray()
+        self._pending = 0
+        self._last_ts = float("-inf")
+
+        self._fh = open(path, "a+b")
+        self._fh.seek(0, os.SEEK_END)
+        size = self._fh.tell()
+        if size == 0:
+            self._fh.write(_STORE_HEADER.pack(_STORE_MAGIC, _STORE_VERSION, _STORE_RECORD.size))
+            self._fh.flush()
+            return
+
+        self._fh.seek(0)
+        _check_store_header(self._fh.read(_STORE_HEADER.size), path)
+        body = size - _STORE_HEADER.size
+        whole = _STORE_HEADER.size + (body // _STORE_RECORD.size) * _STORE_RECORD.size
+        if whole != size:
+            logger.warning("%s: truncating %d-byte partial record", path, size - whole)
+            self._fh.truncate(whole)
+        if whole > _STORE_HEADER.size:
+            self._fh.seek(whole - _STORE_RECORD.size)
+            self._last_ts = _STORE_RECORD.unpack(self._fh.read(_STORE_RECORD.size))[0]
+        self._fh.seek(0, os.SEEK_END)
+
+    def append(self, status: BlockProgressStatus) -> bool:
+        """Buffer one record; returns False if it was skipped as out of order."""
+        ts = status.timestamp.timestamp()
+        if ts < self._last_ts:
+            if self.out_of_order == "raise":
+                raise ValueError("timestamps must be non-decreasing")
+            self.out_of_order_count += 1
+            if self.out_of_order == "skip":
+                return False
+            status = replace(status, timestamp=datetime.fromtimestamp(self._last_ts, timezone.utc))
+            ts = self._last_ts
+        self._last_ts = ts
+        self._buf += _pack_status(status)
+        self._pending += 1
+        if self._pending >= self.buffer_records:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        if self._buf:
+            self._fh.write(self._buf)
+            self._buf.clear()
+            self._pending = 0
+        self._fh.flush()
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+
+    def __enter__(self) -> "BlockProgressWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BlockProgressReader:
+    """
+    Memory-mapped reader for the binary block-progress store.
+
+    Records are decoded on access only; `range(start, end)` locates its
+    bounds by binary search on the timestamp column, so reading a window is
+    O(log n + k) regardless of file size. The mapping covers the records
+    present when the reader was opened; call `refresh()` to pick up appends.
+
+    Usage:
+        with BlockProgressReader("block_progress.sbps") as history:
+            for ts, height, prev, stalled, code in history.range(t0, t1):
+                ...
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh = open(path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        size = os.fstat(self._fh.fileno()).st_size
+        if size < _STORE_HEADER.size:
+            raise ValueError(f"{self.path}: not a block-progress store (v{_STORE_VERSION})")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_store_header(self._mm[: _STORE_HEADER.size], self.path)
+        self._count = (size - _STORE_HEADER.size) // _STORE_RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> BlockProgressRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        assert self._mm is not None
+        return _STORE_RECORD.unpack_from(self._mm, _STORE_HEADER.size + index * _STORE_RECORD.size)
+
+    def _timestamp(self, index: int) -> float:
+        assert self._mm is not None
+        return struct.unpack_from("<d", self._mm, _STORE_HEADER.size + index * _STORE_RECORD.size)[0]
+
+    def bisect(self, ts: float) -> int:
+        """Index of the first record with timestamp >= `ts`."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp(mid) < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def span(
+        self,
+        start: Union[float, datetime, None] = None,
+        end: Union[float, datetime, None] = None,
+    ) -> Tuple[int, int]:
+        """Record index bounds [lo, hi) of a time window."""
+        lo = 0 if start is None else self.bisect(_epoch(start))
+        hi = self._count if end is None else self.bisect(_epoch(end))
+        return lo, max(lo, hi)
+
+    def range(
+        self,
+        start: Union[float, datetime, None] = None,
+        end: Union[float, datetime, None] = None,
+    ) -> Iterator[BlockProgressRecord]:
+        """Yield raw records with start <= timestamp < end (None = open bound)."""
+        lo, hi = self.span(start, end)
+        assert self._mm is not None
+        mm, base, size = self._mm, _STORE_HEADER.size, _STORE_RECORD.size
+        unpack = _STORE_RECORD.unpack_from
+        for i in range(lo, hi):
+            yield unpack(mm, base + i * size)
+
+    def statuses(
+        self,
+        start: Union[float, datetime, None] = None,
+        end: Union[float, datetime, None] = None,
+    ) -> List[BlockProgressStatus]:
+        return [record_to_status(r) for r in self.range(start, end)]
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._fh.close()
+
+    def __enter__(self) -> "BlockProgressReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _epoch(value: Union[float, datetime]) -> float:
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+def convert_jsonl_to_store(jsonl_path: str, store_path: str) -> int:
+    """
+    Append the JSON lines written by the old recorder example to a binary
+    store. Blank or malformed lines, and lines older than the record before
+    them, are skipped. Returns records written.
+    """
+    written = 0
+    with open(jsonl_path, "r", encoding="utf-8") as src, BlockProgressWriter(
+        store_path, buffer_records=1024, out_of_order="skip"
+    ) as store:
+        for line in src:
+            try:
+                entry = json.loads(line)
+                ts = datetime.fromisoformat(entry["timestamp"])
+                if ts.tzinfo is None:
+                    ts = ts.replace(tzinfo=timezone.utc)
+                status = BlockProgressStatus(
+                    timestamp=ts,
+                    current_height=int(entry["current_height"]),
+                    previous_height=entry.get("previous_height"),
+                    status=entry.get("status", "ok"),
+                    stalled_for_seconds=int(entry.get("stalled_for_seconds", 0)),
+                )
+            except (ValueError, KeyError, TypeError):
+                continue
+            if store.append(status):
+                written += 1
+        if store.out_of_order_count:
+            logger.warning(
+                "%s: skipped %d out-of-order record(s)", jsonl_path, store.out_of_order_count
+            )
+    return written
+
+
 # Optional: simple module-level helper for the README example
 
 _monitor: Optional[BlockProgressMonitor] = None
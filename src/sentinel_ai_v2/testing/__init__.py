@@ -0,0 +1,6 @@
+"""
+Test doubles for Sentinel AI.
+
+Nothing in the runtime package imports from here; these stand-ins exist for
+the test suite and benchmarks only.
+"""
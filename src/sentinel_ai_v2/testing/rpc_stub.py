@@ -0,0 +1,326 @@
+"""
+Local DigiByte JSON-RPC stand-in.
+
+A tiny HTTP/1.1 keep-alive server that answers JSON-RPC calls from an
+in-process handler table. It exists so RPC clients and monitors can be
+tested and benchmarked without a real node.
+
+Two flavours share the same dispatch logic:
+  - StubRpcNode       – threaded http.server (for sync clients)
+  - AsyncStubRpcNode  – asyncio streams server (for async clients)
+
+Usage:
+
+    with StubRpcNode(height=100) as node:
+        rpc = PooledRpcClient(node.url, "user", "pass")
+        assert rpc.get_block_count() == 100
+        node.height = 101
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RpcHandler = Callable[[List[Any]], Any]
+
+# HTTP status for a failed single (non-batch) call, as in bitcoind's
+# JSONErrorReply; batch replies are always 200.
+_ERROR_STATUS = {-32600: 400, -32601: 404}
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+class RpcError(Exception):
+    """Raise from a stub handler to return a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class _StubNodeBase:
+    """
+    In-process JSON-RPC node with a mutable `height` and pluggable handlers.
+
+    Built-in methods: `getblockcount`, `waitforblockheight`,
+    `waitfornewblock` (the latter two block the calling thread, so they are
+    meant for the threaded StubRpcNode). Extra methods are added through
+    `handlers` (method -> callable(params) -> result). JSON-RPC arrays are
+    answered as batches unless `support_batch=False`, which mimics nodes or
+    proxies that reject them with an HTTP error.
+
+    Status codes follow Bitcoin/DigiByte Core: a single call that fails is
+    answered with HTTP 500 (404 for method-not-found, 400 for an invalid
+    request) and the JSON-RPC error in the body; batches always get 200.
+
+    Counters:
+      - request_count     HTTP requests served
+      - call_count        individual JSON-RPC calls answered
+      - connection_count  TCP connections accepted (keep-alive => stays low)
+    """
+
+    def __init__(
+        self,
+        *,
+        height: int = 0,
+        handlers: Optional[Dict[str, RpcHandler]] = None,
+        latency_seconds: float = 0.0,
+        support_batch: bool = True,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._tip_changed = threading.Condition()
+        self._height = height
+
+        self.latency_seconds = latency_seconds
+        self.support_batch = support_batch
+        self.handlers: Dict[str, RpcHandler] = {
+            "getblockcount": lambda params: self.height,
+            "waitforblockheight": self._wait_for_block_height,
+            "waitfornewblock": self._wait_for_new_block,
+        }
+        if handlers:
+            self.handlers.update(handlers)
+
+        self.request_count = 0
+        self.call_count = 0
+        self.connection_count = 0
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, value: int) -> None:
+        with self._tip_changed:
+            self._height = value
+            self._tip_changed.notify_all()
+
+    def _tip(self) -> Dict[str, Any]:
+        return {"hash": f"{self._height:064x}", "height": self._height}
+
+    def _wait_for_block_height(self, params: List[Any]) -> Dict[str, Any]:
+        target = int(params[0])
+        timeout_ms = int(params[1]) if len(params) > 1 else 0
+        with self._tip_changed:
+            self._tip_changed.wait_for(
+                lambda: self._height >= target, timeout=timeout_ms / 1000.0 or None
+            )
+            return self._tip()
+
+    def _wait_for_new_block(self, params: List[Any]) -> Dict[str, Any]:
+        timeout_ms = int(params[0]) if params else 0
+        with self._tip_changed:
+            start = self._height
+            self._tip_changed.wait_for(
+                lambda: self._height != start, timeout=timeout_ms / 1000.0 or None
+            )
+            return self._tip()
+
+    # ------------------------------------------------------------------ #
+    # JSON-RPC dispatch
+    # ------------------------------------------------------------------ #
+
+    def _call(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.call_count += 1
+        rid = req.get("id")
+        handler = self.handlers.get(req.get("method", ""))
+        if handler is None:
+            return {"result": None, "error": {"code": -32601, "message": "Method not found"}, "id": rid}
+        try:
+            result = handler(list(req.get("params") or []))
+        except RpcError as exc:
+            return {"result": None, "error": {"code": exc.code, "message": exc.message}, "id": rid}
+        return {"result": result, "error": None, "id": rid}
+
+    def dispatch(self, body: bytes) -> Any:
+        """
+        Decode one HTTP body and return the JSON-serializable reply.
+
+        Raises ValueError for bodies the node rejects (bad JSON, or a batch
+        when `support_batch` is False).
+        """
+        payload = json.loads(body)
+        if isinstance(payload, list):
+            if not self.support_batch:
+                raise ValueError("batch not supported")
+            return [self._call(p) for p in payload]
+        return self._call(payload)
+
+    def _respond(self, body: bytes) -> Tuple[int, bytes]:
+        """Return (HTTP status, encoded reply) for one request body."""
+        with self._lock:
+            self.request_count += 1
+        try:
+            reply = self.dispatch(body)
+            status = 200
+            if isinstance(reply, dict) and reply["error"]:
+                status = _ERROR_STATUS.get(reply["error"]["code"], 500)
+        except ValueError:
+            reply = {"result": None, "error": {"code": -32700, "message": "Parse error"}, "id": None}
+            status = 500
+        return status, json.dumps(reply).encode("utf-8")
+
+
+class StubRpcNode(_StubNodeBase):
+    """Threaded HTTP/1.1 stub node; see _StubNodeBase for options."""
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def address(self) -> tuple:
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def start(self) -> "StubRpcNode":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="stub-rpc-node", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubRpcNode":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _make_handler(self):
+        node = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without TCP_NODELAY
+            # keep-alive clients stall on delayed ACKs (~40ms per call).
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with node._lock:
+                    node.connection_count += 1
+
+            def do_POST(self) -> None:  # noqa: N802 – http.server API
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                if node.latency_seconds:
+                    time.sleep(node.latency_seconds)
+                status, out = node._respond(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        return _Handler
+
+
+class AsyncStubRpcNode(_StubNodeBase):
+    """
+    asyncio-streams HTTP/1.1 stub node (keep-alive, Content-Length bodies).
+
+    Usage:
+        async with AsyncStubRpcNode(height=5) as node:
+            rpc = AsyncRpcClient(node.url, "u", "p")
+            assert await rpc.get_block_count() == 5
+    """
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._host = host
+        self._port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._conn_tasks: "set[asyncio.Task]" = set()
+
+    @property
+    def address(self) -> tuple:
+        assert self._server is not None, "node not started"
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    async def start(self) -> "AsyncStubRpcNode":
+        if self._server is None:
+            self._server = await asyncio.start_server(self._serve, self._host, self._port)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Connection handlers outlive the listening socket; end them too.
+            tasks, self._conn_tasks = self._conn_tasks, set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "AsyncStubRpcNode":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        with self._lock:
+            self.connection_count += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._conn_tasks.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = await reader.readexactly(length)
+                if self.latency_seconds:
+                    await asyncio.sleep(self.latency_seconds)
+                status, out = self._respond(body)
+                reason = _REASONS.get(status, "Error")
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(out)}\r\n\r\n".encode("latin-1") + out
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._conn_tasks.discard(task)  # type: ignore[arg-type]
+            writer.close()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 import time
 
 from .config import CircuitBreakerThresholds
 from .data_intake import TelemetrySnapshot, normalize_raw_telemetry
-from .model_loader import LoadedModel, run_model_inference
+from .inference_cache import InferenceCache
+from .model_loader import LoadedModel, ModelEnsemble, run_model_inference
 from .scoring import SentinelScore, compute_risk_score
 
 from .contracts import ReasonCode, SentinelV3Request, canonical_hash_v3
@@ -15,7 +16,8 @@ from .contracts import ReasonCode, SentinelV3Request, canonical_hash_v3
 @dataclass(frozen=True)
 class SentinelV3:
     thresholds: CircuitBreakerThresholds
-    model: Optional[LoadedModel] = None
+    model: Optional[Union[LoadedModel, ModelEnsemble]] = None
+    inference_cache: Optional[InferenceCache] = None
 
     COMPONENT: str = "sentinel"
     CONTRACT_VERSION: int = 3
@@ -80,9 +82,22 @@ class SentinelV3:
             "reorg_depth": (snapshot.reorg or {}).get("depth", 0),
         }
 
+        # Read the model reference once so a concurrent hot reload cannot mix
+        # two models within a single evaluation.
+        model = self.model
         model_used = False
-        if self.model is not None:
-            features["model_score"] = run_model_inference(self.model, features)
+        if model is not None:
+            if isinstance(model, ModelEnsemble):
+                def _infer(inputs: Dict[str, Any]) -> float:
+                    return model.evaluate(inputs).score
+            else:
+                def _infer(inputs: Dict[str, Any]) -> float:
+                    return run_model_inference(model, inputs)
+
+            cache = self.inference_cache
+            features["model_score"] = (
+                cache.get_or_compute(model, features, _infer) if cache is not None else _infer(features)
+            )
             model_used = True
 
         sentinel_score: SentinelScore = compute_risk_score(
@@ -90,15 +105,18 @@ class SentinelV3:
             thresholds=self.thresholds,
         )
 
-        context_hash = canonical_hash_v3(
-            {
-                "component": self.COMPONENT,
-                "contract_version": self.CONTRACT_VERSION,
-                "telemetry": req.telemetry,
-                "thresholds": self._thresholds_fingerprint(self.thresholds),
-                "model_used": bool(model_used),
-            }
-        )
+        context_payload: Dict[str, Any] = {
+            "component": self.COMPONENT,
+            "contract_version": self.CONTRACT_VERSION,
+            "telemetry": req.telemetry,
+            "thresholds": self._thresholds_fingerprint(self.thresholds),
+            "model_used": bool(model_used),
+        }
+        if model_used:
+            # Different model bytes => different context (cache invalidation).
+            context_payload["model_hash"] = self._model_fingerprint(model)
+
+        context_hash = canonical_hash_v3(context_payload)
 
         decision = self._map_status_to_decision(sentinel_score.status)
 
@@ -167,6 +185,11 @@ class SentinelV3:
         except Exception:
             return {"_": "unavailable"}
 
+    @staticmethod
+    def _model_fingerprint(model: Any) -> Optional[str]:
+        h = getattr(model, "hash", None)
+        return str(h) if h is not None else None
+
     def _error_response(
         self,
         request_id: str,
@@ -20,18 +20,31 @@ class SentinelWrapper:
     """
 
     def __init__(self, client: Optional[SentinelClient] = None) -> None:
-        if client is None:
-            cfg = load_config()
-            client = SentinelClient(config=cfg)
-
+        # Default client is built on first use (see _get_client) so that
+        # constructing a wrapper at import time (server.py) stays cheap.
         self._client = client
         self._monitor = Monitor()
 
+    def _get_client(self) -> SentinelClient:
+        if self._client is None:
+            cfg = load_config()
+            self._client = SentinelClient(config=cfg)
+        return self._client
+
+    def warmup(self) -> None:
+        """
+        Build the client and load the model ahead of the first request.
+        """
+        client = self._get_client()
+        warm = getattr(client, "warmup", None)
+        if warm is not None:
+            warm()
+
     def evaluate(self, raw_telemetry: Dict[str, Any]) -> SentinelResult:
         """
         Evaluate one telemetry snapshot and update internal monitor.
         """
-        result = run_full_workflow(raw_telemetry, client=self._client)
+        result = run_full_workflow(raw_telemetry, client=self._get_client())
         self._monitor.update(result)
         return result
 
@@ -0,0 +1,101 @@
+import pytest
+
+from sentinel_ai_v2.adaptive_core_bridge import SentinelAdaptiveCoreBridge
+from sentinel_ai_v2.adaptive_core_stub import (
+    AdaptiveCoreServer,
+    CoreUnavailable,
+    FakeAdaptiveCoreInterface,
+    RemoteAdaptiveCoreInterface,
+    StubThreatPacket,
+)
+from sentinel_ai_v2.adaptive_hooks import report_reorg_anomaly_to_adaptive
+from sentinel_ai_v2.event_spool import EventSpool
+from sentinel_ai_v2.feedback_hooks import send_feedback_to_adaptive
+from sentinel_ai_v2.heartbeat import heartbeat_data
+
+
+def _threat(i):
+    return {"source_layer": "sentinel", "threat_type": "reorg", "severity": i, "description": "d"}
+
+
+def test_bridge_runs_on_fake_interface_without_adaptive_core():
+    core = FakeAdaptiveCoreInterface()
+    bridge = SentinelAdaptiveCoreBridge(interface=core, packet_type=StubThreatPacket)
+    assert bridge.is_available
+
+    report_reorg_anomaly_to_adaptive(10, 0.7, bridge=bridge)
+    send_feedback_to_adaptive(layer="sentinel", event_id="e1", feedback="true_positive", bridge=bridge)
+    bridge.submit_threats(_threat(i) for i in range(4))
+
+    assert core.stats() == {"calls": 3, "threats": 5, "feedback": 1, "failures": 0}
+    assert core.threats[0].severity == 7 and core.threats[0].threat_type == "reorg_pattern"
+    assert core.feedback[0].feedback == "TRUE_POSITIVE"
+
+    data = heartbeat_data(min_severity=3, bridge=bridge)
+    assert "5 threats" in data["immune_report"] and "2 recorded with severity >= 3" in data["immune_report"]
+    assert data["last_updates"]["last_threat_received"] is not None
+
+
+def test_default_packet_type_and_per_packet_fallback():
+    core = FakeAdaptiveCoreInterface(batch_api=False, record=True)
+    bridge = SentinelAdaptiveCoreBridge(interface=core)
+    bridge.submit_threats([_threat(1), _threat(2)])
+    assert core.call_count == 2
+    assert [p.severity for p in core.threats] == [1, 2]
+
+
+def test_failure_injection_feeds_the_spool(tmp_path):
+    core = FakeAdaptiveCoreInterface(failure_rate=1.0, seed=1)
+    now = [0.0]
+    bridge = SentinelAdaptiveCoreBridge(
+        interface=core,
+        packet_type=StubThreatPacket,
+        spool=EventSpool(str(tmp_path)),
+        retry_interval=5.0,
+        clock=lambda: now[0],
+    )
+    bridge.submit_threats([_threat(1), _threat(2)])
+    bridge.submit_simple_threat(**_threat(3))  # within retry interval: spooled, no call
+    assert core.failure_count == 1 and core.threat_count == 0
+
+    core.failure_rate = 0.0
+    now[0] = 10.0
+    bridge.submit_simple_threat(**_threat(4))
+    assert [p.severity for p in core.threats] == [1, 2, 3, 4]
+    assert not bridge.spool.has_pending()
+    bridge.spool.close()
+
+    core.down = True
+    with pytest.raises(CoreUnavailable):
+        core.get_adaptive_state()
+
+
+def test_socket_stand_in_round_trips_and_reports_failures():
+    core = FakeAdaptiveCoreInterface(layer_weights={"sentinel": 0.75})
+    with AdaptiveCoreServer(core) as server, RemoteAdaptiveCoreInterface(server.address) as remote:
+        bridge = SentinelAdaptiveCoreBridge(interface=remote, packet_type=StubThreatPacket)
+        bridge.submit_threats([_threat(1), _threat(9)])
+        bridge.submit_simple_threat(**_threat(5), metadata={"k": "v"})
+        bridge.submit_feedback_labels([{"layer": "s", "feedback": "missed_attack", "event_id": "x"}])
+
+        assert core.threats[1] == StubThreatPacket(**{**_threat(9), "node_id": None, "wallet_id": None,
+                                                      "tx_id": None, "block_height": None, "metadata": None})
+        assert core.threats[2].metadata == {"k": "v"}
+        assert core.feedback[0].feedback == "MISSED_ATTACK"
+
+        data = heartbeat_data(bridge=bridge)
+        assert data["adaptive_state"]["layer_weights"] == {"sentinel": 0.75}
+        assert data["last_updates"]["last_learning_update"] is not None
+
+        core.down = True
+        with pytest.raises(CoreUnavailable):
+            remote.submit_threat_packet(StubThreatPacket(**_threat(1)))
+        core.down = False
+        with pytest.raises(RuntimeError):
+            remote._call("no_such_method")
+
+        assert server.connection_count == 1
+        assert server.request_count == 8
+
+    with pytest.raises(OSError):
+        RemoteAdaptiveCoreInterface(server.address, timeout=0.5).get_last_update_metadata()
@@ -0,0 +1,137 @@
+import threading
+import time
+
+import pytest
+
+import sentinel_ai_v2.adaptive_bridge as ab
+from sentinel_ai_v2.adaptive_emitter import (
+    BLOCK,
+    DROP_NEWEST,
+    DROP_OLDEST,
+    BatchingEventEmitter,
+)
+from sentinel_ai_v2.adaptive_event import AdaptiveEvent
+
+
+class _RecordingSink:
+    def __init__(self, gate=None):
+        self.batches = []
+        self.gate = gate
+
+    def __call__(self, batch):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append([e.anomaly_type for e in batch])
+
+
+def _evt(i):
+    return AdaptiveEvent(anomaly_type=f"e{i}")
+
+
+def test_size_triggered_batches_and_flush_on_close():
+    sink = _RecordingSink()
+    emitter = BatchingEventEmitter(sink, batch_size=4, flush_interval=60.0)
+    for i in range(10):
+        assert emitter.emit(_evt(i))
+    assert emitter.close(timeout=5)
+
+    flat = [name for batch in sink.batches for name in batch]
+    assert flat == [f"e{i}" for i in range(10)]
+    assert all(len(b) <= 4 for b in sink.batches)
+    assert emitter.stats()["sent"] == 10
+    assert emitter.emit(_evt(99)) is False  # closed
+
+
+def test_time_triggered_batch():
+    sink = _RecordingSink()
+    with BatchingEventEmitter(sink, batch_size=100, flush_interval=0.05) as emitter:
+        emitter.emit(_evt(1))
+        deadline = time.monotonic() + 5
+        while not sink.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.batches == [["e1"]]
+
+
+def _stalled_emitter(overflow, **kw):
+    gate = threading.Event()
+    sink = _RecordingSink(gate)
+    emitter = BatchingEventEmitter(sink, max_queue=2, batch_size=1, flush_interval=0.0, overflow=overflow, **kw)
+    emitter.emit(_evt(0))  # taken by the flusher, which then blocks in the sink
+    deadline = time.monotonic() + 5
+    while emitter.stats()["queued"] and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return emitter, sink, gate
+
+
+def test_overflow_drop_oldest():
+    emitter, sink, gate = _stalled_emitter(DROP_OLDEST)
+    for i in range(1, 5):
+        assert emitter.emit(_evt(i))
+    assert emitter.stats()["dropped_oldest"] == 2
+    gate.set()
+    emitter.close()
+    assert [b[0] for b in sink.batches] == ["e0", "e3", "e4"]
+
+
+def test_overflow_drop_newest():
+    emitter, sink, gate = _stalled_emitter(DROP_NEWEST)
+    results = [emitter.emit(_evt(i)) for i in range(1, 5)]
+    assert results == [True, True, False, False]
+    assert emitter.stats()["dropped_newest"] == 2
+    gate.set()
+    emitter.close()
+    assert [b[0] for b in sink.batches] == ["e0", "e1", "e2"]
+
+
+def test_overflow_block_waits_then_times_out():
+    emitter, sink, gate = _stalled_emitter(BLOCK, block_timeout=0.05)
+    assert emitter.emit(_evt(1)) and emitter.emit(_evt(2))
+    assert emitter.emit(_evt(3)) is False  # sink never frees room in time
+    assert emitter.stats()["blocked"] == 1
+
+    threading.Timer(0.05, gate.set).start()
+    emitter.block_timeout = 5
+    assert emitter.emit(_evt(4)) is True
+    emitter.close()
+    assert [b[0] for b in sink.batches] == ["e0", "e1", "e2", "e4"]
+
+
+def test_sink_errors_are_counted_and_flusher_survives():
+    calls = []
+
+    def flaky(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise RuntimeError("down")
+
+    emitter = BatchingEventEmitter(flaky, batch_size=1, flush_interval=60.0)
+    emitter.emit(_evt(1))
+    assert emitter.flush(timeout=5)
+    emitter.emit(_evt(2))
+    assert emitter.flush(timeout=5)
+    emitter.close()
+    stats = emitter.stats()
+    assert stats["sink_errors"] == 1 and stats["dropped_failed"] == 1 and stats["sent"] == 1
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        BatchingEventEmitter(overflow="nope")
+    with pytest.raises(ValueError):
+        BatchingEventEmitter(max_queue=0)
+
+
+def test_bridge_routes_through_installed_emitter(monkeypatch):
+    logged = []
+    monkeypatch.setattr(ab, "emit_adaptive_event", logged.append)
+
+    emitter = BatchingEventEmitter(flush_interval=60.0)  # default sink logs each event
+    previous = ab.set_event_sink(emitter)
+    try:
+        ab.emit_adaptive_event_from_signal(signal_name="mempool_flood", severity=0.9)
+        assert logged == []  # queued, not emitted on the caller's thread
+        assert len(emitter) == 1
+    finally:
+        ab.set_event_sink(previous)
+    emitter.close()
+    assert [e.anomaly_type for e in logged] == ["mempool_flood"]
@@ -0,0 +1,72 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from sentinel_ai_v2.telemetry_monitor import (
+    AdaptivePollScheduler,
+    BlockProgressStatus,
+    PollRateLimiter,
+)
+
+
+def _sched(**kw):
+    kw.setdefault("jitter", 0.0)
+    return AdaptivePollScheduler(stall_threshold_seconds=600, clock=lambda: 0.0, **kw)
+
+
+def test_scheduler_polls_rarely_after_block_and_faster_near_threshold():
+    s = _sched(expected_block_interval=15.0, max_interval=60.0, min_interval=1.0)
+    assert s.base_delay(0.0) == 1.0  # nothing observed yet
+
+    s.observe_height(100, 0.0)
+    just_after = s.base_delay(0.0)
+    mid_gap = s.base_delay(120.0)
+    near_threshold = s.base_delay(590.0)
+    past_threshold = s.base_delay(700.0)
+
+    assert just_after == 60.0
+    assert mid_gap == pytest.approx(15.0)
+    assert near_threshold == pytest.approx(2.5)
+    assert past_threshold == 1.0
+    assert just_after > mid_gap > near_threshold > past_threshold
+
+
+def test_scheduler_learns_block_interval_from_observations():
+    s = _sched(expected_block_interval=15.0, ewma_alpha=0.5)
+    s.observe(
+        BlockProgressStatus(
+            timestamp=datetime.fromtimestamp(0, tz=timezone.utc),
+            current_height=10,
+            previous_height=None,
+            status="ok",
+            stalled_for_seconds=0,
+        )
+    )
+    s.observe_height(12, 120.0)  # 2 blocks in 120s -> 60s per block
+    assert s.mean_interval == pytest.approx(37.5)
+    s.observe_height(12, 200.0)  # no progress -> no update
+    assert s.mean_interval == pytest.approx(37.5)
+
+
+def test_scheduler_jitter_stays_within_bounds():
+    s = AdaptivePollScheduler(jitter=0.2, rng=random.Random(7), clock=lambda: 0.0)
+    s.observe_height(1, 0.0)
+    delays = [s.next_delay() for _ in range(50)]
+    assert min(delays) >= 48.0 and max(delays) <= 72.0
+    assert len(set(delays)) > 1
+
+
+def test_rate_limiter_caps_fleet_polls():
+    limiter = PollRateLimiter(max_polls_per_second=10, burst=2)
+    slots = [limiter.reserve(0.0) for _ in range(5)]
+    # burst of 2 at t=0, then one every 100ms
+    assert slots == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.3])
+
+    s = _sched(rate_limiter=PollRateLimiter(1.0))
+    s.observe_height(1, 0.0)
+    assert s.next_delay(0.0) == 60.0
+    assert s.next_delay(0.0) == 61.0  # second poll pushed back by the cap
+
+    with pytest.raises(ValueError):
+        PollRateLimiter(0)
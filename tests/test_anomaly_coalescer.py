@@ -0,0 +1,185 @@
+import json
+
+import pytest
+
+import sentinel_ai_v2.adaptive_bridge as ab
+from sentinel_ai_v2.adaptive_event import AdaptiveEvent
+from sentinel_ai_v2.adaptive_hooks import flush_reorg_coalescer, report_reorg_anomaly_to_adaptive
+from sentinel_ai_v2.anomaly_coalescer import AnomalyCoalescer, CoalescedAdaptiveEvent
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _evt(severity=0.5, height=100, kind="mempool_flood", ns=None):
+    return AdaptiveEvent(anomaly_type=kind, severity=severity, block_height=height, created_at_ns=ns)
+
+
+def test_burst_passes_then_excess_is_aggregated():
+    clock = _Clock()
+    c = AnomalyCoalescer(rate=1.0, burst=2, clock=clock)
+
+    first, second = _evt(ns=1_000), _evt(ns=2_000)
+    assert c.offer(first) == [first]
+    assert c.offer(second) == [second]
+    for i, sev in enumerate((0.3, 0.9, 0.4)):
+        assert c.offer(_evt(severity=sev, ns=3_000 + i * 1000)) == []
+
+    clock.now = 1.0  # one token back: next event releases the aggregate
+    [agg] = c.offer(_evt(severity=0.1, ns=9_000))
+    assert isinstance(agg, CoalescedAdaptiveEvent)
+    assert agg.count == 4
+    assert agg.severity == 0.9
+    assert agg.first_seen_ns == 3_000 and agg.created_at_ns == 9_000
+    payload = json.loads(agg.to_json())
+    assert payload["count"] == 4 and payload["first_seen"] != payload["last_seen"]
+    assert c.stats() == {"keys": 1, "passed": 2, "coalesced": 3, "aggregates": 1, "evicted_keys": 0}
+
+
+def test_keys_split_by_type_and_height_bucket():
+    c = AnomalyCoalescer(rate=1.0, burst=1, height_bucket=10, clock=_Clock())
+    assert c.key_for(_evt(height=105)) == ("sentinel", "mempool_flood", 10)
+    assert c.key_for(_evt(height=None)) == ("sentinel", "mempool_flood", None)
+
+    assert len(c.offer(_evt(height=101))) == 1
+    assert c.offer(_evt(height=109)) == []           # same bucket, limited
+    assert len(c.offer(_evt(height=110))) == 1       # next bucket
+    assert len(c.offer(_evt(kind="entropy_drop", height=101))) == 1
+    assert len(c) == 3
+
+
+def test_flush_releases_when_tokens_return_or_forced():
+    clock = _Clock()
+    c = AnomalyCoalescer(rate=0.5, burst=1, clock=clock)
+    c.offer(_evt())
+    c.offer(_evt())
+    assert c.flush() == []
+    clock.now = 2.0
+    [agg] = c.flush()
+    assert agg.count == 1
+
+    c.offer(_evt())
+    [forced] = c.flush(force=True)
+    assert forced.count == 1
+
+    clock.now = 100.0
+    assert c.flush() == [] and len(c) == 0  # idle keys are forgotten
+
+
+def test_key_table_is_bounded_and_eviction_releases_pending():
+    c = AnomalyCoalescer(rate=1.0, burst=1, max_keys=2, clock=_Clock())
+    c.offer(_evt(height=1))
+    c.offer(_evt(height=1, severity=0.7))  # pending aggregate for key 1
+    c.offer(_evt(height=2))
+    out = c.offer(_evt(height=3))          # evicts key 1
+    assert len(c) == 2 and c.evicted_keys == 1
+    assert [e.block_height for e in out] == [1, 3]
+    assert isinstance(out[0], CoalescedAdaptiveEvent) and out[0].severity == 0.7
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        AnomalyCoalescer(rate=0)
+
+
+def test_emit_from_signal_uses_coalescer(monkeypatch):
+    exported = []
+    monkeypatch.setattr(ab, "export_to_adaptive_core", exported.append)
+    c = AnomalyCoalescer(rate=1.0, burst=1, clock=_Clock())
+    for _ in range(50):
+        ab.emit_adaptive_event_from_signal(signal_name="mempool_flood", severity=0.8, coalescer=c)
+    assert len(exported) == 1
+    [agg] = c.flush(force=True)
+    assert agg.count == 49
+
+
+class _Bridge:
+    is_available = True
+
+    def __init__(self):
+        self.calls = []
+
+    def submit_simple_threat(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def test_reorg_hook_coalesces_and_reports_counts():
+    clock = _Clock()
+    c = AnomalyCoalescer(rate=1.0, burst=1, clock=clock)
+    bridge = _Bridge()
+    for score in (0.5, 0.6, 0.9, 0.7):
+        report_reorg_anomaly_to_adaptive(200, score, details={"window": "30s"}, bridge=bridge, coalescer=c)
+    assert len(bridge.calls) == 1
+
+    clock.now = 5.0
+    report_reorg_anomaly_to_adaptive(200, 0.2, bridge=bridge, coalescer=c)
+    agg = bridge.calls[-1]
+    assert agg["severity"] == 9
+    assert agg["block_height"] == 200
+    assert agg["metadata"]["coalesced_count"] == 4
+    assert agg["metadata"]["score"] == 0.9
+    assert "first_seen" in agg["metadata"] and "last_seen" in agg["metadata"]
+
+
+def test_shared_coalescer_keeps_other_aggregates_and_details_apart(monkeypatch):
+    exported = []
+    monkeypatch.setattr(ab, "export_to_adaptive_core", exported.append)
+    c = AnomalyCoalescer(rate=1.0, burst=1, max_keys=2, clock=_Clock())
+    bridge = _Bridge()
+
+    for _ in range(3):
+        ab.emit_adaptive_event_from_signal(signal_name="mempool_flood", severity=0.8, coalescer=c)
+    for _ in range(3):
+        report_reorg_anomaly_to_adaptive(100, 0.5, details={"peer": "a"}, bridge=bridge, coalescer=c)
+    assert len(exported) == 1 and len(bridge.calls) == 1
+
+    # A third key evicts the pending mempool aggregate: it is exported as
+    # mempool_flood, not submitted as a reorg with this call's details.
+    report_reorg_anomaly_to_adaptive(300, 0.6, details={"peer": "b"}, bridge=bridge, coalescer=c)
+    assert exported[-1].anomaly_type == "mempool_flood" and exported[-1].count == 2
+    assert [call["block_height"] for call in bridge.calls] == [100, 300]
+    assert bridge.calls[-1]["metadata"]["peer"] == "b"
+
+    # A fourth key evicts the pending reorg aggregate for height 100; it
+    # must not inherit details from the height-500 call.
+    report_reorg_anomaly_to_adaptive(500, 0.7, details={"peer": "c"}, bridge=bridge, coalescer=c)
+    evicted = next(call for call in bridge.calls[2:] if call["block_height"] == 100)
+    assert evicted["metadata"]["coalesced_count"] == 2
+    assert "peer" not in evicted["metadata"]
+    assert all(call["threat_type"] == "reorg_pattern" for call in bridge.calls)
+
+
+def test_flush_reorg_coalescer_sends_pending_aggregates(monkeypatch):
+    exported = []
+    monkeypatch.setattr(ab, "export_to_adaptive_core", exported.append)
+    clock = _Clock()
+    c = AnomalyCoalescer(rate=1.0, burst=1, clock=clock)
+    bridge = _Bridge()
+    for score in (0.4, 0.8, 0.6):
+        report_reorg_anomaly_to_adaptive(200, score, details={"window": "30s"}, bridge=bridge, coalescer=c)
+    ab.emit_adaptive_event_from_signal(signal_name="mempool_flood", severity=0.8, coalescer=c)
+    ab.emit_adaptive_event_from_signal(signal_name="mempool_flood", severity=0.8, coalescer=c)
+    assert len(bridge.calls) == 1 and len(exported) == 1
+
+    assert flush_reorg_coalescer(bridge, c) == 0  # no token yet
+    assert flush_reorg_coalescer(bridge, c, force=True) == 1
+    agg = bridge.calls[-1]
+    assert agg["metadata"]["coalesced_count"] == 2
+    assert agg["severity"] == 8
+    assert "window" not in agg["metadata"]
+    assert exported[-1].anomaly_type == "mempool_flood"
+    assert flush_reorg_coalescer(bridge, c, force=True) == 0
+
+    class _Offline:
+        is_available = False
+        spool = None
+
+    report_reorg_anomaly_to_adaptive(200, 0.9, bridge=bridge, coalescer=c)
+    report_reorg_anomaly_to_adaptive(200, 0.9, bridge=bridge, coalescer=c)
+    assert flush_reorg_coalescer(_Offline(), c, force=True) == 0
+    assert len(c.flush(force=True)) == 0
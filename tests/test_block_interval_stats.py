@@ -0,0 +1,101 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from sentinel_ai_v2.telemetry_monitor import BlockIntervalStats, BlockProgressMonitor
+
+
+class _Rpc:
+    def __init__(self, height):
+        self.height = height
+
+    def get_block_count(self):
+        return self.height
+
+
+def _trained(seed=1, n=2000, mean=15.0):
+    rng = random.Random(seed)
+    stats = BlockIntervalStats(expected_block_interval=mean)
+    for _ in range(n):
+        stats.observe(rng.expovariate(1.0 / mean))
+    return stats, rng
+
+
+def test_ewma_mean_and_variance_track_exponential_intervals():
+    stats, _ = _trained()
+    assert stats.count == 2000
+    assert stats.mean == pytest.approx(15.0, rel=0.35)
+    assert stats.std == pytest.approx(15.0, rel=0.5)
+    assert sum(stats.histogram) <= stats.histogram_window
+
+
+def test_stall_probability_rises_well_before_fixed_threshold():
+    stats, _ = _trained()
+    probs = [stats.stall_probability(t) for t in (15, 60, 120, 240, 600)]
+    assert probs == sorted(probs)
+    assert probs[0] < 0.01
+    assert stats.stall_probability(300) > 0.99  # half of a 600s threshold
+
+
+def test_likely_stalled_is_rare_for_a_healthy_chain():
+    stats, rng = _trained(seed=2)
+    gaps = [rng.expovariate(1.0 / 15.0) for _ in range(100_000)]
+    false_alarms = sum(stats.stall_probability(g) >= 0.99 for g in gaps)
+    assert false_alarms / len(gaps) < 1e-3
+
+
+def test_histogram_remembers_long_healthy_gaps():
+    stats = BlockIntervalStats(expected_block_interval=15.0)
+    base = stats.stall_probability(400)
+    for _ in range(50):
+        stats.observe(15.0)
+    for _ in range(5):
+        stats.observe(500.0)
+        stats.observe(1500.0)
+    assert stats.longest == 1500.0
+    assert stats.stall_probability(400) < base
+    assert stats.stall_probability(1200) < 0.5
+    stats.observe(-1.0)  # ignored
+    assert stats.count == 60
+
+
+def test_invalid_prior_rejected():
+    with pytest.raises(ValueError):
+        BlockIntervalStats(stall_prior=0.0)
+
+
+def test_monitor_reports_likely_stall_before_threshold():
+    rpc = _Rpc(100)
+    stats, _ = _trained()
+    monitor = BlockProgressMonitor(rpc, stall_threshold_seconds=600, interval_stats=stats)
+
+    first = monitor.check_block_progress()
+    assert first.stall_probability == 0.0 and not first.likely_stalled
+
+    monitor._last_seen_at -= timedelta(seconds=30)
+    status = monitor.check_block_progress()
+    assert status.status == "ok" and not status.likely_stalled
+
+    monitor._last_seen_at -= timedelta(seconds=300)
+    status = monitor.check_block_progress()
+    assert status.status == "ok"
+    assert status.likely_stalled
+    assert status.stall_probability > 0.99
+
+
+def test_monitor_learns_intervals_only_from_observed_changes():
+    rpc = _Rpc(100)
+    monitor = BlockProgressMonitor(rpc)
+    monitor.check_block_progress()
+
+    rpc.height = 101  # first change: gap since start-up is not an interval
+    monitor._last_seen_at -= timedelta(seconds=100)
+    monitor.check_block_progress()
+    assert monitor.interval_stats.count == 0
+
+    rpc.height = 103
+    monitor._last_seen_at -= timedelta(seconds=40)
+    monitor.check_block_progress()
+    assert monitor.interval_stats.count == 2
+    assert monitor.interval_stats.histogram[5] == 2  # 20s per block -> [16, 32)
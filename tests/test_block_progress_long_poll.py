@@ -0,0 +1,205 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from sentinel_ai_v2.rpc_client import PooledRpcClient, SimpleRpcClient
+from sentinel_ai_v2.testing.rpc_stub import StubRpcNode
+from sentinel_ai_v2.telemetry_monitor import BlockProgressMonitor
+
+
+def test_long_poll_returns_as_soon_as_a_block_arrives():
+    with StubRpcNode(height=10) as node:
+        rpc = SimpleRpcClient(node.url, "u", "p")
+        monitor = BlockProgressMonitor(rpc, stall_threshold_seconds=30)
+        assert monitor.wait_for_block_progress().current_height == 10
+
+        timer = threading.Timer(0.05, lambda: setattr(node, "height", 11))
+        timer.start()
+        t0 = time.monotonic()
+        status = monitor.wait_for_block_progress()
+        timer.join()
+
+        assert status.status == "ok"
+        assert status.previous_height == 10
+        assert status.current_height == 11
+        assert time.monotonic() - t0 < 5
+        assert monitor.long_poll_supported is True
+        # one getblockcount + one waitforblockheight, no polling in between
+        assert node.call_count == 2
+
+
+def test_long_poll_reports_stall_on_timeout():
+    with StubRpcNode(height=5) as node:
+        with PooledRpcClient(node.url, "u", "p") as rpc:
+            monitor = BlockProgressMonitor(rpc, stall_threshold_seconds=1)
+            monitor.wait_for_block_progress()
+            status = monitor.wait_for_block_progress()
+
+    assert status.status == "stalled"
+    assert status.stalled_for_seconds >= 1
+    assert node.call_count == 2
+
+
+def test_long_poll_respects_caller_timeout():
+    with StubRpcNode(height=5) as node:
+        monitor = BlockProgressMonitor(SimpleRpcClient(node.url, "u", "p"), stall_threshold_seconds=600)
+        monitor.wait_for_block_progress()
+        status = monitor.wait_for_block_progress(timeout_seconds=0.05)
+    assert status.status == "ok"
+    assert status.current_height == 5
+
+
+def test_falls_back_to_polling_when_node_lacks_long_poll():
+    with StubRpcNode(height=1) as node:
+        del node.handlers["waitforblockheight"]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            node.height += 1
+
+        monitor = BlockProgressMonitor(
+            SimpleRpcClient(node.url, "u", "p"),
+            stall_threshold_seconds=30,
+            fallback_poll_seconds=0.5,
+            sleep=fake_sleep,
+        )
+        monitor.wait_for_block_progress()
+        status = monitor.wait_for_block_progress()
+
+    assert monitor.long_poll_supported is False
+    assert status.current_height == 2
+    assert sleeps == [0.5]
+
+
+def test_fallback_for_clients_without_wait_method_times_out_as_stall():
+    class _Rpc:
+        def get_block_count(self):
+            return 7
+
+    monitor = BlockProgressMonitor(
+        _Rpc(), stall_threshold_seconds=1, fallback_poll_seconds=0.25
+    )
+    monitor.wait_for_block_progress()
+    status = monitor.wait_for_block_progress()
+    assert monitor.long_poll_supported is False
+    assert status.status == "stalled"
+
+
+def test_wait_past_threshold_keeps_long_polling_one_interval_at_a_time():
+    waits = []
+
+    class _Rpc:
+        def get_block_count(self):
+            return 3
+
+        def wait_for_block_height(self, height, timeout_seconds):
+            waits.append(timeout_seconds)
+            return 3
+
+    monitor = BlockProgressMonitor(_Rpc(), stall_threshold_seconds=0, fallback_poll_seconds=7.0)
+    monitor.wait_for_block_progress()
+    assert monitor.wait_for_block_progress().status == "stalled"
+    assert monitor.wait_for_block_progress(timeout_seconds=2.0).status == "stalled"
+    assert waits == [7.0, 2.0]
+
+
+@pytest.mark.parametrize("long_poll", [True, False])
+def test_repeated_waits_during_a_stall_are_rate_bounded(long_poll):
+    interval = 0.05
+    duration = 0.5
+    with StubRpcNode(height=9) as node:
+        if not long_poll:
+            del node.handlers["waitforblockheight"]
+        monitor = BlockProgressMonitor(
+            SimpleRpcClient(node.url, "u", "p"),
+            stall_threshold_seconds=0,
+            fallback_poll_seconds=interval,
+        )
+        monitor.wait_for_block_progress()
+
+        waits = 0
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < duration:
+            assert monitor.wait_for_block_progress().status == "stalled"
+            waits += 1
+
+    # One long-poll (or a poll before and after one sleep) per interval.
+    per_wait = 1 if long_poll else 2
+    intervals = int(duration / interval) + 1
+    assert waits <= intervals
+    assert node.call_count <= 2 + per_wait * intervals
+
+
+def test_stall_clock_measures_time_since_last_height_change():
+    class _Rpc:
+        def get_block_count(self):
+            return 3
+
+    monitor = BlockProgressMonitor(_Rpc(), stall_threshold_seconds=600)
+    monitor.check_block_progress()
+    first_seen = monitor._last_seen_at
+    monitor.check_block_progress()
+    assert monitor._last_seen_at == first_seen
+
+
+def test_stub_wait_for_new_block_handler():
+    with StubRpcNode(height=4) as node:
+        rpc = SimpleRpcClient(node.url, "u", "p")
+        threading.Timer(0.05, lambda: setattr(node, "height", 5)).start()
+        assert rpc._rpc("waitfornewblock", [2000])["height"] == 5
+        assert rpc._rpc("waitfornewblock", [10])["height"] == 5
+
+
+def test_pooled_client_falls_back_on_real_404_method_not_found():
+    with StubRpcNode(height=1) as node:
+        del node.handlers["waitforblockheight"]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            node.height += 1
+
+        with PooledRpcClient(node.url, "u", "p") as rpc:
+            monitor = BlockProgressMonitor(
+                rpc, stall_threshold_seconds=30, fallback_poll_seconds=0.5, sleep=fake_sleep
+            )
+            monitor.wait_for_block_progress()
+            status = monitor.wait_for_block_progress()
+            # Later waits go straight to polling
+            monitor.wait_for_block_progress()
+
+    assert monitor.long_poll_supported is False
+    assert status.current_height == 2
+    assert sleeps == [0.5, 0.5]
+
+
+def test_bare_http_404_also_falls_back_but_other_http_errors_raise():
+    def http_error(status):
+        resp = requests.Response()
+        resp.status_code = status
+        return requests.HTTPError(f"{status}", response=resp)
+
+    class _Rpc:
+        error = http_error(404)
+
+        def get_block_count(self):
+            return 7
+
+        def wait_for_block_height(self, height, timeout_seconds):
+            raise self.error
+
+    rpc = _Rpc()
+    monitor = BlockProgressMonitor(rpc, stall_threshold_seconds=30, sleep=lambda s: None)
+    monitor.wait_for_block_progress()
+    monitor.wait_for_block_progress(timeout_seconds=0.01)
+    assert monitor.long_poll_supported is False
+
+    rpc.error = http_error(503)
+    monitor = BlockProgressMonitor(rpc, stall_threshold_seconds=30)
+    monitor.wait_for_block_progress()
+    with pytest.raises(requests.HTTPError):
+        monitor.wait_for_block_progress(timeout_seconds=0.01)
+    assert monitor.long_poll_supported is None
@@ -0,0 +1,165 @@
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from sentinel_ai_v2.telemetry_monitor import (
+    BlockProgressReader,
+    BlockProgressStatus,
+    BlockProgressWriter,
+    convert_jsonl_to_store,
+)
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _status(i: int, stalled: bool = False) -> BlockProgressStatus:
+    return BlockProgressStatus(
+        timestamp=T0 + timedelta(seconds=60 * i),
+        current_height=1000 + i,
+        previous_height=None if i == 0 else 999 + i,
+        status="stalled" if stalled else "ok",
+        stalled_for_seconds=700 if stalled else 0,
+    )
+
+
+def test_store_roundtrip_and_range_search(tmp_path: Path):
+    path = str(tmp_path / "bp.sbps")
+    with BlockProgressWriter(path, buffer_records=8) as store:
+        for i in range(100):
+            store.append(_status(i, stalled=(i == 42)))
+
+    assert (tmp_path / "bp.sbps").stat().st_size == 16 + 100 * 32
+
+    with BlockProgressReader(path) as history:
+        assert len(history) == 100
+        assert history.statuses(end=T0 + timedelta(seconds=1)) == [_status(0)]
+        assert history.record(-1)[1] == 1099
+
+        window = list(history.range(T0 + timedelta(minutes=40), T0 + timedelta(minutes=45)))
+        assert [r[1] for r in window] == [1040, 1041, 1042, 1043, 1044]
+        assert [r[4] for r in window] == [0, 0, 1, 0, 0]
+        assert history.statuses(T0 + timedelta(minutes=42), T0 + timedelta(minutes=43)) == [
+            _status(42, stalled=True)
+        ]
+        assert list(history.range(T0 + timedelta(days=1))) == []
+        with pytest.raises(IndexError):
+            history.record(100)
+
+
+def test_writer_buffers_and_reopens_for_append(tmp_path: Path):
+    path = str(tmp_path / "bp.sbps")
+    store = BlockProgressWriter(path, buffer_records=10)
+    store.append(_status(0))
+    with BlockProgressReader(path) as history:
+        assert len(history) == 0  # still buffered
+        store.flush()
+        history.refresh()
+        assert len(history) == 1
+    store.close()
+    store.close()  # idempotent
+
+    with BlockProgressWriter(path, out_of_order="raise") as store:
+        with pytest.raises(ValueError):
+            store.append(replace(_status(0), timestamp=T0 - timedelta(days=1)))
+        store.append(_status(1))
+    with BlockProgressReader(path) as history:
+        assert [r[1] for r in history.range()] == [1000, 1001]
+
+
+def test_writer_truncates_torn_record_and_rejects_foreign_files(tmp_path: Path):
+    path = tmp_path / "bp.sbps"
+    with BlockProgressWriter(str(path)) as store:
+        store.append(_status(0))
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with BlockProgressWriter(str(path)) as store:
+        store.append(_status(1))
+    assert path.stat().st_size == 16 + 2 * 32
+
+    bad = tmp_path / "bad.sbps"
+    bad.write_bytes(b"x" * 16)
+    with pytest.raises(ValueError):
+        BlockProgressWriter(str(bad))
+    with pytest.raises(ValueError):
+        BlockProgressReader(str(bad))
+    short = tmp_path / "short.sbps"
+    short.write_bytes(b"SB")
+    with pytest.raises(ValueError):
+        BlockProgressReader(str(short))
+
+
+def test_convert_jsonl_to_store(tmp_path: Path):
+    src = tmp_path / "log.jsonl"
+    lines = [
+        json.dumps({
+            "timestamp": "2026-01-01T00:00:00",
+            "current_height": 5,
+            "previous_height": None,
+            "status": "ok",
+            "stalled_for_seconds": 0,
+        }),
+        "not json",
+        json.dumps({
+            "timestamp": "2026-01-01T00:10:00+00:00",
+            "current_height": 5,
+            "previous_height": 5,
+            "status": "stalled",
+            "stalled_for_seconds": 600,
+        }),
+    ]
+    src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    dst = str(tmp_path / "bp.sbps")
+    assert convert_jsonl_to_store(str(src), dst) == 2
+    with BlockProgressReader(dst) as history:
+        first, second = history.statuses()
+    assert first.timestamp == T0
+    assert first.previous_height is None
+    assert second.status == "stalled"
+    assert second.stalled_for_seconds == 600
+
+
+def test_writer_clamps_or_skips_out_of_order_records(tmp_path: Path):
+    path = str(tmp_path / "bp.sbps")
+    stepped_back = replace(_status(2), timestamp=T0 - timedelta(minutes=5))
+
+    with BlockProgressWriter(path) as store:  # default: clamp
+        store.append(_status(1))
+        assert store.append(stepped_back) is True
+        assert store.out_of_order_count == 1
+    with BlockProgressReader(path) as history:
+        clamped = history.record(-1)
+        assert clamped[1] == stepped_back.current_height
+        assert clamped[0] == history.record(0)[0]
+
+    with BlockProgressWriter(path, out_of_order="skip") as store:
+        assert store.append(stepped_back) is False
+        assert store.out_of_order_count == 1
+    with BlockProgressReader(path) as history:
+        assert len(history) == 2
+
+    with pytest.raises(ValueError):
+        BlockProgressWriter(path, out_of_order="sort")
+
+
+def test_convert_jsonl_skips_out_of_order_lines(tmp_path: Path):
+    src = tmp_path / "log.jsonl"
+    src.write_text(
+        "\n".join(
+            json.dumps({"timestamp": ts, "current_height": h})
+            for ts, h in [
+                ("2026-01-01T00:10:00+00:00", 6),
+                ("2026-01-01T00:00:00+00:00", 5),  # clock stepped back
+                ("2026-01-01T00:20:00+00:00", 7),
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    dst = str(tmp_path / "bp.sbps")
+    assert convert_jsonl_to_store(str(src), dst) == 2
+    with BlockProgressReader(dst) as history:
+        assert [r[1] for r in history.range()] == [6, 7]
@@ -1,8 +1,12 @@
+import hashlib
+from pathlib import Path
+
 import pytest
 
 from sentinel_ai_v2.v3 import SentinelV3
 from sentinel_ai_v2.config import CircuitBreakerThresholds
 from sentinel_ai_v2.contracts import ReasonCode, canonical_hash_v3
+from sentinel_ai_v2.model_loader import LoadedModel, ModelEnsemble
 from tests.fixtures_v3 import make_valid_v3_request
 
 
@@ -40,6 +44,69 @@ def test_context_hash_success_matches_contract_payload():
     assert out["context_hash"] == expected
 
 
+
+_GOLDEN_TELEMETRY = {"block_height": 10, "mempool_size": 1, "entropy": {"score": 0.1}}
+_GOLDEN_THRESHOLDS = {
+    "entropy_drop_threshold": 0.2,
+    "mempool_anomaly_threshold": 0.7,
+    "reorg_depth_threshold": 3,
+    "multi_signal_window_seconds": 60,
+}
+
+
+def _golden_request():
+    return make_valid_v3_request(request_id="r1", telemetry=_GOLDEN_TELEMETRY, max_latency_ms=2500)
+
+
+def test_context_hash_with_model_matches_golden_payload():
+    """
+    Golden lock (CONTRACT.md §5.2): with a model in use the payload gains model_hash,
+    the model's verified file hash.
+    """
+    model = LoadedModel(path=Path("m"), hash="a" * 64)
+    out = SentinelV3(thresholds=CircuitBreakerThresholds(), model=model).evaluate(_golden_request())
+
+    payload = {
+        "component": "sentinel",
+        "contract_version": 3,
+        "telemetry": _GOLDEN_TELEMETRY,
+        "thresholds": _GOLDEN_THRESHOLDS,
+        "model_used": True,
+        "model_hash": "a" * 64,
+    }
+    assert out["context_hash"] == canonical_hash_v3(payload)
+    assert out["context_hash"] == "d3539184dce9678f05591fc5d8ba743d1890a9f72235efc406c64b443e7c844e"
+
+
+def test_context_hash_with_ensemble_matches_golden_payload():
+    """
+    Golden lock (CONTRACT.md §5.2): for an ensemble model_hash is sha256 over the
+    ordered member hashes, each followed by "|".
+    """
+    members = (
+        LoadedModel(path=Path("x"), hash="a" * 64),
+        LoadedModel(path=Path("y"), hash="b" * 64),
+    )
+    ensemble = ModelEnsemble(models=members)
+
+    fingerprint = hashlib.sha256(("a" * 64 + "|" + "b" * 64 + "|").encode("ascii")).hexdigest()
+    assert ensemble.hash == fingerprint
+    assert fingerprint == "377ccbf16afd670512ffce6a23a0f58d9818fb83409a12c020bbb1821fcd56e6"
+    assert ModelEnsemble(models=members[::-1]).hash != fingerprint
+
+    out = SentinelV3(thresholds=CircuitBreakerThresholds(), model=ensemble).evaluate(_golden_request())
+    payload = {
+        "component": "sentinel",
+        "contract_version": 3,
+        "telemetry": _GOLDEN_TELEMETRY,
+        "thresholds": _GOLDEN_THRESHOLDS,
+        "model_used": True,
+        "model_hash": fingerprint,
+    }
+    assert out["context_hash"] == canonical_hash_v3(payload)
+    assert out["context_hash"] == "83c18becd20d8356d45e1615d37bb4543e72469ab3d4704eb22ff14afaf47cf9"
+
+
 def test_context_hash_error_non_dict_request_matches_contract_payload():
     """
     Regression lock: non-dict request must fail-closed with ERROR context_hash payload:
@@ -71,3 +71,89 @@ def test_bridge_available_paths(monkeypatch):
     hb = shield_heartbeat(min_severity=3, bridge=bridge)
     assert "REPORT:3" in hb
     assert "Global Threshold" in hb
+
+
+class _BatchInterface:
+    def __init__(self):
+        self.calls = []
+
+    def submit_threat_packets(self, packets):
+        self.calls.append(("threats", list(packets)))
+
+    def submit_threat_packet(self, packet):  # pragma: no cover - batch path preferred
+        raise AssertionError("per-packet path used")
+
+    def submit_feedback_events(self, events):
+        self.calls.append(("feedback", [(e.event_id, e.feedback) for e in events]))
+
+
+class _Packet:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+def test_batch_submission_hands_whole_iterables_to_interface(monkeypatch):
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", _BatchInterface)
+    monkeypatch.setattr(acb, "ThreatPacket", _Packet)
+    iface = _BatchInterface()
+    bridge = acb.SentinelAdaptiveCoreBridge(interface=iface)
+
+    bridge.submit_threats(
+        {"source_layer": "sentinel", "threat_type": "reorg", "severity": i, "description": "d"}
+        for i in range(3)
+    )
+    bridge.submit_feedback_labels(
+        [
+            {"layer": "sentinel", "feedback": "true_positive", "event_id": "a"},
+            {"layer": "sentinel", "feedback": "false_positive", "event_id": "b"},
+        ]
+    )
+    bridge.submit_threats([])  # nothing to send, no call
+
+    kind, packets = iface.calls[0]
+    assert kind == "threats" and [p.kwargs["severity"] for p in packets] == [0, 1, 2]
+    assert packets[0].kwargs["block_height"] is None
+    assert iface.calls[1] == ("feedback", [("a", "TRUE_POSITIVE"), ("b", "FALSE_POSITIVE")])
+    assert len(iface.calls) == 2
+
+
+def test_batch_submission_is_noop_when_unavailable():
+    bridge = acb.SentinelAdaptiveCoreBridge()
+    bridge.submit_threats([{"source_layer": "s", "threat_type": "t", "severity": 1, "description": "d"}])
+    bridge.submit_feedback_labels([{"layer": "s", "feedback": "x", "event_id": "e"}])
+
+
+def test_default_bridge_is_shared_and_resettable(monkeypatch):
+    built = []
+
+    class CountingInterface(_BatchInterface):
+        def __init__(self):
+            super().__init__()
+            built.append(self)
+
+        def get_immune_report_text(self, min_severity=0):
+            return "R"
+
+        def get_adaptive_state(self):
+            return SimpleNamespace(global_threshold=0.5, layer_weights={})
+
+        def get_last_update_metadata(self):
+            return {}
+
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", CountingInterface)
+    monkeypatch.setattr(acb, "ThreatPacket", _Packet)
+    acb.reset_default_bridge()
+    try:
+        report_reorg_anomaly_to_adaptive(1, 0.5)
+        send_feedback_to_adaptive(layer="sentinel", event_id="e", feedback="true_positive")
+        assert "R" in shield_heartbeat()
+        assert len(built) == 1
+        assert [kind for kind, _ in built[0].calls] == ["threats", "feedback"]
+        assert acb.get_default_bridge() is acb.get_default_bridge()
+
+        replacement = acb.SentinelAdaptiveCoreBridge(interface=CountingInterface())
+        previous = acb.reset_default_bridge(replacement)
+        assert previous is not None and previous is not replacement
+        assert acb.get_default_bridge() is replacement
+    finally:
+        acb.reset_default_bridge()
@@ -1,3 +1,10 @@
+import enum
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
 from sentinel_ai_v2.adaptive_event import AdaptiveEvent
 import sentinel_ai_v2.adaptive_bridge as b
 
@@ -51,3 +58,97 @@ def test_emit_adaptive_event_from_signal_calls_export(monkeypatch):
     assert evt.txid == "tx1"
     assert evt.qri_after <= evt.qri_before
     assert evt.details is not None
+
+
+def test_emit_skips_serialization_when_debug_disabled(monkeypatch, caplog):
+    calls = []
+    monkeypatch.setattr(b, "serialize_adaptive_event", lambda evt: calls.append(evt) or "{}")
+
+    caplog.set_level(logging.INFO, logger=b.logger.name)
+    b.emit_adaptive_event(AdaptiveEvent())
+    b.LoggingEventSink().emit(AdaptiveEvent())
+    assert calls == []
+
+    caplog.set_level(logging.DEBUG, logger=b.logger.name)
+    b.emit_adaptive_event(AdaptiveEvent())
+    assert len(calls) == 1
+
+
+def test_logging_sink_and_set_event_sink(caplog):
+    log = logging.getLogger("tests.adaptive_sink")
+    sink = b.LoggingEventSink(log, level=logging.WARNING)
+    caplog.set_level(logging.WARNING, logger=log.name)
+
+    previous = b.set_event_sink(sink)
+    try:
+        b.emit_adaptive_event_from_signal(signal_name="entropy_drop", severity=0.5)
+    finally:
+        assert b.set_event_sink(previous) is sink
+
+    [record] = [r for r in caplog.records if r.name == log.name]
+    payload = json.loads(record.getMessage().split(" ", 1)[1])
+    assert payload["anomaly_type"] == "entropy_drop"
+
+
+def test_adaptive_event_is_slotted_and_interns_names():
+    kind = "".join(["mempool_", "flood"])
+    evt = AdaptiveEvent(anomaly_type=kind)
+    assert not hasattr(evt, "__dict__")
+    assert evt.anomaly_type is AdaptiveEvent(anomaly_type="mempool_flood").anomaly_type
+    assert isinstance(evt.created_at_ns, int)
+
+
+
+def test_adaptive_event_keeps_non_plain_str_names_unchanged():
+    class Kind(str, enum.Enum):
+        FLOOD = "mempool_flood"
+
+    evt = AdaptiveEvent(anomaly_type=Kind.FLOOD)
+    assert evt.anomaly_type is Kind.FLOOD
+    assert json.loads(evt.to_json())["anomaly_type"] == "mempool_flood"
+
+    evt = AdaptiveEvent(layer=None, anomaly_type=None)  # type: ignore[arg-type]
+    assert evt.layer is None and evt.anomaly_type is None
+    assert evt.to_dict()["layer"] is None
+
+
+def test_adaptive_event_created_at_compat():
+    ts = datetime(2026, 1, 2, 3, 4, 5, 678901)
+    evt = AdaptiveEvent(created_at=ts)
+    assert evt.created_at == ts
+    assert evt.created_at_ns == int(ts.replace(tzinfo=timezone.utc).timestamp()) * 10**9 + 678901000
+
+    evt.created_at = datetime(2026, 1, 2, 4, 4, 5, tzinfo=timezone(timedelta(hours=1)))
+    assert evt.created_at == datetime(2026, 1, 2, 3, 4, 5)
+    assert "created_at=datetime.datetime(2026, 1, 2, 3, 4, 5)" in repr(evt)
+
+
+def test_adaptive_event_json_matches_previous_format():
+    evt = AdaptiveEvent(anomaly_type="x", severity=0.5, block_height=7, created_at=datetime(2026, 1, 1))
+    expected = json.dumps(
+        {
+            "layer": "sentinel", "anomaly_type": "x", "severity": 0.5, "qri_before": 0.0,
+            "qri_after": 0.0, "block_height": 7, "txid": None, "was_mitigated": False,
+            "details": None, "created_at": datetime(2026, 1, 1),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    assert evt.to_json() == expected
+    assert b.serialize_adaptive_event(evt) == expected
+
+
+def test_adaptive_event_binary_roundtrip():
+    full = AdaptiveEvent(
+        layer="sentinel", anomaly_type="reorg_pattern", severity=0.75, qri_before=0.5,
+        qri_after=0.25, block_height=0, txid="ab" * 32, was_mitigated=True, details="ü",
+    )
+    empty = AdaptiveEvent()
+    for evt in (full, empty):
+        data = evt.to_bytes()
+        assert AdaptiveEvent.from_bytes(data) == evt
+    assert AdaptiveEvent.from_bytes(empty.to_bytes()).block_height is None
+    assert full != empty and (full == object()) is False
+
+    with pytest.raises(ValueError):
+        AdaptiveEvent.from_bytes(full.to_bytes()[:-1])
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+
+from sentinel_ai_v2.async_rpc_client import AsyncRpcClient, poll_block_counts
+from sentinel_ai_v2.testing.rpc_stub import AsyncStubRpcNode, RpcError
+
+
+def _run(coro):
+    # Private loop: asyncio.run() would reset the main-thread loop that
+    # other tests fetch via get_event_loop().
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_async_client_reuses_connection_and_reads_height():
+    async def main():
+        async with AsyncStubRpcNode(height=10) as node:
+            async with AsyncRpcClient(node.url, "u", "p") as c:
+                for i in range(4):
+                    node.height = 10 + i
+                    assert await c.get_block_count() == 10 + i
+                assert c.connections_opened == 1
+            assert node.connection_count == 1
+            assert node.request_count == 4
+
+    _run(main())
+
+
+def test_async_client_surfaces_rpc_errors_and_params():
+    def boom(params):
+        raise RpcError(-1, "boom")
+
+    async def main():
+        async with AsyncStubRpcNode(handlers={"echo": lambda p: p, "boom": boom}) as node:
+            async with AsyncRpcClient(node.url, "u", "p") as c:
+                assert await c.call("echo", [1, 2]) == [1, 2]
+                with pytest.raises(RuntimeError):
+                    await c.call("boom")
+                with pytest.raises(RuntimeError):
+                    await c.call("nope")
+
+    _run(main())
+
+
+def test_async_client_timeout_closes_connection():
+    async def main():
+        async with AsyncStubRpcNode(height=1, latency_seconds=0.5) as node:
+            c = AsyncRpcClient(node.url, "u", "p", timeout=0.05)
+            with pytest.raises(asyncio.TimeoutError):
+                await c.get_block_count()
+            assert c._idle == []
+            await c.close()
+
+    _run(main())
+
+
+def test_poll_fleet_concurrently_within_interval():
+    async def main():
+        nodes = [AsyncStubRpcNode(height=100 + i, latency_seconds=0.05) for i in range(40)]
+        for n in nodes:
+            await n.start()
+        clients = {f"n{i}": AsyncRpcClient(n.url, "u", "p") for i, n in enumerate(nodes)}
+        try:
+            t0 = time.perf_counter()
+            res = await poll_block_counts(clients, concurrency=40)
+            elapsed = time.perf_counter() - t0
+        finally:
+            for c in clients.values():
+                await c.close()
+            for n in nodes:
+                await n.stop()
+
+        assert all(r.ok for r in res.values())
+        assert res["n7"].height == 107
+        # 40 x 50ms sequentially would be ~2s
+        assert elapsed < 1.0
+
+    _run(main())
+
+
+def test_poll_fleet_reports_timeouts_errors_and_deadline():
+    async def main():
+        async with AsyncStubRpcNode(height=1) as fast, AsyncStubRpcNode(
+            height=2, latency_seconds=1.0
+        ) as slow:
+            clients = {
+                "fast": AsyncRpcClient(fast.url, "u", "p"),
+                "slow": AsyncRpcClient(slow.url, "u", "p", timeout=0.05),
+                "down": AsyncRpcClient("http://127.0.0.1:1", "u", "p"),
+            }
+            res = await poll_block_counts(clients)
+            assert res["fast"].height == 1
+            assert res["slow"].error == "timeout"
+            assert res["down"].ok is False
+
+            clients["slow"].timeout = 5.0
+            res = await poll_block_counts(clients, deadline_seconds=0.1)
+            assert res["slow"].error == "deadline"
+            assert res["fast"].ok
+
+            assert await poll_block_counts({}) == {}
+            for c in clients.values():
+                await c.close()
+
+    _run(main())
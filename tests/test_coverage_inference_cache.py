@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+import sentinel_ai_v2.v3 as v3mod
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.inference_cache import InferenceCache
+from sentinel_ai_v2.model_loader import LoadedModel
+from sentinel_ai_v2.v3 import SentinelV3
+from tests.fixtures_v3 import make_valid_v3_request
+
+
+def _model(h: str) -> LoadedModel:
+    return LoadedModel(path=Path(h), hash=h)
+
+
+def test_cache_hits_on_identical_features_and_tracks_hit_rate():
+    cache = InferenceCache(max_entries=8)
+    calls = {"n": 0}
+
+    def compute(features):
+        calls["n"] += 1
+        return 0.3
+
+    m = _model("a")
+    assert cache.get_or_compute(m, {"entropy_score": 0.1}, compute) == 0.3
+    assert cache.get_or_compute(m, {"entropy_score": 0.1}, compute) == 0.3
+    assert calls["n"] == 1
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.hit_rate == 0.5
+    assert cache.stats()["size"] == 1
+
+    # Different model hash -> separate entry
+    cache.get_or_compute(_model("b"), {"entropy_score": 0.1}, compute)
+    assert calls["n"] == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_quantization_merges_nearby_vectors():
+    exact = InferenceCache()
+    quant = InferenceCache(quantum=0.05)
+    m = _model("a")
+    a = {"mempool_score": 0.301}
+    b = {"mempool_score": 0.299}
+    assert exact.make_key(m, a) != exact.make_key(m, b)
+    assert quant.make_key(m, a) == quant.make_key(m, b)
+
+
+def test_quantized_cache_scores_bucket_independently_of_history():
+    def score(features):
+        return features["mempool_score"]
+
+    m = _model("a")
+    a = {"mempool_score": 0.301}
+    b = {"mempool_score": 0.299}
+
+    first = InferenceCache(quantum=0.05)
+    second = InferenceCache(quantum=0.05)
+    assert first.get_or_compute(m, a, score) == first.get_or_compute(m, b, score)
+    assert second.get_or_compute(m, b, score) == first.get_or_compute(m, a, score)
+    assert first.get_or_compute(m, a, score) == pytest.approx(0.3)
+
+    # The caller's features are not modified.
+    assert a == {"mempool_score": 0.301}
+    assert InferenceCache().model_input(a) is a
+
+
+def test_cache_lru_eviction():
+    cache = InferenceCache(max_entries=2)
+    m = _model("a")
+    for i in range(3):
+        cache.get_or_compute(m, {"reorg_depth": i}, lambda features: 0.1)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    # oldest (reorg_depth=0) was evicted
+    cache.get_or_compute(m, {"reorg_depth": 0}, lambda features: 0.1)
+    assert cache.misses == 4
+
+
+def test_cache_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        InferenceCache(max_entries=0)
+    with pytest.raises(ValueError):
+        InferenceCache(quantum=0.0)
+
+
+def test_v3_skips_inference_on_cache_hit(monkeypatch):
+    calls = {"n": 0}
+
+    def fake_infer(model, features):
+        calls["n"] += 1
+        return 0.42
+
+    monkeypatch.setattr(v3mod, "run_model_inference", fake_infer)
+    cache = InferenceCache()
+    s = SentinelV3(thresholds=CircuitBreakerThresholds(), model=_model("a"), inference_cache=cache)
+
+    first = s.evaluate(make_valid_v3_request())
+    second = s.evaluate(make_valid_v3_request())
+    assert calls["n"] == 1
+    assert first["context_hash"] == second["context_hash"]
+    assert cache.hits == 1
+
+
+def test_client_builds_shared_cache_from_config():
+    assert SentinelClient(SentinelConfig(model_path=None)).inference_cache is None
+    client = SentinelClient(
+        SentinelConfig(model_path=None, inference_cache_size=16, inference_cache_quantum=0.1)
+    )
+    assert client.inference_cache is not None
+    assert client.inference_cache.quantum == 0.1
+    assert client._evaluator().inference_cache is client.inference_cache
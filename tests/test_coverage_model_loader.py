@@ -1,12 +1,22 @@
+import threading
+
 import pytest
 from pathlib import Path
 
+import sentinel_ai_v2.model_loader as ml
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import SentinelConfig
 from sentinel_ai_v2.model_loader import (
+    FEATURE_ORDER,
+    ModelEnsemble,
+    build_feature_array,
     compute_file_hash,
     load_and_verify_model,
+    load_model_ensemble,
     run_model_inference,
     ModelVerificationError,
 )
+from tests.fixtures_v3 import make_valid_v3_request
 
 
 def test_compute_file_hash_and_load(tmp_path: Path):
@@ -32,3 +42,103 @@ def test_load_model_hash_mismatch(tmp_path: Path):
     p.write_bytes(b"hello")
     with pytest.raises(ModelVerificationError):
         load_and_verify_model(str(p), expected_hash="deadbeef")
+
+
+def _write_models(tmp_path: Path, n: int):
+    specs = []
+    for i in range(n):
+        p = tmp_path / f"m{i}.bin"
+        p.write_bytes(f"model-{i}".encode())
+        specs.append((str(p), compute_file_hash(p)))
+    return specs
+
+
+def test_build_feature_array_uses_fixed_order():
+    arr = build_feature_array({"reorg_depth": 3, "entropy_score": 0.5, "ignored": 9})
+    assert len(arr) == len(FEATURE_ORDER)
+    assert arr[FEATURE_ORDER.index("entropy_score")] == 0.5
+    assert arr[FEATURE_ORDER.index("reorg_depth")] == 3.0
+    assert arr[FEATURE_ORDER.index("mempool_score")] == 0.0
+
+
+def test_ensemble_shares_one_feature_array_and_records_timings(tmp_path: Path, monkeypatch):
+    seen = []
+
+    def fake_infer(model, features):
+        seen.append(features)
+        return {"model-0": 0.2, "model-1": 0.7, "model-2": 0.4}[model.path.read_text()]
+
+    monkeypatch.setattr(ml, "run_model_inference", fake_infer)
+
+    ens = load_model_ensemble(_write_models(tmp_path, 3))
+    res = ens.evaluate({"entropy_score": 0.1})
+
+    assert res.score == 0.7
+    assert res.evaluated == 3
+    assert res.early_exit is False
+    assert len(res.timings_ms) == 3
+    assert all(f is seen[0] for f in seen)  # one shared array
+    assert ens.calls == [1, 1, 1]
+
+
+def test_ensemble_early_exit_once_max_reaches_exit_score(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(ml, "run_model_inference", lambda model, features: 1.0)
+    ens = load_model_ensemble(_write_models(tmp_path, 3))
+    res = ens.evaluate({})
+    assert res.score == 1.0
+    assert res.evaluated == 1
+    assert res.early_exit is True
+    assert ens.calls == [1, 0, 0]
+
+
+
+def test_ensemble_counters_are_not_constructor_fields_and_survive_threads(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(ml, "run_model_inference", lambda model, features: 0.1)
+    ens = load_model_ensemble(_write_models(tmp_path, 2))
+
+    with pytest.raises(TypeError):
+        ModelEnsemble(models=ens.models, calls=[5, 5])  # type: ignore[call-arg]
+    assert "calls" not in repr(ens)
+
+    def worker():
+        for _ in range(500):
+            ens.evaluate({})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert ens.calls == [4000, 4000]
+
+
+def test_ensemble_fingerprint_depends_on_member_order(tmp_path: Path):
+    specs = _write_models(tmp_path, 2)
+    a = load_model_ensemble(specs)
+    b = load_model_ensemble(list(reversed(specs)))
+    assert a.hash != b.hash
+    assert len(a.hash) == 64
+
+
+def test_ensemble_rejects_empty_and_unverified(tmp_path: Path):
+    with pytest.raises(ModelVerificationError):
+        ModelEnsemble(models=())
+    specs = _write_models(tmp_path, 2)
+    specs[1] = (specs[1][0], "deadbeef")
+    with pytest.raises(ModelVerificationError):
+        load_model_ensemble(specs)
+
+
+def test_client_uses_ensemble_and_folds_fingerprint_into_context(tmp_path: Path):
+    specs = _write_models(tmp_path, 2)
+    client = SentinelClient(SentinelConfig(model_path=None, model_ensemble=specs))
+    assert client.evaluate_snapshot({}).status != "ERROR"
+    v3 = client._evaluator()
+    assert isinstance(v3.model, ModelEnsemble)
+
+    out = v3.evaluate(make_valid_v3_request())
+    assert out["meta"]["model_used"] is True
+
+    bad = SentinelClient(SentinelConfig(model_path=None, model_ensemble=[(specs[0][0], "x")]))
+    assert bad._evaluator().model is None
@@ -0,0 +1,185 @@
+import os
+from pathlib import Path
+
+from sentinel_ai_v2.api import SentinelClient
+from sentinel_ai_v2.config import CircuitBreakerThresholds, SentinelConfig
+from sentinel_ai_v2.model_loader import LoadedModel, compute_file_hash
+from sentinel_ai_v2.model_manager import ModelManager
+from sentinel_ai_v2.v3 import SentinelV3
+from tests.fixtures_v3 import make_valid_v3_request
+
+
+def _bump_mtime(p: Path) -> None:
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_manager_loads_initial_model_and_ignores_unchanged_file(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+
+    mgr = ModelManager(str(p), expected_hash=compute_file_hash(p))
+    first = mgr.current()
+    assert first is not None
+    assert first.hash == compute_file_hash(p)
+    assert mgr.reload_count == 1
+
+    # Same mtime/size -> no re-hash, no swap
+    assert mgr.poll() is False
+    assert mgr.current() is first
+
+
+def test_manager_missing_file_has_no_model(tmp_path: Path):
+    mgr = ModelManager(str(tmp_path / "missing.bin"))
+    assert mgr.current() is None
+    assert mgr.poll() is False
+
+
+def test_manager_rejects_mismatch_and_keeps_previous_model(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    mgr = ModelManager(str(p), expected_hash=compute_file_hash(p))
+    old = mgr.current()
+
+    p.write_bytes(b"v2-tampered")
+    _bump_mtime(p)
+    assert mgr.poll() is False
+    assert mgr.current() is old
+    assert "mismatch" in (mgr.last_error or "")
+
+    # Operator publishes the new hash -> next poll accepts the file on disk
+    mgr.set_expected_hash(compute_file_hash(p))
+    assert mgr.poll() is True
+    assert mgr.current() is not old
+    assert mgr.last_error is None
+
+
+def test_manager_background_poller_start_stop(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    mgr = ModelManager(str(p))
+    mgr.start(poll_interval_seconds=0.01)
+    mgr.start(poll_interval_seconds=0.01)  # idempotent
+    mgr.stop(timeout=1.0)
+    assert mgr._thread is None
+
+
+def test_client_swaps_evaluator_after_reload_and_context_hash_changes(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    client = SentinelClient(SentinelConfig(model_path=str(p), model_hash=None))
+    assert client.model_manager is not None
+
+    v3_before = client._evaluator()
+    assert v3_before.model is not None
+
+    p.write_bytes(b"v2-new-model")
+    _bump_mtime(p)
+    assert client.model_manager.poll() is True
+
+    v3_after = client._evaluator()
+    assert v3_after is not v3_before
+    assert v3_after.model.hash == compute_file_hash(p)
+
+    req = make_valid_v3_request()
+    assert v3_before.evaluate(req)["context_hash"] != v3_after.evaluate(req)["context_hash"]
+    assert client.evaluate_snapshot({}).status != "ERROR"
+
+
+def test_v3_context_hash_includes_model_hash():
+    thresholds = CircuitBreakerThresholds()
+    a = SentinelV3(thresholds=thresholds, model=LoadedModel(path=Path("a"), hash="aa"))
+    b = SentinelV3(thresholds=thresholds, model=LoadedModel(path=Path("b"), hash="bb"))
+    req = make_valid_v3_request()
+    assert a.evaluate(req)["context_hash"] != b.evaluate(req)["context_hash"]
+
+
+def test_client_defers_model_load_until_first_evaluation(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    client = SentinelClient(SentinelConfig(model_path=str(p)))
+    assert client.model_manager.current() is None
+    assert client._v3.model is None
+
+    client.evaluate_snapshot({})
+    assert client.model_manager.current() is not None
+    assert client._v3.model is client.model_manager.current()
+
+
+def test_client_warmup_loads_model_and_starts_poller(tmp_path: Path):
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    client = SentinelClient(
+        SentinelConfig(model_path=str(p), model_reload_interval_seconds=60.0)
+    )
+    client.warmup()
+    client.warmup()  # idempotent
+    try:
+        assert client.model_manager.current() is not None
+        assert client.model_manager._thread is not None
+    finally:
+        client.model_manager.stop(timeout=1.0)
+
+
+def test_manager_rejection_does_not_pin_stamp_if_hash_changed_meanwhile(tmp_path: Path, monkeypatch):
+    import sentinel_ai_v2.model_manager as mm
+
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    mgr = ModelManager(str(p), expected_hash="wrong", load_initial=False)
+    real_load = mm.load_and_verify_model
+
+    def load_while_operator_publishes(path, expected_hash=None):
+        # The operator publishes the correct hash while the old one is being checked.
+        mgr.set_expected_hash(compute_file_hash(p))
+        return real_load(path, expected_hash=expected_hash)
+
+    monkeypatch.setattr(mm, "load_and_verify_model", load_while_operator_publishes)
+    assert mgr.poll() is False
+    assert "mismatch" in (mgr.last_error or "")
+
+    # Same file on disk, no mtime change: the new hash must still be checked.
+    monkeypatch.setattr(mm, "load_and_verify_model", real_load)
+    assert mgr.poll() is True
+    assert mgr.current() is not None
+    assert mgr.last_error is None
+
+
+def test_concurrent_first_evaluations_all_use_the_model(tmp_path: Path, monkeypatch):
+    import threading
+    import time
+
+    import sentinel_ai_v2.model_manager as mm
+
+    p = tmp_path / "m.bin"
+    p.write_bytes(b"v1")
+    real_load = mm.load_and_verify_model
+
+    def slow_load(path, expected_hash=None):
+        time.sleep(0.05)  # widen the window between "warming" and "loaded"
+        return real_load(path, expected_hash=expected_hash)
+
+    monkeypatch.setattr(mm, "load_and_verify_model", slow_load)
+    client = SentinelClient(SentinelConfig(model_path=str(p)))
+    req = make_valid_v3_request()
+    barrier = threading.Barrier(4)
+    responses = []
+    lock = threading.Lock()
+
+    def first_call():
+        barrier.wait()
+        v3 = client._evaluator()
+        response = v3.evaluate(req)
+        with lock:
+            responses.append((v3.model, response["context_hash"]))
+
+    threads = [threading.Thread(target=first_call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(responses) == 4
+    assert all(model is not None for model, _ in responses)
+    assert len({h for _, h in responses}) == 1
+    assert client.model_manager.reload_count == 1
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from sentinel_ai_v2.rpc_client import SimpleRpcClient
@@ -7,6 +9,7 @@ class _Resp:
     def __init__(self, payload, status_ok=True):
         self._payload = payload
         self._status_ok = status_ok
+        self.status_code = 200 if status_ok else 500
 
     def raise_for_status(self):
         if not self._status_ok:
@@ -60,3 +63,263 @@ def test_rpc_client_raises_on_http_error(monkeypatch):
     c = SimpleRpcClient("http://node", "u", "p")
     with pytest.raises(RuntimeError):
         c.get_block_count()
+
+
+# -----------------------------
+# PooledRpcClient (against the local stub node)
+# -----------------------------
+
+from sentinel_ai_v2.rpc_client import PooledRpcClient  # noqa: E402
+from sentinel_ai_v2.testing.rpc_stub import RpcError, StubRpcNode  # noqa: E402
+
+
+def test_pooled_client_reuses_one_connection():
+    with StubRpcNode(height=42) as node:
+        with PooledRpcClient(node.url, "u", "p") as c:
+            for i in range(5):
+                node.height = 42 + i
+                assert c.get_block_count() == 42 + i
+
+        assert node.request_count == 5
+        assert node.connection_count == 1
+
+
+def test_pooled_client_template_and_params_encoding():
+    seen = {}
+
+    def echo(params):
+        seen["params"] = params
+        return params
+
+    with StubRpcNode(handlers={"echo": echo}) as node:
+        with PooledRpcClient(node.url, "u", "p", connect_timeout=1.0, read_timeout=2.0) as c:
+            assert c.timeout == (1.0, 2.0)
+            assert c._rpc("echo", [1, "a"]) == [1, "a"]
+            assert c._rpc("echo") == []
+            assert c._template("echo") is c._template("echo")
+            assert c._encode("echo", [1]) == (
+                b'{"jsonrpc":"1.0","method":"echo","params":[1],"id":"sentinel"}'
+            )
+
+
+
+def test_pooled_post_json_honours_timeout_argument(monkeypatch):
+    with StubRpcNode() as node:
+        with PooledRpcClient(node.url, "u", "p", connect_timeout=1.0, read_timeout=2.0) as c:
+            seen = []
+            post = c._session.post
+
+            def spy(url, data, timeout):
+                seen.append(timeout)
+                return post(url, data=data, timeout=timeout)
+
+            monkeypatch.setattr(c._session, "post", spy)
+            payload = {"jsonrpc": "1.0", "method": "getblockcount", "params": [], "id": 1}
+            c._post_json(payload)
+            c._post_json(payload, timeout=7.5)
+
+    assert seen == [(1.0, 2.0), (1.0, 7.5)]
+
+
+def test_pooled_client_surfaces_rpc_errors():
+    def boom(params):
+        raise RpcError(-5, "nope")
+
+    with StubRpcNode(handlers={"boom": boom}) as node:
+        with PooledRpcClient(node.url, "u", "p") as c:
+            with pytest.raises(RuntimeError):
+                c._rpc("boom")
+            with pytest.raises(RuntimeError):
+                c._rpc("missing")
+
+
+# -----------------------------
+# Batch calls
+# -----------------------------
+
+def _batch_node(**kw):
+    def boom(params):
+        raise RpcError(-8, "bad param")
+
+    return StubRpcNode(
+        height=7,
+        handlers={"getmempoolinfo": lambda p: {"size": 3}, "boom": boom},
+        **kw,
+    )
+
+
+def test_batch_single_round_trip_with_per_call_errors():
+    with _batch_node() as node:
+        c = SimpleRpcClient(node.url, "u", "p")
+        res = c.batch([("getblockcount", None), ("boom", [1]), ("getmempoolinfo", None)])
+
+        assert node.request_count == 1
+        assert node.call_count == 3
+        assert c.batch_supported is True
+        assert [r.method for r in res] == ["getblockcount", "boom", "getmempoolinfo"]
+        assert res[0].unwrap() == 7
+        assert res[1].ok is False
+        with pytest.raises(RuntimeError):
+            res[1].unwrap()
+        assert res[2].result == {"size": 3}
+        assert c.batch([]) == []
+
+
+def test_batch_falls_back_to_sequential_when_node_rejects_batches():
+    with _batch_node(support_batch=False) as node:
+        with PooledRpcClient(node.url, "u", "p") as c:
+            res = c.batch([("getblockcount", None), ("boom", None)])
+            assert c.batch_supported is False
+            assert res[0].result == 7
+            assert res[1].error == {"code": -8, "message": "bad param"}
+
+            # Later batches skip the probe entirely
+            before = node.request_count
+            c.batch([("getblockcount", None)])
+            assert node.request_count == before + 1
+
+
+def test_pooled_batch_and_node_info():
+    with _batch_node() as node:
+        with PooledRpcClient(node.url, "u", "p") as c:
+            info = c.get_node_info()
+            assert node.request_count == 1
+            assert info["getblockcount"].result == 7
+            assert info["getmempoolinfo"].result == {"size": 3}
+            assert info["getpeerinfo"].ok is False  # not implemented by the stub
+
+
+def test_batch_demux_reports_missing_reply(monkeypatch):
+    c = SimpleRpcClient("http://node", "u", "p")
+    monkeypatch.setattr(c, "_post_batch", lambda calls: [{"id": 1, "result": 5, "error": None}])
+    res = c.batch([("a", None), ("b", None)])
+    assert res[0].ok is False
+    assert res[1].result == 5
+
+
+def _http(status, body):
+    import requests
+
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    resp.url = "http://node"
+    return resp
+
+
+def test_single_call_rpc_error_bodies_on_http_4xx_5xx_become_rpc_errors(monkeypatch):
+    import sentinel_ai_v2.rpc_client as m
+
+    replies = {
+        "getblockcount": _http(200, {"result": 9, "error": None, "id": "sentinel"}),
+        "boom": _http(500, {"result": None, "error": {"code": -8, "message": "bad"}, "id": "sentinel"}),
+        "nope": _http(404, {"result": None, "error": {"code": -32601, "message": "Method not found"}, "id": "sentinel"}),
+    }
+
+    def fake_post(url, json, auth, timeout):
+        if isinstance(json, list):
+            return _http(200, b"<html>proxy says no</html>")  # non-JSON batch reply
+        return replies[json["method"]]
+
+    monkeypatch.setattr(m.requests, "post", fake_post)
+    c = SimpleRpcClient("http://node", "u", "p")
+
+    with pytest.raises(RuntimeError) as info:
+        c._rpc("nope")
+    assert info.value.args[0]["code"] == -32601
+
+    res = c.batch([("getblockcount", None), ("boom", None), ("nope", None)])
+    assert c.batch_supported is False
+    assert res[0].result == 9
+    assert res[1].error == {"code": -8, "message": "bad"}
+    assert res[2].error["code"] == -32601
+
+
+def test_transient_http_errors_do_not_disable_batching(monkeypatch):
+    import requests
+
+    import sentinel_ai_v2.rpc_client as m
+
+    statuses = [503, 401, 200]
+
+    def fake_post(url, json, auth, timeout):
+        status = statuses.pop(0)
+        if status != 200:
+            return _http(status, b"")
+        return _http(200, [{"id": 0, "result": 1, "error": None}])
+
+    monkeypatch.setattr(m.requests, "post", fake_post)
+    c = SimpleRpcClient("http://node", "u", "p")
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            c.batch([("getblockcount", None)])
+        assert c.batch_supported is None
+
+    assert c.batch([("getblockcount", None)])[0].result == 1
+    assert c.batch_supported is True
+
+
+
+def test_transient_http_error_with_json_body_does_not_disable_batching(monkeypatch):
+    import requests
+
+    import sentinel_ai_v2.rpc_client as m
+
+    error_body = {"result": None, "error": {"code": -28, "message": "Loading block index"}, "id": None}
+    replies = [
+        _http(503, error_body),
+        _http(429, [{"id": 0, "result": None, "error": {"code": -1, "message": "slow down"}}]),
+        _http(200, [{"id": 0, "result": 1, "error": None}]),
+    ]
+    monkeypatch.setattr(m.requests, "post", lambda url, json, auth, timeout: replies.pop(0))
+
+    c = SimpleRpcClient("http://node", "u", "p")
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            c.batch([("getblockcount", None)])
+        assert c.batch_supported is None
+
+    assert c.batch([("getblockcount", None)])[0].result == 1
+    assert c.batch_supported is True
+
+
+def test_http_error_without_rpc_error_body_still_raises(monkeypatch):
+    import requests
+
+    import sentinel_ai_v2.rpc_client as m
+
+    monkeypatch.setattr(m.requests, "post", lambda url, json, auth, timeout: _http(502, {"detail": "upstream"}))
+    with pytest.raises(requests.HTTPError):
+        SimpleRpcClient("http://node", "u", "p").get_block_count()
+
+
+def test_stub_node_uses_bitcoind_status_codes_for_single_call_errors():
+    import requests
+
+    def boom(params):
+        raise RpcError(-8, "bad param")
+
+    with StubRpcNode(height=3, handlers={"boom": boom}) as node:
+        def post(payload):
+            return requests.post(node.url, json=payload, auth=("u", "p"), timeout=5)
+
+        ok = post({"id": 1, "method": "getblockcount"})
+        failed = post({"id": 2, "method": "boom"})
+        missing = post({"id": 3, "method": "nope"})
+        batch = post([{"id": 0, "method": "boom"}, {"id": 1, "method": "nope"}])
+
+    assert (ok.status_code, ok.json()["result"]) == (200, 3)
+    assert (failed.status_code, failed.json()["error"]["code"]) == (500, -8)
+    assert (missing.status_code, missing.json()["error"]["code"]) == (404, -32601)
+    assert batch.status_code == 200
+    assert [r["error"]["code"] for r in batch.json()] == [-8, -32601]
+
+
+def test_sequential_fallback_against_stub_reports_per_call_errors():
+    with _batch_node(support_batch=False) as node:
+        c = SimpleRpcClient(node.url, "u", "p")
+        res = c.batch([("boom", None), ("nope", None), ("getblockcount", None)])
+    assert c.batch_supported is False
+    assert res[0].error == {"code": -8, "message": "bad param"}
+    assert res[1].error["code"] == -32601
+    assert res[2].result == 7
@@ -24,3 +24,11 @@ def test_run_full_workflow_uses_provided_client_and_passes_telemetry():
     assert res.status == "OK"
     assert res.risk_score == 0.34
     assert res.details == ["y"]
+
+
+def test_wrapper_builds_default_client_lazily_and_warmup():
+    w = sentinel_wrapper.SentinelWrapper()
+    assert w._client is None
+    w.warmup()
+    assert w._client is not None
+    assert w.evaluate({}).status != "ERROR"
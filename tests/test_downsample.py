@@ -0,0 +1,101 @@
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from sentinel_ai_v2.downsample import downsample_block_progress, lttb, lttb_stream
+from sentinel_ai_v2.telemetry_monitor import BlockProgressReader, BlockProgressStatus, BlockProgressWriter
+
+
+def _reference_lttb(data, threshold):
+    # Textbook (non-streaming) LTTB.
+    n = len(data)
+    every = (n - 2) / (threshold - 2)
+    out = [data[0]]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        nstart, nend = end, min(int((i + 2) * every) + 1, n)
+        nxt = data[nstart:nend] if i < threshold - 3 else [data[-1]]
+        cx = sum(p[0] for p in nxt) / len(nxt)
+        cy = sum(p[1] for p in nxt) / len(nxt)
+        ax, ay = data[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - cx) * (data[j][1] - ay) - (ax - data[j][0]) * (cy - ay))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(data[best])
+        a = best
+    out.append(data[-1])
+    return out
+
+
+def test_lttb_matches_reference_implementation():
+    rng = random.Random(7)
+    data = [(float(i), rng.gauss(0, 1) + i * 0.01) for i in range(5003)]
+    for threshold in (3, 10, 257, 1000):
+        assert lttb(data, threshold) == _reference_lttb(data, threshold)
+
+
+def test_lttb_passthrough_and_validation():
+    data = [(0, 1), (1, 2), (2, 3)]
+    assert lttb(data, 10) == data
+    with pytest.raises(ValueError):
+        lttb(data, 2)
+    with pytest.raises(ValueError):
+        list(lttb_stream(iter(data), 100, 5))
+    with pytest.raises(ValueError):
+        list(lttb_stream(iter([]), 100, 5))
+
+
+def test_lttb_stream_consumes_a_generator_once():
+    consumed = []
+
+    def gen(n):
+        for i in range(n):
+            consumed.append(i)
+            yield (i, (i * 7919) % 1000)
+
+    out = list(lttb_stream(gen(200_000), 200_000, 500))
+    assert len(out) == 500
+    assert out[0] == (0, 0) and out[-1][0] == 199_999
+    assert len(consumed) == 200_000
+
+
+def test_keep_markers_survive_downsampling():
+    # flat series with a single flagged sample that LTTB alone would drop
+    data = [(i, 0.0, i == 1234) for i in range(10_000)]
+    plain = lttb(data, 20)
+    assert not any(p[2] for p in plain)
+    kept = lttb(data, 20, keep=lambda p: p[2])
+    assert (1234, 0.0, True) in kept
+    assert [p[0] for p in kept] == sorted(p[0] for p in kept)
+    assert len(kept) <= 3 * 20
+
+
+def test_downsample_block_progress_window(tmp_path: Path):
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    path = str(tmp_path / "bp.sbps")
+    with BlockProgressWriter(path, buffer_records=512) as store:
+        for i in range(5000):
+            store.append(BlockProgressStatus(
+                timestamp=t0 + timedelta(seconds=60 * i),
+                current_height=100 + i // 4,
+                previous_height=None,
+                status="stalled" if 3000 <= i < 3010 else "ok",
+                stalled_for_seconds=0,
+            ))
+
+    with BlockProgressReader(path) as history:
+        points = downsample_block_progress(history, 100)
+        assert 100 <= len(points) <= 300
+        assert points[0] == history.record(0) and points[-1] == history.record(-1)
+        assert any(p[4] for p in points)
+
+        window = downsample_block_progress(
+            history, 50, t0 + timedelta(minutes=1000), t0 + timedelta(minutes=1020)
+        )
+        assert [p[1] for p in window] == [100 + i // 4 for i in range(1000, 1020)]
+        assert history.span(t0 + timedelta(days=30), t0) == (5000, 5000)
@@ -0,0 +1,313 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sentinel_ai_v2.adaptive_core_bridge as acb
+from sentinel_ai_v2.adaptive_hooks import report_reorg_anomaly_to_adaptive
+from sentinel_ai_v2.event_spool import EventSpool
+
+
+def _segments(d: Path):
+    return sorted(p.name for p in d.iterdir() if p.suffix == ".seg")
+
+
+def test_append_replay_and_cursor_survive_reopen(tmp_path: Path):
+    with EventSpool(str(tmp_path), fsync_every=2) as spool:
+        for i in range(5):
+            spool.append(f"r{i}".encode())
+        assert spool.fsyncs >= 2
+        records, pos = spool.read_batch(2)
+        assert records == [b"r0", b"r1"]
+        spool.commit(pos)
+
+    with EventSpool(str(tmp_path)) as spool:
+        got = []
+        assert spool.replay(got.extend, batch_size=2) == 3
+        assert got == [b"r2", b"r3", b"r4"]
+        assert not spool.has_pending()
+        spool.append_many([b"r5"])
+        assert spool.read_batch()[0] == [b"r5"]
+
+
+def test_failed_handler_keeps_batch_pending(tmp_path: Path):
+    spool = EventSpool(str(tmp_path))
+    spool.append_many([b"a", b"b"])
+
+    def boom(_records):
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        spool.replay(boom)
+    assert spool.read_batch()[0] == [b"a", b"b"]
+    spool.close()
+
+
+def test_segments_rotate_and_disk_usage_is_bounded(tmp_path: Path):
+    payload = b"x" * 100  # 108-byte frames
+    spool = EventSpool(str(tmp_path), segment_bytes=300, max_bytes=700, fsync_every=1000)
+    for _ in range(20):
+        spool.append(payload)
+    spool.flush()
+
+    total = sum(os.path.getsize(tmp_path / n) for n in _segments(tmp_path))
+    assert total <= 700
+    assert spool.dropped_segments > 0
+    assert spool.stats()["segments"] == len(_segments(tmp_path))
+
+    got = []
+    replayed = spool.replay(got.extend, batch_size=3)
+    assert replayed == len(got) == 20 - spool.dropped_bytes // 108
+    # consumed segments are deleted, only the active one remains
+    assert len(_segments(tmp_path)) == 1
+    spool.close()
+
+
+def test_torn_tail_is_truncated_on_reopen(tmp_path: Path):
+    with EventSpool(str(tmp_path)) as spool:
+        spool.append_many([b"ok1", b"ok2"])
+    [seg] = _segments(tmp_path)
+    with open(tmp_path / seg, "ab") as f:
+        f.write(b"\x10\x00\x00\x00\xde\xad")  # header of a record that never finished
+
+    with EventSpool(str(tmp_path)) as spool:
+        assert spool.corrupt_records == 1
+        spool.append(b"ok3")
+        assert spool.read_batch()[0] == [b"ok1", b"ok2", b"ok3"]
+
+
+def test_corrupt_record_in_older_segment_skips_rest_of_segment(tmp_path: Path):
+    spool = EventSpool(str(tmp_path), segment_bytes=40, max_bytes=4000)
+    spool.append_many([b"a" * 10, b"b" * 10, b"c" * 10, b"d" * 10])
+    spool.flush()
+    first = tmp_path / _segments(tmp_path)[0]
+    data = bytearray(first.read_bytes())
+    data[-1] ^= 0xFF
+    first.write_bytes(bytes(data))
+
+    got = []
+    spool.replay(got.extend)
+    assert b"a" * 10 in got and b"b" * 10 not in got and b"d" * 10 in got
+    assert spool.corrupt_records == 1
+    spool.close()
+
+
+def test_tail_of_a_burst_is_fsynced_without_a_further_append(tmp_path: Path):
+    with EventSpool(str(tmp_path), fsync_every=100, fsync_interval=0.05) as spool:
+        spool.append_many([b"a", b"b"])
+        assert spool.fsyncs == 0
+        deadline = time.monotonic() + 5
+        while spool.fsyncs == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert spool.fsyncs == 1
+        assert spool._unsynced == 0
+        assert (tmp_path / f"{1:020d}.seg").stat().st_size > 0
+
+
+def test_concurrent_replays_never_deliver_a_batch_twice(tmp_path: Path):
+    spool = EventSpool(str(tmp_path))
+    spool.append_many([f"r{i}".encode() for i in range(40)])
+    delivered = []
+    lock = threading.Lock()
+    start = threading.Barrier(4)
+
+    def slow_handler(records):
+        time.sleep(0.005)  # overlap the replays
+        with lock:
+            delivered.extend(records)
+
+    def drain():
+        start.wait()
+        spool.replay(slow_handler, batch_size=3)
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(delivered) == sorted(f"r{i}".encode() for i in range(40))
+    assert spool.replayed == 40
+    assert not spool.has_pending()
+    spool.close()
+
+
+
+def test_segments_dropped_during_replay_do_not_strand_the_cursor(tmp_path: Path):
+    payload = b"x" * 100  # 108-byte frames, two per segment
+    spool = EventSpool(str(tmp_path), segment_bytes=300, max_bytes=700, fsync_every=1000)
+    spool.append_many([payload] * 3)
+
+    records, pos = spool.read_batch(max_records=2)
+    assert len(records) == 2 and pos[0] == 1
+
+    # While that batch is with the handler, a burst pushes segment 1 out.
+    spool.append_many([payload] * 10)
+    assert spool.dropped_segments > 0 and 1 not in spool._sizes
+    spool.commit(pos)
+    assert spool._cursor == (min(spool._sizes), 0)
+
+    got = []
+    assert spool.replay(got.extend) == len(got) > 0
+    assert not spool.has_pending()
+
+    # A stale cursor is also clamped when reading.
+    spool.append_many([payload] * 10)
+    spool._cursor = (1, 0)
+    assert spool.read_batch()[0]
+    spool.close()
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        EventSpool("unused", segment_bytes=100, max_bytes=10)
+
+
+# -----------------------------
+# SentinelAdaptiveCoreBridge + spool
+# -----------------------------
+
+class _FlakyInterface:
+    def __init__(self):
+        self.up = False
+        self.packets = []
+        self.feedback = []
+
+    def submit_threat_packet(self, packet):
+        if not self.up:
+            raise ConnectionError("adaptive core down")
+        self.packets.append(packet)
+
+    def submit_feedback_events(self, events):
+        if not self.up:
+            raise ConnectionError("adaptive core down")
+        self.feedback.append([(e.event_id, e.feedback) for e in events])
+
+
+class _Packet:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+def test_bridge_spools_during_outage_and_drains_on_recovery(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(acb, "AdaptiveCoreInterface", _FlakyInterface)
+    monkeypatch.setattr(acb, "ThreatPacket", _Packet)
+    now = [0.0]
+    iface = _FlakyInterface()
+    bridge = acb.SentinelAdaptiveCoreBridge(
+        interface=iface, spool=EventSpool(str(tmp_path)), retry_interval=10.0, clock=lambda: now[0]
+    )
+
+    report_reorg_anomaly_to_adaptive(100, 0.5, bridge=bridge)
+    bridge.submit_feedback_label(layer="sentinel", feedback="true_positive", event_id="e1")
+    report_reorg_anomaly_to_adaptive(101, 0.6, bridge=bridge)
+    assert bridge.spool.has_pending()
+    assert iface.packets == []
+
+    iface.up = True
+    now[0] = 5.0  # still inside retry_interval: keeps spooling, no delivery attempt
+    report_reorg_anomaly_to_adaptive(102, 0.7, bridge=bridge)
+    assert iface.packets == []
+
+    now[0] = 11.0
+    report_reorg_anomaly_to_adaptive(103, 0.8, bridge=bridge)
+    assert [p.kwargs["block_height"] for p in iface.packets] == [100, 101, 102, 103]
+    assert iface.feedback == [[("e1", "TRUE_POSITIVE")]]
+    assert not bridge.spool.has_pending()
+    assert bridge.drain_spool() == 0
+    bridge.spool.close()
+
+
+def test_bridge_without_adaptive_core_spools_everything(tmp_path: Path):
+    bridge = acb.SentinelAdaptiveCoreBridge(spool=EventSpool(str(tmp_path)))
+    assert bridge.is_available is False and bridge.accepts_events is True
+
+    report_reorg_anomaly_to_adaptive(7, 0.9, details={"window": "30s"}, bridge=bridge)
+    assert bridge.drain_spool() == 0  # nothing to deliver to yet
+    [record] = bridge.spool.read_batch()[0]
+    assert b'"block_height":7' in record and b'"kind":"threat"' in record
+    bridge.spool.close()
+
+
+class _ValidatingInterface(_FlakyInterface):
+    def submit_threat_packet(self, packet):
+        if not isinstance(packet.kwargs["severity"], int):
+            raise ValueError("severity must be an int")
+        super().submit_threat_packet(packet)
+
+
+def test_bridge_drops_poison_records_instead_of_blocking_the_spool(tmp_path: Path):
+    iface = _ValidatingInterface()
+    bridge = acb.SentinelAdaptiveCoreBridge(
+        interface=iface, packet_type=_Packet, spool=EventSpool(str(tmp_path)), retry_interval=0.0
+    )
+
+    def threat(severity, height):
+        return {
+            "source_layer": "sentinel", "threat_type": "reorg", "severity": severity,
+            "description": "d", "block_height": height,
+        }
+
+    # Outage: everything is spooled, including a record the core will refuse
+    # and a payload that is not even JSON.
+    bridge.submit_threats([threat(5, 1), threat("high", 2), threat(6, 3)])
+    bridge.spool.append(b"{not json")
+    bridge.spool.append(b'{"kind":"feedback"}')
+    assert iface.packets == []
+
+    iface.up = True
+    bridge.submit_simple_threat("sentinel", "reorg", 7, "d", block_height=4)
+    assert [p.kwargs["block_height"] for p in iface.packets] == [1, 3, 4]
+    assert bridge.rejected_records == 3
+    assert not bridge.spool.has_pending()
+
+    # A live poison record is rejected too, not spooled for retry.
+    bridge.submit_simple_threat("sentinel", "reorg", "high", "d", block_height=5)  # type: ignore[arg-type]
+    assert bridge.rejected_records == 4
+    assert not bridge.spool.has_pending()
+
+    # Transport errors still mean "outage": the batch stays spooled.
+    iface.up = False
+    bridge.submit_simple_threat("sentinel", "reorg", 8, "d", block_height=6)
+    assert bridge.spool.has_pending()
+    assert bridge.rejected_records == 4
+    bridge.spool.close()
+
+
+class _BatchValidatingInterface(_FlakyInterface):
+    def submit_threat_packets(self, packets):
+        if any(not isinstance(p.kwargs["severity"], int) for p in packets):
+            raise ValueError("severity must be an int")
+        self.packets.extend(packets)
+
+    def submit_feedback_events(self, events):
+        if any(e.feedback not in {"TRUE_POSITIVE", "FALSE_POSITIVE"} for e in events):
+            raise RuntimeError("unknown feedback label")
+        super().submit_feedback_events(events)
+
+
+def test_bridge_singles_out_poison_records_refused_by_batch_calls(tmp_path: Path):
+    iface = _BatchValidatingInterface()
+    iface.up = True
+    bridge = acb.SentinelAdaptiveCoreBridge(interface=iface, packet_type=_Packet, spool=EventSpool(str(tmp_path)))
+
+    bridge.submit_threats(
+        [
+            {"source_layer": "s", "threat_type": "t", "severity": s, "description": "d", "block_height": h}
+            for s, h in ((1, 1), ("bad", 2), (3, 3))
+        ]
+    )
+    bridge.submit_feedback_labels(
+        [
+            {"layer": "s", "feedback": "true_positive", "event_id": "a"},
+            {"layer": "s", "feedback": "maybe", "event_id": "b"},
+        ]
+    )
+
+    assert [p.kwargs["block_height"] for p in iface.packets] == [1, 3]
+    assert iface.feedback == [[("a", "TRUE_POSITIVE")]]
+    assert bridge.rejected_records == 2
+    assert not bridge.spool.has_pending()
+    bridge.spool.close()
@@ -0,0 +1,135 @@
+from sentinel_ai_v2.telemetry_monitor import FleetBlockProgressMonitor
+
+
+class FakeRpc:
+    def __init__(self, height):
+        self.height = height
+        self.fail = False
+
+    def get_block_count(self):
+        if self.fail:
+            raise ConnectionError("down")
+        return self.height
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _fleet(n=3, **kw):
+    rpcs = {f"n{i}": FakeRpc(100) for i in range(n)}
+    clock = FakeClock()
+    fleet = FleetBlockProgressMonitor(rpcs, stall_threshold_seconds=60, clock=clock, **kw)
+    return fleet, rpcs, clock
+
+
+def test_fleet_poll_reports_only_changed_nodes():
+    fleet, rpcs, clock = _fleet()
+    first = fleet.poll()
+    assert sorted(first.changed) == ["n0", "n1", "n2"]
+    assert fleet.max_height() == 100
+
+    clock.t += 10
+    rpcs["n1"].height = 101
+    second = fleet.poll()
+    assert second.changed == ["n1"]
+    assert fleet.max_height() == 101
+    assert fleet.height_of("n1") == 101
+    fleet.close()
+
+
+def test_fleet_lagging_and_stalled_views():
+    fleet, rpcs, clock = _fleet(lag_threshold_blocks=2)
+    fleet.poll()
+
+    clock.t += 30
+    rpcs["n0"].height = 105
+    rpcs["n1"].height = 103
+    fleet.poll()
+    assert fleet.lagging_nodes() == ["n2"]
+    assert fleet.stalled_nodes() == set()
+
+    # n2 has not moved for 60s -> stalled; n0/n1 moved 30s ago
+    clock.t += 30
+    res = fleet.poll()
+    assert res.newly_stalled == ["n2"]
+    assert fleet.stalled_nodes() == {"n2"}
+
+    # Reported once, not on every poll
+    clock.t += 1
+    assert fleet.poll().newly_stalled == []
+
+    # Progress clears the stall
+    rpcs["n2"].height = 105
+    fleet.poll()
+    assert fleet.stalled_nodes() == set()
+    fleet.close()
+
+
+def test_fleet_errors_and_max_recompute_on_reorg():
+    fleet, rpcs, clock = _fleet()
+    assert fleet.max_height() is None
+    assert fleet.lagging_nodes() == []
+
+    rpcs["n0"].fail = True
+    res = fleet.poll()
+    assert "n0" in res.errors
+    assert "n0" in fleet.errored_nodes()
+    assert fleet.height_of("n0") is None
+
+    rpcs["n0"].fail = False
+    fleet.poll()
+    assert fleet.errored_nodes() == {}
+
+    # max holder goes backwards -> recompute
+    fleet.update({"n1": 110})
+    assert fleet.max_height() == 110
+    fleet.update({"n1": 99, "n2": None})
+    assert fleet.max_height() == 100
+    assert fleet.errored_nodes() == {"n2": "no data"}
+    fleet.close()
+
+
+def test_fleet_update_accepts_async_poll_block_counts_output():
+    import asyncio
+
+    from sentinel_ai_v2.async_rpc_client import AsyncRpcClient, poll_block_counts
+    from sentinel_ai_v2.testing.rpc_stub import AsyncStubRpcNode
+
+    async def main():
+        async with AsyncStubRpcNode(height=100) as a, AsyncStubRpcNode(height=97) as b:
+            clients = {
+                "a": AsyncRpcClient(a.url, "u", "p"),
+                "b": AsyncRpcClient(b.url, "u", "p"),
+                "down": AsyncRpcClient("http://127.0.0.1:9", "u", "p", timeout=1.0),
+            }
+            clock = FakeClock()
+            fleet = FleetBlockProgressMonitor(clients, stall_threshold_seconds=60, clock=clock)
+            try:
+                first = fleet.update(await poll_block_counts(clients, deadline_seconds=5))
+                a.height = 101
+                clock.t += 10
+                second = fleet.update(await poll_block_counts(clients, deadline_seconds=5))
+            finally:
+                for c in clients.values():
+                    await c.close()
+            return fleet, first, second
+
+    loop = asyncio.new_event_loop()
+    try:
+        fleet, first, second = loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert sorted(first.changed) == ["a", "b"]
+    assert list(first.errors) == ["down"]
+    assert second.changed == ["a"]
+    assert fleet.max_height() == 101
+    assert fleet.height_of("b") == 97
+    assert fleet.lagging_nodes() == ["b"]
+    assert set(fleet.errored_nodes()) == {"down"}
+    assert fleet.height_of("down") is None
@@ -0,0 +1,142 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sentinel_ai_v2 import heartbeat as hb
+from sentinel_ai_v2.heartbeat import HeartbeatCache, format_heartbeat, heartbeat_data, shield_heartbeat
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Interface:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+
+    def get_immune_report_text(self, min_severity=0):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("core down")
+        return f"REPORT:{min_severity}:{self.calls}"
+
+    def get_adaptive_state(self):
+        return SimpleNamespace(global_threshold=0.25, layer_weights={"sentinel": 1.0})
+
+    def get_last_update_metadata(self):
+        return {"last_threat_received": "t1", "last_learning_update": "t2"}
+
+
+class _Bridge:
+    is_available = True
+
+    def __init__(self, interface):
+        self._interface = interface
+
+    def get_immune_report_text(self, min_severity=0):
+        return self._interface.get_immune_report_text(min_severity=min_severity)
+
+
+def test_structured_form_matches_text():
+    bridge = _Bridge(_Interface())
+    data = heartbeat_data(min_severity=2, bridge=bridge)
+    assert data["adaptive_state"] == {"global_threshold": 0.25, "layer_weights": {"sentinel": 1.0}}
+    assert data["last_updates"]["last_learning_update"] == "t2"
+    text = format_heartbeat(data)
+    assert "REPORT:2:1" in text and "Global Threshold: 0.250" in text and "- sentinel: 1.000" in text
+
+    unavailable = SimpleNamespace(is_available=False)
+    assert heartbeat_data(bridge=unavailable)["available"] is False
+    assert "not available" in shield_heartbeat(bridge=unavailable)
+
+
+def test_fresh_entries_are_served_from_cache_per_severity():
+    iface = _Interface()
+    clock = _Clock()
+    cache = HeartbeatCache(ttl=5.0, bridge=_Bridge(iface), clock=clock)
+
+    first = cache.get()
+    clock.now += 4.9
+    assert cache.get() is first
+    assert cache.get(min_severity=3).data["immune_report"] == "REPORT:3:2"
+    assert iface.calls == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_stale_while_revalidate_refreshes_in_background():
+    iface = _Interface()
+    clock = _Clock()
+    cache = HeartbeatCache(ttl=5.0, stale_ttl=30.0, bridge=_Bridge(iface), clock=clock)
+    cache.get()
+
+    clock.now += 10.0
+    stale = cache.get()
+    assert stale.stale and stale.data["immune_report"] == "REPORT:0:1"
+    deadline = time.monotonic() + 2.0
+    while cache.stats()["refreshes"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    fresh = cache.get()
+    assert not fresh.stale and fresh.data["immune_report"] == "REPORT:0:2"
+
+
+def test_failed_background_refresh_keeps_stale_report_until_expiry():
+    iface = _Interface()
+    clock = _Clock()
+    cache = HeartbeatCache(ttl=1.0, stale_ttl=10.0, bridge=_Bridge(iface), clock=clock)
+    cache.get()
+    iface.fail = True
+
+    clock.now += 2.0
+    assert cache.get().stale
+    deadline = time.monotonic() + 2.0
+    while cache.stats()["refresh_errors"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert cache.get().data["immune_report"] == "REPORT:0:1"
+
+    clock.now += 20.0  # beyond ttl + stale_ttl: synchronous refresh surfaces the error
+    deadline = time.monotonic() + 2.0
+    while cache.stats()["refreshes"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    with pytest.raises(RuntimeError):
+        cache.get()
+
+
+def test_concurrent_misses_share_one_refresh():
+    iface = _Interface(delay=0.05)
+    cache = HeartbeatCache(ttl=60.0, bridge=_Bridge(iface))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert iface.calls == 1
+    assert len({id(r) for r in results}) == 1
+
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+    cache.get()
+    assert iface.calls == 2
+
+
+def test_invalid_ttl():
+    with pytest.raises(ValueError):
+        HeartbeatCache(ttl=0)
+
+
+def test_cached_shield_heartbeat_uses_process_cache(monkeypatch):
+    monkeypatch.setattr(hb, "_default_cache", HeartbeatCache(bridge=_Bridge(_Interface())))
+    a = hb.cached_shield_heartbeat()
+    assert hb.cached_shield_heartbeat() is a
+    monkeypatch.setattr(hb, "_default_cache", None)
+    assert hb.cached_shield_heartbeat().data["available"] is False
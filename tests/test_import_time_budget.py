@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous ceiling for CI runners; locally `sentinel_ai_v2.cli` imports in ~10ms.
+CLI_IMPORT_BUDGET_US = 150_000
+
+HEAVY_MODULES = ("fastapi", "pydantic", "requests")
+
+
+def _importtime(module: str) -> dict:
+    """
+    Run `python -X importtime -c "import <module>"` in a fresh interpreter
+    and return {module_name: cumulative_us}.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    out: dict = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        out[name.strip()] = int(cumulative)
+    return out
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["sentinel_ai_v2.cli", "sentinel_ai_v2.api", "sentinel_ai_v2.wrapper.sentinel_wrapper"],
+)
+def test_core_modules_do_not_import_heavy_dependencies(module):
+    loaded = _importtime(module)
+    assert module in loaded
+    for heavy in HEAVY_MODULES:
+        assert heavy not in loaded, f"{module} pulled in {heavy}"
+
+
+def test_cli_import_within_budget():
+    loaded = _importtime("sentinel_ai_v2.cli")
+    assert loaded["sentinel_ai_v2.cli"] < CLI_IMPORT_BUDGET_US
+    assert "sentinel_ai_v2.v3" not in loaded
@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from sentinel_ai_v2.api import SentinelResult
+from sentinel_ai_v2.engine.snapshot_dedup import SnapshotDeduplicator
+from sentinel_ai_v2.engine.watcher_loop import watch_stream, watch_stream_async
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Client:
+    def __init__(self):
+        self.calls = []
+        self.batches = []
+
+    def evaluate_snapshot(self, snapshot):
+        self.calls.append(snapshot)
+        return SentinelResult("NORMAL", snapshot.get("h", 0) / 100, [str(snapshot.get("h"))])
+
+    def evaluate_snapshots(self, snapshots):
+        self.batches.append(len(snapshots))
+        return [self.evaluate_snapshot(s) for s in snapshots]
+
+
+def _quiet_chain():
+    # node a stays at height 1 for three polls, node b moves; "ts" always changes
+    return [
+        {"node": "a", "h": 1, "ts": 1},
+        {"node": "b", "h": 5, "ts": 1},
+        {"node": "a", "h": 1, "ts": 2},
+        {"node": "b", "h": 6, "ts": 2},
+        {"node": "a", "h": 1, "ts": 3},
+        {"node": "a", "h": 2, "ts": 4},
+    ]
+
+
+def _dedup(**kwargs):
+    return SnapshotDeduplicator(key=lambda s: s["node"], ignore_keys=("ts",), **kwargs)
+
+
+def test_fingerprint_is_canonical_and_ignores_keys():
+    d = _dedup()
+    assert d.fingerprint({"node": "a", "h": 1, "ts": 1}) == d.fingerprint({"ts": 9, "h": 1, "node": "a"})
+    assert d.fingerprint({"node": "a", "h": 1}) != d.fingerprint({"node": "a", "h": 2})
+    assert len(d.fingerprint({"x": 1})) == 16
+    assert d.fingerprint({"x": object()}) is None
+
+
+def test_reemit_mode_skips_evaluation_and_repeats_previous_result():
+    client, seen, dedup = _Client(), [], _dedup()
+    watch_stream(_quiet_chain(), client, seen.append, dedup=dedup)
+    assert [s["h"] for s in client.calls] == [1, 5, 6, 2]
+    assert [r.details[0] for r in seen] == ["1", "5", "1", "6", "1", "2"]
+    stats = dedup.stats()
+    assert stats["snapshots"] == 6 and stats["evaluated"] == 4
+    assert stats["skipped"] == stats["reemitted"] == 2
+    assert stats["skip_ratio"] == pytest.approx(1 / 3)
+    assert stats["saved_seconds"] >= 0.0 and stats["sources"] == 2
+
+
+def test_suppress_mode_drops_unchanged_snapshots_in_pipelined_mode():
+    client, seen, dedup = _Client(), [], _dedup(mode="suppress")
+    watch_stream(_quiet_chain(), client, seen.append, dedup=dedup, workers=1)
+    assert [r.details[0] for r in seen] == ["1", "5", "6", "2"]
+    assert dedup.stats()["suppressed"] == 2
+
+
+def test_batch_path_compares_within_and_across_batches():
+    client, groups, dedup = _Client(), [], _dedup()
+    watch_stream(_quiet_chain() * 2, client, batch_handler=groups.append, batch_size=4,
+                 batch_timeout_ms=1000, dedup=dedup)
+    results = [r.details[0] for g in groups for r in g]
+    assert results == ["1", "5", "1", "6", "1", "2", "1", "5", "1", "6", "1", "2"]
+    # groups: [a1 b5 a1 b6] [a1 a2 a1 b5] [a1 b6 a1 a2]; a repeat is only
+    # skipped when it matches the source's previous snapshot
+    assert client.batches == [3, 3, 2]
+    assert dedup.stats()["evaluated"] == 8
+
+    suppress = _dedup(mode="suppress")
+    groups.clear()
+    watch_stream(_quiet_chain(), _Client(), batch_handler=groups.append, batch_size=3, dedup=suppress)
+    assert [r.details[0] for g in groups for r in g] == ["1", "5", "6", "2"]
+
+
+def test_max_age_invalidate_lru_and_unhashable():
+    clock = _Clock()
+    d = SnapshotDeduplicator(max_age_seconds=10.0, max_sources=1, key=lambda s: s.get("node"), clock=clock)
+    client = _Client()
+    d.evaluate({"node": "a", "h": 1}, client.evaluate_snapshot)
+    d.evaluate({"node": "a", "h": 1}, client.evaluate_snapshot)
+    clock.now = 10.0
+    d.evaluate({"node": "a", "h": 1}, client.evaluate_snapshot)  # too old: re-evaluated
+    assert len(client.calls) == 2
+
+    d.evaluate({"node": "b", "h": 1}, client.evaluate_snapshot)  # evicts a
+    assert len(d) == 1
+    d.evaluate({"node": "a", "h": 1}, client.evaluate_snapshot)
+    d.invalidate()
+    d.evaluate({"node": "a", "h": 1}, client.evaluate_snapshot)
+    assert len(client.calls) == 5
+
+    d.evaluate({"node": "a", "x": {1, 2}}, lambda s: SentinelResult("NORMAL", 0.0, []))
+    d.evaluate({"node": "a", "x": {1, 2}}, lambda s: SentinelResult("NORMAL", 0.0, []))
+    assert d.stats()["unhashable"] == 2 and d.stats()["evaluated"] == 7
+
+
+def test_async_stream_with_dedup():
+    client, seen, dedup = _Client(), [], _dedup(mode="suppress")
+
+    async def source():
+        for s in _quiet_chain():
+            yield s
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(watch_stream_async(source(), client, seen.append, max_in_flight=1, dedup=dedup))
+    finally:
+        loop.close()
+    assert [r.details[0] for r in seen] == ["1", "5", "6", "2"]
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        SnapshotDeduplicator(mode="drop")
+    with pytest.raises(ValueError):
+        SnapshotDeduplicator(max_sources=0)
+
+
+def test_model_change_invalidates_cached_results():
+    model = ["m1"]
+    client = _Client()
+    dedup = SnapshotDeduplicator(model_identity=lambda: model[0])
+    snap = {"h": 1}
+
+    dedup.evaluate(snap, client.evaluate_snapshot)
+    dedup.evaluate(snap, client.evaluate_snapshot)
+    assert len(client.calls) == 1
+
+    model[0] = "m2"  # e.g. hot reload
+    dedup.evaluate(snap, client.evaluate_snapshot)
+    dedup.evaluate_batch([snap, snap], client.evaluate_snapshots)
+    assert len(client.calls) == 2
+
+    model[0] = "m3"
+    dedup.evaluate_batch([snap, snap], client.evaluate_snapshots)
+    assert len(client.calls) == 3
+    assert dedup.stats()["skipped"] == 4
+
+
+def test_watch_stream_re_evaluates_after_model_hot_reload(tmp_path):
+    import os
+
+    from sentinel_ai_v2.api import SentinelClient
+    from sentinel_ai_v2.config import SentinelConfig
+
+    path = tmp_path / "m.bin"
+    path.write_bytes(b"v1")
+    client = SentinelClient(SentinelConfig(model_path=str(path)))
+    evaluated = []
+    real_evaluate = client.evaluate_snapshot
+
+    def counting_evaluate(snapshot):
+        evaluated.append(client.model_identity())
+        return real_evaluate(snapshot)
+
+    client.evaluate_snapshot = counting_evaluate
+
+    def source():
+        yield {"h": 1}
+        yield {"h": 1}
+        path.write_bytes(b"v2-reloaded")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert client.model_manager.poll() is True
+        yield {"h": 1}
+        yield {"h": 1}
+
+    seen = []
+    dedup = SnapshotDeduplicator()
+    watch_stream(source(), client=client, handler=seen.append, dedup=dedup)
+
+    assert len(seen) == 4
+    assert len(evaluated) == 2
+    assert evaluated[0] != evaluated[1]
+    assert dedup.stats()["skipped"] == 2
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sentinel_ai_v2.api import SentinelResult
+from sentinel_ai_v2.engine.watcher_loop import watch_stream_async
+
+
+def _run(coro):
+    # Private loop: asyncio.run() would reset the main-thread loop that
+    # other tests fetch via get_event_loop().
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _Client:
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def evaluate_snapshot(self, snapshot):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            i = snapshot["i"]
+            if i == self.fail_on:
+                raise RuntimeError("bad snapshot")
+            delay = self.delay(i) if callable(self.delay) else self.delay
+            time.sleep(delay)
+            return SentinelResult("NORMAL", 0.0, [str(i)])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+async def _snapshots(n, delay=0.0, stopped=None):
+    try:
+        for i in range(n):
+            if delay:
+                await asyncio.sleep(delay)
+            yield {"i": i}
+    finally:
+        if stopped is not None:
+            stopped.append(True)
+
+
+def test_async_handler_sees_results_in_order_with_bounded_concurrency():
+    client = _Client(delay=lambda i: 0.02 if i % 4 == 0 else 0.001)
+    seen = []
+
+    async def handler(result):
+        await asyncio.sleep(0)
+        seen.append(int(result.details[0]))
+
+    async def main():
+        with ThreadPoolExecutor(8) as pool:
+            return await watch_stream_async(_snapshots(30), client, handler, max_in_flight=3, executor=pool)
+
+    stats = _run(main())
+    assert seen == list(range(30))
+    assert client.max_active <= 3
+    assert stats.mode == "async" and stats.handle.items == 30 and stats.source.items == 30
+
+
+
+def test_warmup_runs_in_the_executor_and_keeps_the_loop_responsive():
+    class _SlowWarmupClient(_Client):
+        def warmup(self):
+            self.warmup_thread = threading.current_thread()
+            time.sleep(0.2)
+
+    client = _SlowWarmupClient()
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tick_task = asyncio.ensure_future(ticker())
+        try:
+            await watch_stream_async(_snapshots(2), client, lambda r: None)
+        finally:
+            tick_task.cancel()
+
+    _run(main())
+    assert client.warmup_thread is not threading.main_thread()
+    assert len(ticks) >= 5  # the loop kept ticking during the 0.2 s warmup
+
+
+def test_unordered_mode_and_sync_handler():
+    client = _Client(delay=lambda i: 0.01 if i % 2 == 0 else 0.0)
+    seen = []
+    _run(watch_stream_async(_snapshots(20), client, lambda r: seen.append(int(r.details[0])),
+                            max_in_flight=4, preserve_order=False))
+    assert sorted(seen) == list(range(20))
+
+
+def test_stop_event_drains_in_flight_and_closes_source():
+    client = _Client(delay=0.01)
+    seen = []
+    stopped = []
+
+    async def main():
+        stop = asyncio.Event()
+
+        async def handler(result):
+            seen.append(int(result.details[0]))
+            if len(seen) == 5:
+                stop.set()
+
+        stats = await watch_stream_async(
+            _snapshots(1000, delay=0.001, stopped=stopped), client, handler, max_in_flight=4, stop=stop
+        )
+        return stats
+
+    stats = _run(main())
+    assert stopped == [True]
+    assert 5 <= len(seen) <= 5 + 4
+    assert seen == list(range(len(seen)))
+    assert stats.handle.items == stats.source.items == len(seen)
+
+
+def test_cancellation_drains_then_propagates():
+    client = _Client(delay=0.02)
+    seen = []
+
+    async def main():
+        task = asyncio.ensure_future(
+            watch_stream_async(_snapshots(10_000, delay=0.001), client,
+                               lambda r: seen.append(r), max_in_flight=4)
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        handled_at_cancel = len(seen)
+        await asyncio.sleep(0.1)
+        return handled_at_cancel
+
+    handled_at_cancel = _run(main())
+    assert handled_at_cancel == len(seen) > 0
+    assert client.active == 0
+
+
+@pytest.mark.parametrize("where", ["source", "evaluate", "handler"])
+def test_errors_propagate(where):
+    seen = []
+
+    async def source():
+        for i in range(50):
+            if where == "source" and i == 6:
+                raise ValueError("collector broke")
+            yield {"i": i}
+
+    async def handler(result):
+        if where == "handler" and result.details == ["6"]:
+            raise KeyError("handler broke")
+        seen.append(result)
+
+    client = _Client(fail_on=6 if where == "evaluate" else None)
+    with pytest.raises((ValueError, RuntimeError, KeyError)):
+        _run(watch_stream_async(source(), client, handler, max_in_flight=2))
+    if where == "source":
+        assert len(seen) == 6
+
+
+def test_invalid_in_flight_limit():
+    with pytest.raises(ValueError):
+        _run(watch_stream_async(_snapshots(1), _Client(), print, max_in_flight=0))
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+from sentinel_ai_v2.api import SentinelClient, SentinelResult
+from sentinel_ai_v2.config import SentinelConfig
+from sentinel_ai_v2.engine.watcher_loop import watch_stream
+
+
+class _BatchClient:
+    def __init__(self):
+        self.batches = []
+
+    def evaluate_snapshot(self, snapshot):  # pragma: no cover - batched path expected
+        raise AssertionError("per-snapshot path used")
+
+    def evaluate_snapshots(self, snapshots):
+        self.batches.append(len(snapshots))
+        return [SentinelResult("NORMAL", s["i"] / 100, [str(s["i"])]) for s in snapshots]
+
+
+class _SingleClient:
+    def evaluate_snapshot(self, snapshot):
+        return SentinelResult("NORMAL", 0.0, [str(snapshot["i"])])
+
+
+def _bursty(bursts, size, gap):
+    i = 0
+    for _ in range(bursts):
+        for _ in range(size):
+            yield {"i": i}
+            i += 1
+        time.sleep(gap)
+
+
+def test_groups_close_on_size_or_timeout():
+    client = _BatchClient()
+    seen = []
+    stats = watch_stream(
+        _bursty(3, 5, 0.1), client=client, handler=lambda r: seen.append(int(r.details[0])),
+        batch_size=4, batch_timeout_ms=20,
+    )
+    assert seen == list(range(15))
+    # each burst of 5 -> a full group of 4 plus a timed-out group of 1
+    assert client.batches == [4, 1, 4, 1, 4, 1]
+    assert stats.batches == 6 and stats.batched_snapshots == 15
+    assert stats.mean_batch_size == 2.5
+    assert stats.evaluate.items == 6
+
+
+def test_batch_handler_receives_lists_in_pipelined_mode():
+    client = _BatchClient()
+    groups = []
+    stats = watch_stream(
+        ({"i": i} for i in range(100)), client=client, batch_handler=groups.append,
+        batch_size=10, batch_timeout_ms=1000, workers=3,
+    )
+    assert [len(g) for g in groups] == [10] * 10
+    assert [r.details[0] for g in groups for r in g] == [str(i) for i in range(100)]
+    assert stats.mode == "pipelined" and stats.batches == 10
+
+
+def test_clients_without_batch_api_fall_back():
+    seen = []
+    watch_stream(({"i": i} for i in range(7)), client=_SingleClient(),
+                 handler=lambda r: seen.append(r.details[0]), batch_size=3)
+    assert seen == [str(i) for i in range(7)]
+
+
+def test_source_error_is_raised_after_earlier_snapshots():
+    def source():
+        yield {"i": 0}
+        yield {"i": 1}
+        raise OSError("collector lost")
+
+    seen = []
+    with pytest.raises(OSError):
+        watch_stream(source(), client=_BatchClient(), handler=lambda r: seen.append(r), batch_size=8)
+    assert len(seen) == 2
+
+
+def test_invalid_batch_arguments():
+    with pytest.raises(ValueError):
+        watch_stream([], client=_BatchClient(), batch_handler=print)
+
+
+def test_sentinel_client_evaluate_snapshots_matches_single_calls():
+    client = SentinelClient(SentinelConfig())
+    snaps = [
+        {"block_height": 10, "mempool_size": 1, "entropy": {"score": 0.1}},
+        {"block_height": 11, "mempool": {"score": 0.95, "anomaly": 1.0}},
+        {"block_height": float("nan")},
+    ]
+    assert client.evaluate_snapshots(snaps) == [client.evaluate_snapshot(s) for s in snaps]
+    assert client.evaluate_snapshots([]) == []
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from sentinel_ai_v2.api import SentinelResult
+from sentinel_ai_v2.engine.watcher_loop import watch_stream
+
+
+class _Client:
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.warmed = 0
+
+    def warmup(self):
+        self.warmed += 1
+
+    def evaluate_snapshot(self, snapshot):
+        i = snapshot["i"]
+        if i == self.fail_on:
+            raise RuntimeError("bad snapshot")
+        delay = self.delay(i) if callable(self.delay) else self.delay
+        if delay:
+            time.sleep(delay)
+        return SentinelResult(status="NORMAL", risk_score=i / 100, details=[str(i)])
+
+
+def _snapshots(n, delay=0.0):
+    for i in range(n):
+        if delay:
+            time.sleep(delay)
+        yield {"i": i}
+
+
+def test_sequential_mode_is_default_and_reports_stats():
+    seen = []
+    stats = watch_stream(_snapshots(5), client=_Client(), handler=lambda r: seen.append(r.details[0]))
+    assert seen == ["0", "1", "2", "3", "4"]
+    assert stats.mode == "sequential"
+    assert stats.source.items == stats.evaluate.items == stats.handle.items == 5
+    assert set(stats.as_dict()) >= {"wall_seconds", "source", "evaluate", "handle"}
+
+
+def test_pipeline_preserves_order_with_uneven_evaluation():
+    client = _Client(delay=lambda i: 0.02 if i % 5 == 0 else 0.0)
+    seen = []
+    stats = watch_stream(
+        _snapshots(40), client=client, handler=lambda r: seen.append(int(r.details[0])), workers=4, queue_size=4
+    )
+    assert seen == list(range(40))
+    assert client.warmed == 1
+    assert stats.mode == "pipelined" and stats.evaluate.workers == 4
+    assert stats.evaluate.items == stats.handle.items == 40
+    assert stats.max_reorder_buffer >= 1
+    assert 0.0 < stats.evaluate.utilization <= 1.0
+
+
+def test_pipeline_unordered_delivers_everything():
+    client = _Client(delay=lambda i: 0.01 if i % 3 == 0 else 0.0)
+    seen = []
+    stats = watch_stream(
+        _snapshots(30), client=client, handler=lambda r: seen.append(int(r.details[0])),
+        workers=3, preserve_order=False,
+    )
+    assert sorted(seen) == list(range(30))
+    assert stats.max_reorder_buffer == 0
+
+
+def test_slow_handler_backpressures_the_source():
+    produced = []
+    handled = []
+    lock = threading.Lock()
+    max_in_flight = [0]
+
+    def source():
+        for i in range(40):
+            with lock:
+                produced.append(i)
+                max_in_flight[0] = max(max_in_flight[0], len(produced) - len(handled))
+            yield {"i": i}
+
+    def handler(result):
+        time.sleep(0.005)
+        with lock:
+            handled.append(result)
+
+    stats = watch_stream(source(), client=_Client(), handler=handler, workers=2, queue_size=2)
+    assert len(handled) == 40
+    # window = 2 * queue_size + workers, plus the snapshot the source holds
+    assert max_in_flight[0] <= 2 * 2 + 2 + 1
+    assert stats.source.blocked_seconds > 0
+    assert stats.handle.utilization > stats.evaluate.utilization
+
+
+def test_stages_overlap():
+    # Record when each stage is busy and check that stages ran at the same
+    # time, rather than timing the whole run (which flakes on loaded CI).
+    busy = {"source": [], "evaluate": [], "handle": []}
+    lock = threading.Lock()
+
+    def timed(stage, fn):
+        t0 = time.perf_counter()
+        out = fn()
+        with lock:
+            busy[stage].append((t0, time.perf_counter()))
+        return out
+
+    class _TimedClient(_Client):
+        def evaluate_snapshot(self, snapshot):
+            return timed("evaluate", lambda: super(_TimedClient, self).evaluate_snapshot(snapshot))
+
+    def source():
+        for i in range(20):
+            yield timed("source", lambda: (time.sleep(0.01), {"i": i})[1])
+
+    watch_stream(
+        source(), client=_TimedClient(delay=0.01),
+        handler=lambda r: timed("handle", lambda: time.sleep(0.01)), workers=1,
+    )
+
+    def overlaps(a, b):
+        return any(s1 < e2 and s2 < e1 for s1, e1 in busy[a] for s2, e2 in busy[b])
+
+    assert overlaps("source", "evaluate")
+    assert overlaps("evaluate", "handle")
+    assert overlaps("source", "handle")
+
+
+@pytest.mark.parametrize("where", ["source", "evaluate", "handler"])
+def test_errors_stop_the_pipeline_and_propagate(where):
+    def source():
+        for i in range(100):
+            if where == "source" and i == 7:
+                raise ValueError("source broke")
+            yield {"i": i}
+
+    def handler(result):
+        if where == "handler" and result.details == ["7"]:
+            raise KeyError("handler broke")
+
+    client = _Client(fail_on=7 if where == "evaluate" else None)
+    before = threading.active_count()
+    with pytest.raises((ValueError, RuntimeError, KeyError)):
+        watch_stream(source(), client=client, handler=handler, workers=2, queue_size=2)
+    assert threading.active_count() == before
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        watch_stream([], client=_Client(), handler=print, workers=-1)